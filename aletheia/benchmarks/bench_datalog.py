@@ -0,0 +1,84 @@
+"""Compare bulk Datalog materialization with incremental Rete propagation.
+
+The synthetic graph links every entity to a kind, every kind to a category and
+every category to a domain; the transitive rule then derives two more facts
+per entity. Run with ``python -m aletheia.benchmarks.bench_datalog --facts 10000000``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from aletheia.core.datalog import materialize, pack
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.rules import parse_rule
+from aletheia.core.symbol_table import InternTable
+
+RULE = "if X is Y and Y is Z then X is Z"
+KINDS = 1000
+CATEGORIES = 50
+DOMAINS = 5
+
+
+def graph(entities: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return subject and object id columns of the synthetic graph."""
+    first_kind = entities
+    first_category = first_kind + KINDS
+    first_domain = first_category + CATEGORIES
+    subjects = np.concatenate([
+        np.arange(entities),
+        np.arange(first_kind, first_category),
+        np.arange(first_category, first_domain),
+    ])
+    objects = np.concatenate([
+        first_kind + np.arange(entities) % KINDS,
+        first_category + np.arange(KINDS) % CATEGORIES,
+        first_domain + np.arange(CATEGORIES) % DOMAINS,
+    ])
+    return subjects, objects
+
+
+def bulk(entities: int) -> tuple[int, float, int]:
+    """Materialize the graph's closure; return derived facts, seconds and rounds."""
+    subjects, objects = graph(entities)
+    keys = pack(subjects, objects)
+    del subjects, objects
+    table = InternTable()
+    started = time.perf_counter()
+    derived, rounds = materialize(keys, [parse_rule(RULE)], table.id_of, table.intern)
+    return len(derived), time.perf_counter() - started, rounds
+
+
+def incremental(entities: int) -> tuple[int, float]:
+    """Propagate the same graph through the Rete network; return derived facts and seconds."""
+    subjects, objects = graph(entities)
+    facts = [(f"n{subject}", f"n{obj}") for subject, obj in zip(subjects.tolist(), objects.tolist())]
+    engine = TruthInferenceEngine()
+    engine.add_rule(RULE)
+    started = time.perf_counter()
+    engine.add_facts(facts)
+    return engine.stats()["rules"]["derived"], time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--facts", type=int, default=10_000_000)
+    parser.add_argument("--sample", type=int, default=100_000, help="facts run through the Rete network")
+    args = parser.parse_args()
+
+    entities = args.facts - KINDS - CATEGORIES
+    derived, seconds, rounds = bulk(entities)
+    bulk_rate = derived / seconds
+    print(f"{'datalog':>8} {args.facts:>12,} facts {derived:>12,} derived "
+          f"{seconds:>8.2f}s {bulk_rate:>14,.0f} facts/s ({rounds} rounds)")
+
+    derived, seconds = incremental(args.sample - KINDS - CATEGORIES)
+    rete_rate = derived / seconds
+    print(f"{'rete':>8} {args.sample:>12,} facts {derived:>12,} derived "
+          f"{seconds:>8.2f}s {rete_rate:>14,.0f} facts/s ({bulk_rate / rete_rate:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
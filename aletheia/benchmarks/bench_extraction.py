@@ -0,0 +1,63 @@
+"""Measure streaming fact extraction from a synthetic plain-text corpus.
+
+Run with ``python -m aletheia.benchmarks.bench_extraction --megabytes 2000``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import resource
+import tempfile
+from pathlib import Path
+
+from aletheia.core.inference import TruthInferenceEngine
+
+FILLER = [
+    "Nobody knows why.",
+    "Is the answer obvious?",
+    "The committee met twice and adjourned without a vote.",
+    "What a day it was!",
+]
+
+
+def write_corpus(path: Path, megabytes: int, seed: int = 7) -> None:
+    """Write about ``megabytes`` of prose where half the sentences state facts."""
+    rng = random.Random(seed)
+    limit = megabytes << 20
+    written = 0
+    with path.open("w", encoding="utf-8") as handle:
+        while written < limit:
+            lines = []
+            for _ in range(1000):
+                if rng.random() < 0.5:
+                    lines.append(f"Entity {rng.randrange(10_000_000)} is kind {rng.randrange(1000)}.")
+                else:
+                    lines.append(rng.choice(FILLER))
+            text = " ".join(lines) + "\n\n"
+            handle.write(text)
+            written += len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = Path(directory) / "corpus.txt"
+        write_corpus(corpus, args.megabytes)
+        for workers in args.workers:
+            stats = TruthInferenceEngine().load_documents(corpus, workers=workers)
+            label = "in-process" if not workers else f"{workers} workers"
+            print(
+                f"{label:>12} {stats.sentences_per_second:>12,.0f} sentences/s "
+                f"{stats.facts_per_second:>12,.0f} facts/s  {stats.seconds:.1f}s"
+            )
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss >> 10
+    print(f"peak RSS {peak} MB (includes the fact store)")
+
+
+if __name__ == "__main__":
+    main()
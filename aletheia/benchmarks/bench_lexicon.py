@@ -0,0 +1,52 @@
+"""Measure phrase scanning throughput against the size of the lexicon.
+
+Lexicons are random two- to four-word phrases over a small vocabulary, and
+the text is random words from a vocabulary ten times larger. Run
+with ``python -m aletheia.benchmarks.bench_lexicon --megabytes 20``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from aletheia.core.lexicon import PhraseMatcher
+
+VOCABULARY = 500
+
+
+def words(count: int, rng: random.Random, vocabulary: int = VOCABULARY) -> list[str]:
+    return [f"w{rng.randrange(vocabulary)}" for _ in range(count)]
+
+
+def lexicon(phrases: int, rng: random.Random) -> list[str]:
+    return [" ".join(words(rng.randint(2, 4), rng)) for _ in range(phrases)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=20)
+    parser.add_argument("--phrases", type=int, nargs="+", default=[10, 1_000, 50_000])
+    parser.add_argument("--chunk", type=int, default=1 << 16, help="characters per streamed chunk")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    text = " ".join(words(int(args.megabytes * 1e6 / 6), rng, 10 * VOCABULARY))
+    megabytes = len(text) / 1e6
+    for size in args.phrases:
+        started = time.perf_counter()
+        matcher = PhraseMatcher(lexicon(size, rng))
+        built = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scanner = matcher.scanner()
+        matches = sum(1 for _ in scanner.iter_matches(
+            text[i:i + args.chunk] for i in range(0, len(text), args.chunk)
+        ))
+        seconds = time.perf_counter() - started
+        print(f"{size:>8,} phrases built in {built:>6.2f}s  {megabytes:>6.1f} MB "
+              f"{seconds:>7.2f}s {megabytes / seconds:>6.1f} MB/s {matches:>10,} matches")
+
+
+if __name__ == "__main__":
+    main()
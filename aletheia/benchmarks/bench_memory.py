@@ -0,0 +1,71 @@
+"""Report bytes per fact for the old and new symbol table layouts.
+
+Run with ``python -m aletheia.benchmarks.bench_memory --facts 1000000 10000000``.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+@dataclass
+class LegacySymbol:
+    """Per-fact dataclass used by the original symbol table."""
+
+    name: str
+    value: str
+
+
+class LegacySymbolTable:
+    """The original layout: one dataclass instance per subject in a dict."""
+
+    def __init__(self) -> None:
+        self._symbols: dict[str, LegacySymbol] = {}
+
+    def add(self, name: str, value: str) -> None:
+        self._symbols[name] = LegacySymbol(name, value)
+
+
+def bytes_per_fact(count: int, build: Callable[[int], object]) -> float:
+    """Return the traced heap growth per fact of ``build(count)``."""
+    gc.collect()
+    tracemalloc.start()
+    table = build(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del table
+    return current / count
+
+
+def build_legacy(count: int) -> LegacySymbolTable:
+    # Every subject is distinct so the legacy table keeps all facts.
+    table = LegacySymbolTable()
+    for i in range(count):
+        table.add(f"entity{i}", f"property{i % 5000}")
+    return table
+
+
+def build_current(count: int) -> SymbolTable:
+    table = SymbolTable(InternTable())
+    table.add_many((f"entity{i}", f"property{i % 5000}") for i in range(count))
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--facts", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    args = parser.parse_args()
+    print(f"{'facts':>12} {'before B/fact':>14} {'after B/fact':>13}")
+    for count in args.facts:
+        before = bytes_per_fact(count, build_legacy)
+        after = bytes_per_fact(count, build_current)
+        print(f"{count:>12,} {before:>14.1f} {after:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
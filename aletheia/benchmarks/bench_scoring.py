@@ -0,0 +1,51 @@
+"""Compare batch scoring with one ``detect`` call per statement.
+
+Statements are short sentences, a fraction of them carrying a deception
+marker, a hedge or a negation. Run with
+``python -m aletheia.benchmarks.bench_scoring --statements 100000``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from aletheia.core.truth_detector import TruthDetector
+
+SUBJECTS = ["the report", "the mayor", "this study", "the tower", "our data", "the river"]
+CLAIMS = ["is accurate", "was fabricated", "is not reliable", "is probably fine", "is a hoax",
+          "seems misleading", "is 330 meters tall", "was never confirmed", "is well documented"]
+OPENERS = ["", "", "", "trust me, ", "to be honest ", "allegedly ", "maybe "]
+
+
+def statements(count: int, rng: random.Random) -> list[str]:
+    return [
+        f"{rng.choice(OPENERS)}{rng.choice(SUBJECTS)} {rng.choice(CLAIMS)}.".capitalize()
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=100_000)
+    args = parser.parse_args()
+
+    texts = statements(args.statements, random.Random(0))
+    detector = TruthDetector()
+    detector.detect_many(texts[:10])
+
+    started = time.perf_counter()
+    verdicts = detector.detect_many(texts)
+    batch = time.perf_counter() - started
+    print(f"{'batch':>8} {len(texts):>10,} statements {batch:>7.3f}s "
+          f"{len(texts) / batch:>12,.0f}/s {int(verdicts.sum()):>10,} truthful")
+
+    started = time.perf_counter()
+    flagged = sum(detector.detect(text) for text in texts)
+    single = time.perf_counter() - started
+    print(f"{'detect':>8} {len(texts):>10,} statements {single:>7.3f}s "
+          f"{len(texts) / single:>12,.0f}/s {flagged:>10,} unflagged ({single / batch:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure batch evaluation throughput for sharded engines.
+
+Run with ``python -m aletheia.benchmarks.bench_sharding --claims 1000000``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from aletheia.core.inference import TruthInferenceEngine
+
+
+def run(engine: TruthInferenceEngine, facts: list[tuple[str, str]], claims: list[str], batch: int) -> float:
+    """Load ``facts`` and return claims per second for batched evaluation."""
+    engine.add_facts(facts)
+    started = time.perf_counter()
+    for start in range(0, len(claims), batch):
+        engine.evaluate_many(claims[start:start + batch])
+    return len(claims) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--facts", type=int, default=1_000_000)
+    parser.add_argument("--claims", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    facts = [(f"entity{i}", f"kind{i % 1000}") for i in range(args.facts)]
+    claims = [f"entity{i % args.facts} is kind{i % 997}." for i in range(args.claims)]
+
+    baseline = run(TruthInferenceEngine(), facts, claims, args.batch)
+    print(f"{'in-process':>12} {baseline:>14,.0f} claims/s")
+    for workers in args.workers:
+        engine = TruthInferenceEngine(workers=workers)
+        try:
+            rate = run(engine, facts, claims, args.batch)
+        finally:
+            engine.close()
+        print(f"{workers:>4} workers {rate:>14,.0f} claims/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Alias resolution through a union-find over term ids."""
+from __future__ import annotations
+
+
+class AliasIndex:
+    """Disjoint sets of names that denote the same thing.
+
+    Every name mentioned in an alias gets a dense id; each set is a tree of
+    parent links whose root is the canonical name. :meth:`canonical` follows
+    the links with path halving and :meth:`union` joins by size, so lookups
+    stay effectively constant time. Names never aliased cost one dict miss.
+    """
+
+    __slots__ = ("_ids", "_names", "_parent", "_size")
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._parent: list[int] = []
+        self._size: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of names taking part in an alias."""
+        return len(self._names)
+
+    def _id(self, name: str) -> int:
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._parent.append(ident)
+            self._size.append(1)
+        return ident
+
+    def _find(self, ident: int) -> int:
+        parent = self._parent
+        while parent[ident] != ident:
+            parent[ident] = parent[parent[ident]]
+            ident = parent[ident]
+        return ident
+
+    def canonical(self, name: str) -> str:
+        """Return the canonical name for ``name``; unknown names map to themselves."""
+        ident = self._ids.get(name)
+        if ident is None:
+            return name
+        return self._names[self._find(ident)]
+
+    def union(self, alias: str, name: str) -> tuple[str, str] | None:
+        """Join the sets of ``alias`` and ``name``.
+
+        Return ``(absorbed, canonical)``, the old and new canonical names of
+        the merged set, or None if both were already aliases. When neither
+        set is larger, ``name``'s canonical name wins.
+        """
+        first = self._find(self._id(alias))
+        second = self._find(self._id(name))
+        if first == second:
+            return None
+        if self._size[first] > self._size[second]:
+            first, second = second, first
+        self._parent[first] = second
+        self._size[second] += self._size[first]
+        return self._names[first], self._names[second]
+
+    def pairs(self) -> list[tuple[str, str]]:
+        """Return ``(alias, canonical)`` for every non-canonical name."""
+        return [
+            (name, self._names[self._find(ident)])
+            for ident, name in enumerate(self._names)
+            if self._parent[ident] != ident
+        ]
@@ -0,0 +1,126 @@
+"""Bloom filter answering definite misses for fact stores."""
+from __future__ import annotations
+
+import math
+import mmap
+import struct
+from hashlib import blake2b
+from pathlib import Path
+
+BLOOM_MAGIC = b"ALTB"
+BLOOM_HEADER = struct.Struct("<4sIQQQ")
+DEFAULT_ERROR_RATE = 0.01
+
+
+def pair_key(subject: str, obj: str) -> str:
+    """Return the filter key for a ``subject is obj`` fact."""
+    return f"{subject}\x1f{obj}"
+
+
+def subject_key(subject: str) -> str:
+    """Return the filter key recording that ``subject`` has facts."""
+    return f"{subject}\x1e"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys.
+
+    Positions come from a keyed BLAKE2 digest rather than ``hash()``, so a
+    filter written by one process answers identically in another. The filter
+    also counts how many lookups it rejected and how many of its positive
+    answers the caller reported as false, to show the observed error rate
+    next to the theoretical one.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE) -> None:
+        capacity = max(1, capacity)
+        self.bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.count = 0
+        self._data: bytearray | memoryview = bytearray((self.bits + 7) // 8)
+        self.rejected = 0
+        self.false_positives = 0
+
+    def _positions(self, key: str) -> list[int]:
+        digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        return [(first + i * second) % bits for i in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        """Insert ``key``."""
+        data = self._data
+        for position in self._positions(key):
+            data[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """Return False only if ``key`` was definitely never added."""
+        data = self._data
+        for position in self._positions(key):
+            if not data[position >> 3] >> (position & 7) & 1:
+                self.rejected += 1
+                return False
+        return True
+
+    def record_false_positive(self) -> None:
+        """Note that a positive answer turned out to be a miss."""
+        self.false_positives += 1
+
+    def estimated_error_rate(self) -> float:
+        """Return the false-positive rate expected at the current fill."""
+        return (1.0 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def stats(self) -> dict[str, float]:
+        """Return size, fill and error-rate figures."""
+        negatives = self.rejected + self.false_positives
+        return {
+            "bits": self.bits,
+            "hashes": self.hashes,
+            "items": self.count,
+            "capacity": self.capacity,
+            "bytes_per_item": len(self._data) / self.count if self.count else 0.0,
+            "estimated_fp_rate": self.estimated_error_rate(),
+            "rejected": self.rejected,
+            "false_positives": self.false_positives,
+            "observed_fp_rate": self.false_positives / negatives if negatives else 0.0,
+        }
+
+    def write(self, path: str | Path) -> None:
+        """Save the filter so :meth:`open` can map it back."""
+        with Path(path).open("wb") as handle:
+            handle.write(BLOOM_HEADER.pack(BLOOM_MAGIC, self.hashes, self.bits, self.count, self.capacity))
+            handle.write(self._data)
+
+    @classmethod
+    def open(cls, path: str | Path) -> BloomFilter:
+        """Map a saved filter read-only; adding to it is not supported."""
+        with Path(path).open("rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, hashes, bits, count, capacity = BLOOM_HEADER.unpack_from(mapping, 0)
+        if magic != BLOOM_MAGIC:
+            raise ValueError(f"{path} is not an Aletheia bloom filter")
+        bloom = cls.__new__(cls)
+        bloom.bits, bloom.hashes, bloom.count, bloom.capacity = bits, hashes, count, capacity
+        bloom._data = memoryview(mapping)[BLOOM_HEADER.size:]
+        bloom.rejected = 0
+        bloom.false_positives = 0
+        return bloom
+
+    def copy(self) -> BloomFilter:
+        """Return a writable in-memory copy, e.g. of a mapped filter, to add keys to."""
+        bloom = BloomFilter.__new__(BloomFilter)
+        bloom.bits, bloom.hashes, bloom.count, bloom.capacity = self.bits, self.hashes, self.count, self.capacity
+        bloom._data = bytearray(self._data)
+        bloom.rejected = 0
+        bloom.false_positives = 0
+        return bloom
+
+    def close(self) -> None:
+        """Release a mapped filter."""
+        if isinstance(self._data, memoryview):
+            base = self._data.obj
+            self._data.release()
+            base.close()
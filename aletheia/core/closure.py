@@ -0,0 +1,72 @@
+"""Incrementally maintained transitive closure over ``is`` facts."""
+from __future__ import annotations
+
+from typing import Iterator
+
+
+def _slots(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits in ``bits``."""
+    text = bin(bits)[:1:-1]
+    position = text.find("1")
+    while position != -1:
+        yield position
+        position = text.find("1", position + 1)
+
+
+class ClosureIndex:
+    """Reachability index answering ``a is ... is b`` chains in constant time.
+
+    Every node of the hierarchy gets a dense slot. Each slot keeps a bitmap of
+    the slots it can reach (a ``bytearray``, so a query is one byte test) and
+    of the slots that can reach it (an ``int``, so merging is one ``or``).
+    Adding an edge ``u -> v`` pushes ``v`` and its ancestors into ``u`` and
+    every descendant of ``u``; nothing is recomputed from scratch.
+    """
+
+    def __init__(self) -> None:
+        self._slot: dict[int, int] = {}
+        self._ancestors: list[bytearray] = []
+        self._descendants: list[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the hierarchy."""
+        return len(self._slot)
+
+    def _slot_for(self, node: int) -> int:
+        slot = self._slot.get(node)
+        if slot is None:
+            slot = len(self._ancestors)
+            self._slot[node] = slot
+            self._ancestors.append(bytearray())
+            self._descendants.append(0)
+        return slot
+
+    def _reaches_slot(self, source: int, target: int) -> bool:
+        row = self._ancestors[source]
+        byte = target >> 3
+        return byte < len(row) and bool(row[byte] >> (target & 7) & 1)
+
+    def add_edge(self, source: int, target: int) -> None:
+        """Record that ``source`` reaches ``target`` and update the closure."""
+        src = self._slot_for(source)
+        dst = self._slot_for(target)
+        if self._reaches_slot(src, dst):
+            return
+        ancestors = self._ancestors
+        descendants = self._descendants
+
+        upward = int.from_bytes(ancestors[dst], "little") | 1 << dst
+        downward = descendants[src] | 1 << src
+        for slot in _slots(downward):
+            merged = int.from_bytes(ancestors[slot], "little") | upward
+            ancestors[slot] = bytearray(merged.to_bytes((merged.bit_length() + 7) // 8, "little"))
+        for slot in _slots(upward):
+            descendants[slot] |= downward
+
+    def reaches(self, source: int, target: int) -> bool:
+        """Return True if a chain of edges leads from ``source`` to ``target``."""
+        src = self._slot.get(source)
+        dst = self._slot.get(target)
+        if src is None or dst is None:
+            return False
+        return self._reaches_slot(src, dst)
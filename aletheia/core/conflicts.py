@@ -0,0 +1,161 @@
+"""Exclusivity constraints and incremental contradiction detection.
+
+A constraint declares values that are mutually exclusive, such as "alive"
+and "dead": no subject may be more than one of them. Each write is checked
+against only the values its subject already holds under the constraints its
+object belongs to, so no audit of the whole store is ever needed.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Iterable, Iterator
+
+DEFAULT_LOG_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """A new fact ``subject is obj`` contradicting ``subject is existing``."""
+
+    subject: str
+    obj: str
+    existing: str
+    constraint: str
+
+
+class ConflictIndex:
+    """Exclusive values held per subject, and a log of the conflicts found.
+
+    ``(subject, constraint)`` maps to the values of the constraint that the
+    subject holds; like postings, a lone value is stored bare rather than in
+    a list. The log keeps the last ``log_size`` conflicts, each numbered so
+    readers can resume from a cursor or wait for the next one.
+    """
+
+    __slots__ = ("_names", "_groups", "_held", "_lock", "_log", "_changed", "_count")
+
+    def __init__(self, log_size: int = DEFAULT_LOG_SIZE) -> None:
+        self._names: list[str] = []
+        self._groups: dict[str, tuple[int, ...]] = {}
+        self._held: dict[tuple[str, int], str | list[str]] = {}
+        self._lock = Lock()
+        self._log: deque[tuple[int, Conflict]] = deque(maxlen=log_size)
+        self._changed = Condition()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of constraints."""
+        return len(self._names)
+
+    def declare(self, values: Iterable[str], name: str | None = None) -> str:
+        """Make ``values`` mutually exclusive and return the constraint's name."""
+        values = list(dict.fromkeys(values))
+        if len(values) < 2:
+            raise ValueError("An exclusivity constraint needs at least two values")
+        name = name or " / ".join(values)
+        if name in self._names:
+            raise ValueError(f"Constraint {name!r} already exists")
+        group = len(self._names)
+        self._names.append(name)
+        for value in values:
+            self._groups[value] = self._groups.get(value, ()) + (group,)
+        return name
+
+    def alias(self, absorbed: str, canonical: str) -> None:
+        """Let ``canonical`` take over the constraints of a name it absorbed."""
+        groups = self._groups.pop(absorbed, ())
+        if groups:
+            merged = self._groups.get(canonical, ())
+            self._groups[canonical] = merged + tuple(group for group in groups if group not in merged)
+
+    def check(self, facts: Iterable[tuple[str, str]]) -> list[Conflict]:
+        """Track the exclusive values of ``facts`` and return the conflicts they raise.
+
+        A fact already tracked raises nothing again. Conflicts are candidates:
+        the value held may since have lapsed, so callers confirm them before
+        passing them to :meth:`record`.
+        """
+        groups_of = self._groups
+        held = self._held
+        names = self._names
+        found: list[Conflict] = []
+        with self._lock:
+            for subject, obj in facts:
+                groups = groups_of.get(obj)
+                if groups is None:
+                    continue
+                for group in groups:
+                    key = (subject, group)
+                    values = held.get(key)
+                    if values is None:
+                        held[key] = obj
+                        continue
+                    if values.__class__ is str:
+                        if values == obj:
+                            continue
+                        others = [values]
+                        held[key] = [values, obj]
+                    elif obj in values:
+                        continue
+                    else:
+                        others = values[:]
+                        values.append(obj)
+                    found.extend(Conflict(subject, obj, other, names[group]) for other in others)
+        return found
+
+    def discard(self, facts: Iterable[tuple[str, str]]) -> None:
+        """Stop tracking removed facts."""
+        held = self._held
+        with self._lock:
+            for subject, obj in facts:
+                for group in self._groups.get(obj, ()):
+                    key = (subject, group)
+                    values = held.get(key)
+                    if values == obj:
+                        del held[key]
+                    elif values.__class__ is list and obj in values:
+                        values.remove(obj)
+                        if len(values) == 1:
+                            held[key] = values[0]
+
+    def record(self, conflicts: list[Conflict]) -> None:
+        """Append confirmed conflicts to the log and wake up waiting readers."""
+        if not conflicts:
+            return
+        with self._changed:
+            for conflict in conflicts:
+                self._count += 1
+                self._log.append((self._count, conflict))
+            self._changed.notify_all()
+
+    def since(self, cursor: str | None = None) -> Iterator[tuple[Conflict, str]]:
+        """Return ``(conflict, cursor)`` for logged conflicts after ``cursor``, oldest first.
+
+        Conflicts that fell out of the log are skipped.
+        """
+        last = _number(cursor)
+        with self._changed:
+            entries = [entry for entry in self._log if entry[0] > last] if self._count > last else []
+        return ((conflict, str(number)) for number, conflict in entries)
+
+    def wait(self, cursor: str | None, timeout: float) -> bool:
+        """Block until a conflict after ``cursor`` is logged; False after ``timeout`` seconds."""
+        last = _number(cursor)
+        with self._changed:
+            return self._changed.wait_for(lambda: self._count > last, timeout)
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of constraints and of conflicts found so far."""
+        return {"constraints": len(self._names), "conflicts": self._count}
+
+
+def _number(cursor: str | None) -> int:
+    """Return the number of the conflict a cursor points at, 0 for none."""
+    if cursor is None:
+        return 0
+    try:
+        return int(cursor)
+    except ValueError:
+        raise ValueError(f"Invalid cursor {cursor!r}") from None
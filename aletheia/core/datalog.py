@@ -0,0 +1,166 @@
+"""Bulk rule materialization with semi-naive Datalog over NumPy arrays.
+
+The fact relation is one sorted ``int64`` array of ``(subject << 32) | object``
+keys over interned ids. A rule body is evaluated as a chain of whole-array
+sort-merge joins, and each round only joins against the facts derived in the
+previous round (the *delta*), so no consequence is computed twice over.
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .rules import Pattern, Rule, is_variable
+
+LOW_BITS = 0xFFFFFFFF
+
+Bindings = tuple[int, dict[str, np.ndarray]]
+
+
+def pack(subjects: np.ndarray, objects: np.ndarray) -> np.ndarray:
+    """Combine subject and object id columns into ``int64`` fact keys."""
+    return (subjects.astype(np.int64) << 32) | objects.astype(np.int64)
+
+
+def _unique(keys: np.ndarray) -> np.ndarray:
+    """Sort ``keys`` and drop duplicates.
+
+    Cheaper than :func:`numpy.unique`, which may hash instead of sort; the
+    stable sort also merges already sorted runs in linear time.
+    """
+    keys = np.sort(keys, kind="stable")
+    if keys.size:
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
+
+
+def _bind(keys: np.ndarray, pattern: Pattern, constants: dict[str, int | None]) -> Bindings:
+    """Return the variable bindings of every fact in ``keys`` matching ``pattern``."""
+    subject, obj = pattern.subject, pattern.object
+    if not is_variable(subject):
+        ident = constants[subject]
+        if ident is None:
+            return 0, {}
+        # Keys are sorted, so one subject's facts form a contiguous run.
+        low, high = np.searchsorted(keys, [ident << 32, (ident + 1) << 32])
+        keys = keys[low:high]
+    subjects = keys >> 32
+    objects = keys & LOW_BITS
+    if not is_variable(obj):
+        ident = constants[obj]
+        if ident is None:
+            return 0, {}
+        mask = objects == ident
+        subjects, objects = subjects[mask], objects[mask]
+    elif obj == subject:
+        mask = subjects == objects
+        subjects, objects = subjects[mask], objects[mask]
+    columns = {}
+    if is_variable(subject):
+        columns[subject] = subjects
+    if is_variable(obj):
+        columns[obj] = objects
+    return len(subjects), columns
+
+
+def _key(columns: dict[str, np.ndarray], names: list[str]) -> np.ndarray:
+    if len(names) == 1:
+        return columns[names[0]]
+    return pack(columns[names[0]], columns[names[1]])
+
+
+def join(left: Bindings, right: Bindings) -> Bindings:
+    """Sort-merge join two binding tables on their shared variables."""
+    left_size, left_columns = left
+    right_size, right_columns = right
+    shared = [name for name in right_columns if name in left_columns]
+    if not shared:
+        left_rows = np.repeat(np.arange(left_size), right_size)
+        right_rows = np.tile(np.arange(right_size), left_size)
+    else:
+        right_key = _key(right_columns, shared)
+        order = np.argsort(right_key, kind="stable")
+        sorted_key = right_key[order]
+        left_key = _key(left_columns, shared)
+        low = np.searchsorted(sorted_key, left_key, "left")
+        counts = np.searchsorted(sorted_key, left_key, "right") - low
+        total = int(counts.sum())
+        left_rows = np.repeat(np.arange(left_size), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        right_rows = order[np.repeat(low, counts) + offsets]
+    columns = {name: column[left_rows] for name, column in left_columns.items()}
+    for name, column in right_columns.items():
+        if name not in columns:
+            columns[name] = column[right_rows]
+    return len(left_rows), columns
+
+
+def _fire(
+    rule: Rule, constants: dict[str, int | None], old: np.ndarray, delta: np.ndarray, full: np.ndarray
+) -> list[np.ndarray]:
+    """Return the conclusions of ``rule`` that use at least one delta fact.
+
+    The delta takes each condition in turn; conditions before it only see
+    ``old`` facts, so a match using several delta facts is found once.
+    """
+    found = []
+    for position in range(len(rule.conditions)):
+        bindings: Bindings | None = None
+        for index, pattern in enumerate(rule.conditions):
+            keys = old if index < position else delta if index == position else full
+            matched = _bind(keys, pattern, constants)
+            bindings = matched if bindings is None else join(bindings, matched)
+            if not bindings[0]:
+                break
+        size, columns = bindings
+        if not size:
+            continue
+        subject, obj = rule.conclusion.subject, rule.conclusion.object
+        subjects = columns[subject] if is_variable(subject) else np.full(size, constants[subject])
+        objects = columns[obj] if is_variable(obj) else np.full(size, constants[obj])
+        found.append(pack(subjects, objects))
+    return found
+
+
+def materialize(
+    keys: np.ndarray,
+    rules: Iterable[Rule],
+    id_of: Callable[[str], int | None],
+    intern: Callable[[str], int],
+) -> tuple[np.ndarray, int]:
+    """Compute every fact ``rules`` derive from ``keys`` until nothing new follows.
+
+    ``id_of`` resolves constants of rule bodies (an unknown constant matches
+    nothing) and ``intern`` assigns ids to constants of conclusions. Return
+    the sorted keys of the new facts and the number of rounds it took.
+    """
+    rules = list(rules)
+    constants: dict[str, int | None] = {}
+    for rule in rules:
+        for pattern in rule.conditions:
+            for term in (pattern.subject, pattern.object):
+                if not is_variable(term):
+                    constants[term] = id_of(term)
+        for term in (rule.conclusion.subject, rule.conclusion.object):
+            if not is_variable(term):
+                constants[term] = intern(term)
+    full = _unique(keys.astype(np.int64))
+    old = full[:0]
+    delta = full
+    derived = []
+    rounds = 0
+    while delta.size:
+        rounds += 1
+        found = [part for rule in rules for part in _fire(rule, constants, old, delta, full)]
+        if not found:
+            break
+        delta = _unique(np.concatenate(found))
+        positions = np.minimum(np.searchsorted(full, delta), full.size - 1)
+        delta = delta[full[positions] != delta]
+        if delta.size:
+            old, full = full, _unique(np.concatenate((full, delta)))
+            derived.append(delta)
+    if not derived:
+        return np.empty(0, dtype=np.int64), rounds
+    return np.sort(np.concatenate(derived)), rounds
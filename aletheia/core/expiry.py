@@ -0,0 +1,186 @@
+"""Fact expiry driven by a hierarchical timing wheel."""
+from __future__ import annotations
+
+import math
+import time
+from threading import Lock
+from typing import Callable, Iterable
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS
+LEVELS = 4
+DEFAULT_RESOLUTION = 1.0
+
+
+class TimerWheel:
+    """Hierarchical timing wheel scheduling integer items on integer ticks.
+
+    Level ``i`` has :data:`SLOTS` buckets, each spanning ``SLOTS ** i`` ticks,
+    and a bucket groups its items by tick. Scheduling a batch is one list
+    extend and firing empties one bucket, so an item costs O(1) plus at most
+    one move per level as its group cascades down; nothing ever scans the
+    whole wheel. Ticks beyond the top level's span are parked in its buckets
+    and simply rescheduled when they cascade early.
+    """
+
+    __slots__ = ("tick", "_levels", "_sizes", "_count")
+
+    def __init__(self, tick: int = 0) -> None:
+        self.tick = tick
+        self._levels: list[list[dict[int, list[int]]]] = [
+            [{} for _ in range(SLOTS)] for _ in range(LEVELS)
+        ]
+        self._sizes = [0] * LEVELS
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of scheduled items."""
+        return self._count
+
+    def schedule(self, tick: int, items: list[int]) -> None:
+        """Schedule ``items`` to fire once the wheel reaches ``tick``."""
+        self._count += len(items)
+        self._place(max(tick, self.tick + 1), items)
+
+    def _place(self, tick: int, items: list[int]) -> None:
+        highest = min(max((tick ^ self.tick).bit_length() - 1, 0), SLOT_BITS * LEVELS - 1)
+        level = highest // SLOT_BITS
+        bucket = self._levels[level][(tick >> (SLOT_BITS * level)) & (SLOTS - 1)]
+        group = bucket.get(tick)
+        if group is None:
+            bucket[tick] = items[:]
+        else:
+            group.extend(items)
+        self._sizes[level] += len(items)
+
+    def _take(self, level: int, slot: int) -> dict[int, list[int]]:
+        bucket = self._levels[level][slot]
+        if bucket:
+            self._levels[level][slot] = {}
+            self._sizes[level] -= sum(len(items) for items in bucket.values())
+        return bucket
+
+    def advance(self, tick: int) -> list[int]:
+        """Move the wheel to ``tick`` and return every item that fired."""
+        fired: list[int] = []
+        sizes = self._sizes
+        while self.tick < tick and self._count:
+            # Skip straight past stretches where only higher levels hold items;
+            # they cannot move before the next boundary of their level.
+            lowest = next(level for level in range(LEVELS) if sizes[level])
+            if lowest:
+                span = 1 << (SLOT_BITS * lowest)
+                self.tick = min(tick, (self.tick | (span - 1)) + 1) - 1
+            self.tick += 1
+            now = self.tick
+            for level in range(LEVELS - 1, 0, -1):
+                if now & ((1 << (SLOT_BITS * level)) - 1) == 0:
+                    for due, items in self._take(level, (now >> (SLOT_BITS * level)) & (SLOTS - 1)).items():
+                        self._place(max(due, now), items)
+            for due, items in self._take(0, now & (SLOTS - 1)).items():
+                if due <= now:
+                    fired.extend(items)
+                    self._count -= len(items)
+                else:
+                    self._place(due, items)
+        self.tick = max(self.tick, tick)
+        return fired
+
+
+def pack(subject: int, obj: int) -> int:
+    """Combine a subject and an object id into one integer key."""
+    return subject << 32 | obj
+
+
+def unpack(key: int) -> tuple[int, int]:
+    """Split a key built by :func:`pack` back into its two ids."""
+    return key >> 32, key & 0xFFFFFFFF
+
+
+class FactExpiry:
+    """Deadlines of expiring facts, keyed by their interned ids.
+
+    :meth:`expired` compares against the exact deadline, so a fact stops
+    matching the moment it lapses; :meth:`reap` hands out lapsed facts in
+    tick-sized batches so the store can reclaim them. Renewing a fact only
+    moves its deadline; the stale wheel entry is skipped when it fires.
+    """
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, resolution: float = DEFAULT_RESOLUTION
+    ) -> None:
+        self.clock = clock
+        self.resolution = resolution
+        self._origin = clock()
+        self._deadlines: dict[int, float] = {}
+        self._subjects: dict[int, int] = {}
+        self._wheel = TimerWheel()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of facts with a pending deadline."""
+        return len(self._deadlines)
+
+    def set(self, facts: Iterable[tuple[int, int]], ttl: float) -> None:
+        """Make the facts, given as id pairs, lapse ``ttl`` seconds from now."""
+        self.set_until(facts, self.clock() + ttl)
+
+    def set_until(self, facts: Iterable[tuple[int, int]], deadline: float) -> None:
+        """Make the facts, given as id pairs, lapse at ``deadline`` on the clock."""
+        deadlines = self._deadlines
+        subjects = self._subjects
+        keys = []
+        with self._lock:
+            for subject, obj in facts:
+                key = subject << 32 | obj
+                if key not in deadlines:
+                    subjects[subject] = subjects.get(subject, 0) + 1
+                deadlines[key] = deadline
+                keys.append(key)
+            self._wheel.schedule(math.ceil((deadline - self._origin) / self.resolution), keys)
+
+    def clear(self, facts: Iterable[tuple[int, int]]) -> None:
+        """Drop any deadline of the facts, making them permanent."""
+        with self._lock:
+            for subject, obj in facts:
+                if self._deadlines.pop(pack(subject, obj), None) is not None:
+                    self._forget(subject)
+
+    def _forget(self, subject: int) -> None:
+        remaining = self._subjects[subject] - 1
+        if remaining:
+            self._subjects[subject] = remaining
+        else:
+            del self._subjects[subject]
+
+    def deadline(self, subject: int, obj: int) -> float | None:
+        """Return the fact's deadline, or None if it has none."""
+        return self._deadlines.get(pack(subject, obj))
+
+    def covers(self, subject: int | None) -> bool:
+        """Return True if any fact of ``subject`` has a deadline."""
+        return subject in self._subjects
+
+    def expired(self, subject: int, obj: int) -> bool:
+        """Return True if the fact had a deadline that has passed."""
+        deadline = self._deadlines.get(pack(subject, obj))
+        return deadline is not None and deadline <= self.clock()
+
+    def reap(self) -> list[tuple[int, int]]:
+        """Return every lapsed fact whose tick has come and forget it."""
+        now = self.clock()
+        tick = math.floor((now - self._origin) / self.resolution)
+        lapsed: list[tuple[int, int]] = []
+        if tick <= self._wheel.tick:
+            return lapsed
+        deadlines = self._deadlines
+        with self._lock:
+            for key in self._wheel.advance(tick):
+                deadline = deadlines.get(key)
+                if deadline is None or deadline > now:
+                    continue
+                del deadlines[key]
+                subject, obj = unpack(key)
+                self._forget(subject)
+                lapsed.append((subject, obj))
+        return lapsed
@@ -0,0 +1,201 @@
+"""Streaming extraction of facts from plain-text documents.
+
+Every sentence the statement grammar reads as a positive ``X is Y.`` clause,
+or as a conjunction of them, becomes a fact; questions, negations,
+disjunctions and comparisons are skipped.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from .loader import DEFAULT_BATCH_SIZE
+from .parser import Clause, Conjunction, compile_statement
+
+Fact = tuple[str, str]
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Sentences end at terminal punctuation followed by whitespace, or at a blank line.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+_CUTS = tuple(f"{mark}{space}" for mark in ".!?" for space in " \n\t\r")
+
+
+@dataclass
+class ExtractionStats:
+    """Counters of one extraction run."""
+
+    sentences: int = 0
+    facts: int = 0
+    added: int = 0
+    characters: int = 0
+    seconds: float = 0.0
+
+    @property
+    def sentences_per_second(self) -> float:
+        return self.sentences / self.seconds if self.seconds else 0.0
+
+    @property
+    def facts_per_second(self) -> float:
+        return self.facts / self.seconds if self.seconds else 0.0
+
+
+class SentenceChunker:
+    """Regroup arbitrary pieces of text into chunks that end on sentence boundaries.
+
+    Chunks hold about ``chunk_size`` characters. With ``first_size`` the first
+    chunk is that small and each later one doubles up to ``chunk_size``, so a
+    consumer can start on the first sentences right away. Text without any
+    boundary is cut at ``4 * chunk_size`` anyway to keep memory bounded.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, first_size: int | None = None) -> None:
+        self.chunk_size = chunk_size
+        self._size = min(first_size or chunk_size, chunk_size)
+        self._text = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add ``text`` and return every chunk that is now complete."""
+        self._text += text
+        chunks = []
+        while len(self._text) >= self._size:
+            text = self._text
+            cut = max(text.rfind(mark, 0, self._size) for mark in _CUTS) + 1
+            if cut <= 0:
+                later = [text.find(mark, self._size) for mark in _CUTS]
+                later = [position for position in later if position >= 0]
+                if later:
+                    cut = min(later) + 1
+                elif len(text) >= 4 * self.chunk_size:
+                    cut = len(text)
+                else:
+                    break
+            chunks.append(text[:cut])
+            self._text = text[cut:]
+            self._size = min(self._size * 2, self.chunk_size)
+        return chunks
+
+    def close(self) -> list[str]:
+        """Return whatever text is left as a final chunk."""
+        text, self._text = self._text, ""
+        return [text] if text else []
+
+
+def iter_chunks(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Yield the text of ``path`` in sentence-aligned chunks of about ``chunk_size`` characters."""
+    chunker = SentenceChunker(chunk_size)
+    with Path(path).open(encoding="utf-8", errors="replace") as handle:
+        while block := handle.read(chunk_size):
+            yield from chunker.feed(block)
+    yield from chunker.close()
+
+
+def sentence_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield the ``(start, end)`` offsets of every sentence of ``text``."""
+    start = 0
+    for match in _SENTENCE_BREAK.finditer(text):
+        yield from _span(text, start, match.start())
+        start = match.end()
+    yield from _span(text, start, len(text))
+
+
+def _span(text: str, start: int, end: int) -> Iterator[tuple[int, int]]:
+    piece = text[start:end]
+    stripped = piece.strip()
+    if stripped:
+        start += len(piece) - len(piece.lstrip())
+        yield start, start + len(stripped)
+
+
+def extract_facts(text: str) -> tuple[int, list[Fact]]:
+    """Return the number of sentences in ``text`` and the facts they state."""
+    sentences = 0
+    facts: list[Fact] = []
+    for sentence in _SENTENCE_BREAK.split(text):
+        if not sentence or sentence.isspace():
+            continue
+        sentences += 1
+        if not sentence.endswith(".") or "is" not in sentence.lower():
+            continue
+        expression = compile_statement(sentence)
+        if expression.__class__ is Conjunction:
+            clauses = expression.terms
+        elif expression is not None:
+            clauses = (expression,)
+        else:
+            continue
+        if all(
+            clause.__class__ is Clause and clause.relation == "is" and not clause.negated
+            for clause in clauses
+        ):
+            facts.extend((clause.subject, clause.object) for clause in clauses)
+    return sentences, facts
+
+
+def _extracted(chunks: Iterable[str], workers: int) -> Iterator[tuple[int, list[Fact]]]:
+    """Yield :func:`extract_facts` results per chunk, in order.
+
+    With workers, at most ``2 * workers`` chunks are in flight: the reader
+    blocks on the oldest result before submitting more, which bounds memory
+    however large the input and however slow the consumer.
+    """
+    if workers <= 0:
+        yield from map(extract_facts, chunks)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(extract_facts, (chunk,)))
+        while pending:
+            yield pending.popleft().get()
+
+
+def ingest_documents(
+    engine,
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Callable[[ExtractionStats], None] | None = None,
+) -> ExtractionStats:
+    """Extract facts from the text files ``paths`` and add them to ``engine``.
+
+    Files are read chunk by chunk and split into sentences by ``workers``
+    processes (default: one per CPU, 0 for in-process); facts reach the store
+    in batches of about ``batch_size``. ``progress`` gets the running
+    counters after every batch.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    stats = ExtractionStats()
+    started = time.perf_counter()
+    batch: list[Fact] = []
+
+    def flush() -> None:
+        stats.added += engine.add_normalized(batch)
+        batch.clear()
+        stats.seconds = time.perf_counter() - started
+        if progress is not None:
+            progress(stats)
+
+    def chunks() -> Iterator[str]:
+        for path in paths:
+            for chunk in iter_chunks(path, chunk_size):
+                stats.characters += len(chunk)
+                yield chunk
+
+    for sentences, facts in _extracted(chunks(), workers):
+        stats.sentences += sentences
+        stats.facts += len(facts)
+        batch.extend(facts)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return stats
@@ -0,0 +1,143 @@
+"""Typo-tolerant term lookup through a SymSpell-style deletion index."""
+from __future__ import annotations
+
+from typing import Iterable
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """Return the optimal string alignment distance, or ``limit + 1`` if above ``limit``.
+
+    Adjacent transpositions count as one edit, the most common typo. Only the
+    diagonal band of width ``2 * limit + 1`` is filled in, since no cell outside
+    it can stay within ``limit``.
+    """
+    if first == second:
+        return 0
+    size = len(second)
+    if abs(len(first) - size) > limit:
+        return limit + 1
+    beyond = limit + 1
+    previous2: list[int] = []
+    previous = [column if column <= limit else beyond for column in range(size + 1)]
+    for row in range(1, len(first) + 1):
+        char = first[row - 1]
+        low = max(1, row - limit)
+        high = min(size, row + limit)
+        current = [beyond] * (size + 1)
+        if row <= limit:
+            current[0] = row
+        smallest = current[0]
+        for column in range(low, high + 1):
+            other = second[column - 1]
+            best = previous[column - 1] + (char != other)
+            if previous[column] + 1 < best:
+                best = previous[column] + 1
+            if current[column - 1] + 1 < best:
+                best = current[column - 1] + 1
+            if (
+                row > 1
+                and column > 1
+                and char == second[column - 2]
+                and first[row - 2] == other
+                and previous2[column - 2] + 1 < best
+            ):
+                best = previous2[column - 2] + 1
+            current[column] = best if best < beyond else beyond
+            if best < smallest:
+                smallest = best
+        if smallest > limit:
+            return beyond
+        previous2, previous = previous, current
+    return previous[size]
+
+
+def _deletes(word: str, distance: int) -> set[str]:
+    """Return ``word`` and every string reachable by up to ``distance`` deletions."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {
+            variant[:position] + variant[position + 1:]
+            for variant in frontier
+            if len(variant) > 1
+            for position in range(len(variant))
+        }
+        found |= frontier
+    return found
+
+
+class FuzzyIndex:
+    """Vocabulary index answering "which terms are within ``d`` edits?".
+
+    Each term is filed under every deletion variant of its first
+    ``prefix_length`` characters. A query generates the same variants for the
+    misspelling, so candidates come from a few dict hits rather than a scan
+    of the vocabulary, and only those candidates are checked with
+    :func:`edit_distance`. Memory grows with the number of variants per term,
+    which ``max_distance`` and ``prefix_length`` bound.
+    """
+
+    __slots__ = ("max_distance", "prefix_length", "_terms", "_ids", "_variants")
+
+    def __init__(
+        self, max_distance: int = DEFAULT_MAX_DISTANCE, prefix_length: int = DEFAULT_PREFIX_LENGTH
+    ) -> None:
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._terms: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._variants: dict[str, int | list[int]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed terms."""
+        return len(self._terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._ids
+
+    def add(self, term: str) -> bool:
+        """Index ``term``; return False if it was already known."""
+        if term in self._ids:
+            return False
+        ident = self._ids[term] = len(self._terms)
+        self._terms.append(term)
+        variants = self._variants
+        for variant in _deletes(term[:self.prefix_length], self.max_distance):
+            found = variants.get(variant)
+            if found is None:
+                variants[variant] = ident
+            elif found.__class__ is int:
+                variants[variant] = [found, ident]
+            else:
+                found.append(ident)
+        return True
+
+    def update(self, terms: Iterable[str]) -> int:
+        """Index several terms and return how many were new."""
+        return sum(self.add(term) for term in terms if term not in self._ids)
+
+    def lookup(self, word: str, max_distance: int | None = None) -> list[tuple[str, int]]:
+        """Return ``(term, distance)`` for every term within reach, closest first."""
+        limit = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        if word in self._ids and limit == 0:
+            return [(word, 0)]
+        seen: set[int] = set()
+        matches: list[tuple[str, int]] = []
+        variants = self._variants
+        terms = self._terms
+        for variant in _deletes(word[:self.prefix_length], limit):
+            found = variants.get(variant)
+            if found is None:
+                continue
+            for ident in (found,) if found.__class__ is int else found:
+                if ident in seen:
+                    continue
+                seen.add(ident)
+                distance = edit_distance(word, terms[ident], limit)
+                if distance <= limit:
+                    matches.append((terms[ident], distance))
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
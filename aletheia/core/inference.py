@@ -1,18 +1,273 @@
 """Simple truth inference engine."""
 from __future__ import annotations
 
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from .conflicts import Conflict
+from .extraction import (
+    DEFAULT_CHUNK_SIZE,
+    ExtractionStats,
+    SentenceChunker,
+    ingest_documents,
+    sentence_spans,
+)
+from .loader import DEFAULT_BATCH_SIZE, load_facts
 from .logic_engine import LogicEngine
+from .parser import render
+from .sharding import ShardedLogicEngine
+from .snapshot import read_snapshot, write_snapshot
+from .symbol_table import SymbolTable
+
+DEFAULT_PAGE_SIZE = 100
+FIRST_VERIFY_CHUNK = 4096
+VERIFY_CHUNK = 256 * 1024
+
+Verdict = tuple[int, int, str, bool]
+
+
+def _page(items: Iterator[tuple[str, str]], limit: int) -> tuple[list[str], str | None]:
+    page = list(islice(items, limit + 1))
+    cursor = page[limit - 1][1] if len(page) > limit else None
+    return [item for item, _ in page[:limit]], cursor
+
 
 class TruthInferenceEngine:
-    """Evaluate statements using the underlying logic engine."""
+    """Evaluate statements using the underlying logic engine.
+
+    ``workers`` > 0 spreads facts over that many worker processes through a
+    :class:`ShardedLogicEngine`; call :meth:`close` to stop them.
+    """
+
+    def __init__(
+        self,
+        transitive: bool = False,
+        store: SymbolTable | None = None,
+        verdict_cache_size: int = 0,
+        workers: int = 0,
+        fuzzy_distance: int = 0,
+    ) -> None:
+        if workers:
+            if transitive or store is not None or verdict_cache_size or fuzzy_distance:
+                raise ValueError("Sharded engines keep their own stores and support no other options")
+            self.logic = ShardedLogicEngine(workers)
+        else:
+            self.logic = LogicEngine(
+                transitive=transitive,
+                symbols=store,
+                verdict_cache_size=verdict_cache_size,
+                fuzzy_distance=fuzzy_distance,
+            )
+
+    def add_fact(self, subject: str, obj: str, ttl: float | None = None) -> None:
+        """Register a fact, optionally lapsing after ``ttl`` seconds."""
+        self.logic.add_fact(subject, obj, ttl)
+
+    def add_facts(self, facts: Iterable[tuple[str, str]], ttl: float | None = None) -> int:
+        """Register a batch of facts and return how many were new."""
+        return self.logic.add_facts(facts, ttl)
+
+    def add_rule(self, text: str, name: str | None = None) -> int:
+        """Add an ``if ... then ...`` rule and return how many facts it derived."""
+        return self.logic.add_rule(text, name)
+
+    def materialize(self, rules: Iterable[str]) -> int:
+        """Derive every consequence of ``rules`` in one batch; see :meth:`LogicEngine.materialize`."""
+        return self.logic.materialize(rules)
+
+    def add_alias(self, alias: str, name: str) -> bool:
+        """Make ``alias`` resolve to the same facts as ``name``."""
+        return self.logic.add_alias(alias, name)
+
+    def add_exclusion(self, values: Iterable[str], name: str | None = None) -> int:
+        """Declare ``values`` mutually exclusive and return how many conflicts stored facts hold.
+
+        Later writes that contradict the constraint are logged as they
+        happen; read them with :meth:`iter_conflicts`.
+        """
+        return self.logic.add_exclusion(values, name)
+
+    def iter_conflicts(self, cursor: str | None = None) -> Iterator[tuple[Conflict, str]]:
+        """Lazily yield ``(conflict, cursor)`` for the conflicts logged after ``cursor``."""
+        return self.logic.iter_conflicts(cursor)
+
+    def conflicts_page(
+        self, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> tuple[list[Conflict], str | None]:
+        """Return up to ``limit`` conflicts logged after ``cursor`` and the cursor to resume from.
+
+        Unlike fact pages the log keeps growing, so the cursor of the last
+        conflict returned is given even when nothing follows it yet.
+        """
+        page = list(islice(self.iter_conflicts(cursor), limit))
+        return [conflict for conflict, _ in page], page[-1][1] if page else cursor
+
+    def wait_for_conflicts(self, cursor: str | None, timeout: float) -> bool:
+        """Block until a conflict after ``cursor`` is logged; False after ``timeout`` seconds."""
+        return self.logic.wait_for_conflicts(cursor, timeout)
 
-    def __init__(self) -> None:
-        self.logic = LogicEngine()
+    def set_ttl(self, obj: str, ttl: float | None) -> None:
+        """Give every fact later added with object ``obj`` a lifetime of ``ttl`` seconds."""
+        self.logic.set_ttl(obj, ttl)
 
-    def add_fact(self, subject: str, obj: str) -> None:
-        """Register a fact with the underlying logic engine."""
-        self.logic.add_fact(subject, obj)
+    def load_facts(
+        self,
+        path: str | Path,
+        fmt: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Stream facts from a JSONL, CSV or TSV file into the engine."""
+        return load_facts(self, path, fmt=fmt, batch_size=batch_size, progress=progress)
+
+    def load_documents(
+        self,
+        paths: str | Path | Iterable[str | Path],
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[ExtractionStats], None] | None = None,
+    ) -> ExtractionStats:
+        """Extract every ``X is Y.`` sentence of plain-text files into the engine.
+
+        Returns sentence and fact counts with their rates; see
+        :func:`~aletheia.core.extraction.ingest_documents`.
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        return ingest_documents(
+            self.logic, paths, workers=workers, chunk_size=chunk_size, batch_size=batch_size, progress=progress
+        )
+
+    def iter_objects(self, subject: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(object, cursor)`` pairs answering "what is subject?"."""
+        return self.logic.iter_objects(subject, cursor)
+
+    def iter_subjects(self, obj: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` pairs answering "what is obj?"."""
+        return self.logic.iter_subjects(obj, cursor)
+
+    def objects_page(
+        self, subject: str, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> tuple[list[str], str | None]:
+        """Return up to ``limit`` objects of ``subject`` and the next cursor."""
+        return _page(self.iter_objects(subject, cursor), limit)
+
+    def subjects_page(
+        self, obj: str, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> tuple[list[str], str | None]:
+        """Return up to ``limit`` subjects of ``obj`` and the next cursor."""
+        return _page(self.iter_subjects(obj, cursor), limit)
+
+    def iter_range(
+        self,
+        attribute: str,
+        low: float | None = None,
+        high: float | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[tuple[str, float, str]]:
+        """Lazily yield ``(subject, value, cursor)`` answering "whose attribute is between low and high?"."""
+        return self.logic.iter_range(attribute, low, high, cursor)
+
+    def range_page(
+        self,
+        attribute: str,
+        low: float | None = None,
+        high: float | None = None,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[tuple[str, float]], str | None]:
+        """Return up to ``limit`` ``(subject, value)`` pairs in range and the next cursor."""
+        items = self.iter_range(attribute, low, high, cursor)
+        return _page((((subject, value), position) for subject, value, position in items), limit)
+
+    def save_snapshot(self, path: str | Path) -> int:
+        """Write every fact and alias to a binary snapshot and return the fact count."""
+        aliases = getattr(self.logic, "aliases", None)
+        return write_snapshot(
+            path,
+            ((fact.name, fact.value) for fact in self.logic.facts()),
+            aliases=aliases.pairs() if aliases is not None else (),
+        )
+
+    def load_snapshot(self, path: str | Path) -> int:
+        """Add the facts and aliases of a snapshot and return how many facts were new."""
+        batches = read_snapshot(path, on_alias=self.logic.add_alias)
+        return sum(self.logic.add_normalized(batch) for batch in batches)
 
     def evaluate(self, statement: str) -> bool:
         """Return True if the logic engine deems the statement valid."""
-        return self.logic.evaluate(statement)
\ No newline at end of file
+        return self.logic.evaluate(statement)
+
+    def evaluate_many(self, statements: Iterable[str]) -> list[bool]:
+        """Evaluate a batch of statements, returning verdicts in order."""
+        return self.logic.evaluate_many(statements)
+
+    def verify_sentences(self, text: str, offset: int = 0) -> list[Verdict]:
+        """Return ``(start, end, sentence, verdict)`` for every sentence of ``text``.
+
+        Offsets are shifted by ``offset``; the sentences are evaluated as one
+        batch, which a sharded engine spreads over its workers.
+        """
+        spans = list(sentence_spans(text))
+        sentences = [text[start:end] for start, end in spans]
+        verdicts = self.evaluate_many(sentences)
+        return [
+            (offset + start, offset + end, sentence, verdict)
+            for (start, end), sentence, verdict in zip(spans, sentences, verdicts)
+        ]
+
+    def verify_document(
+        self, text: str | Iterable[str], chunk_size: int = VERIFY_CHUNK
+    ) -> Iterator[Verdict]:
+        """Lazily yield a verdict with character offsets for every sentence of a document.
+
+        ``text`` may also be an iterable of pieces, e.g. read from a stream.
+        Sentences are evaluated a chunk at a time; the first chunk is small
+        and later ones grow to ``chunk_size``, so early verdicts come out
+        right away however long the document is.
+        """
+        chunker = SentenceChunker(chunk_size, first_size=FIRST_VERIFY_CHUNK)
+        offset = 0
+        for piece in [text] if isinstance(text, str) else text:
+            for chunk in chunker.feed(piece):
+                yield from self.verify_sentences(chunk, offset)
+                offset += len(chunk)
+        for chunk in chunker.close():
+            yield from self.verify_sentences(chunk, offset)
+
+    def match(self, statement: str) -> tuple[bool, str | None]:
+        """Evaluate a statement tolerating typos; return the verdict and matched statement.
+
+        Needs an engine built with a positive ``fuzzy_distance``.
+        """
+        if not isinstance(self.logic, LogicEngine):
+            raise ValueError("Sharded engines do not support fuzzy matching")
+        verdict, matched = self.logic.match(statement)
+        return verdict, render(matched) if matched is not None else None
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return counters describing the engine's caches."""
+        stats = {"parser": self.logic.parser.stats()}
+        if self.logic.verdicts is not None:
+            stats["verdicts"] = self.logic.verdicts.stats()
+        # Sharded engines keep their stores in the workers.
+        bloom = getattr(getattr(self.logic, "symbols", None), "bloom", None)
+        if bloom is not None:
+            stats["bloom"] = bloom.stats()
+        rules = getattr(self.logic, "rules", None)
+        if rules:
+            stats["rules"] = rules.stats()
+        conflicts = getattr(self.logic, "conflicts", None)
+        if conflicts:
+            stats["conflicts"] = conflicts.stats()
+        expiry = getattr(self.logic, "expiry", None)
+        if expiry:
+            stats["expiry"] = {"pending": len(expiry)}
+        return stats
+
+    def close(self) -> None:
+        """Stop worker processes of a sharded engine."""
+        if isinstance(self.logic, ShardedLogicEngine):
+            self.logic.close()
@@ -0,0 +1,220 @@
+"""Multi-phrase matching over text with an Aho-Corasick automaton.
+
+Phrases and text are both read as lowercase ``\\w+`` words, so a phrase only
+matches whole words ("lie" does not fire inside "believe") and punctuation
+between words is ignored.
+"""
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping
+
+_WORD = re.compile(r"\w+")
+_WORD_CHAR = re.compile(r"\w")
+
+
+@dataclass(frozen=True)
+class Match:
+    """One occurrence of a lexicon phrase, with character offsets into the text."""
+
+    start: int
+    end: int
+    phrase: str
+    weight: float
+
+
+@dataclass
+class Scan:
+    """Everything found in a text: the matches, its word count and their total weight."""
+
+    matches: list[Match] = field(default_factory=list)
+    words: int = 0
+    weight: float = 0.0
+
+    @property
+    def score(self) -> float:
+        """Matched weight per word; 0.0 for a text without words."""
+        return self.weight / self.words if self.words else 0.0
+
+
+def _words(phrase: str) -> tuple[str, ...]:
+    return tuple(_WORD.findall(phrase.lower()))
+
+
+class PhraseMatcher:
+    """Compiled automaton finding every lexicon phrase in one pass over a text.
+
+    The phrases form a trie over words; failure links lead from each node to
+    the longest proper suffix that is also in the trie, and each node lists
+    every phrase ending there, including through those links. Scanning then
+    reads each word once and never backs up, whatever the number of phrases,
+    so the cost is linear in the text plus the matches reported.
+    """
+
+    __slots__ = ("phrases", "weights", "_lengths", "_goto", "_fail", "_outputs", "_longest", "_vocabulary")
+
+    def __init__(self, lexicon: Mapping[str, float] | Iterable[str]) -> None:
+        items = lexicon.items() if isinstance(lexicon, Mapping) else ((phrase, 1.0) for phrase in lexicon)
+        self.phrases: list[str] = []
+        self.weights: list[float] = []
+        self._lengths: list[int] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+        ends: dict[int, int] = {}
+        for phrase, weight in items:
+            words = _words(phrase)
+            if not words:
+                continue
+            state = 0
+            for word in words:
+                following = self._goto[state].get(word)
+                if following is None:
+                    following = self._goto[state][word] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = following
+            if state in ends:
+                # A repeated phrase keeps its last weight.
+                self.weights[ends[state]] = weight
+                continue
+            ends[state] = len(self.phrases)
+            self.phrases.append(" ".join(words))
+            self.weights.append(weight)
+            self._lengths.append(len(words))
+            self._outputs[state] = (ends[state],)
+        self._longest = max(self._lengths, default=0)
+        self._vocabulary = frozenset(word for edges in self._goto for word in edges)
+        self._link()
+
+    def __len__(self) -> int:
+        """Return the number of phrases."""
+        return len(self.phrases)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> PhraseMatcher:
+        """Build a matcher from a file of ``phrase`` or ``phrase<TAB>weight`` lines."""
+        lexicon: dict[str, float] = {}
+        with Path(path).open(encoding="utf-8") as handle:
+            for line in handle:
+                phrase, _, weight = line.rstrip("\n").partition("\t")
+                if phrase.strip() and not phrase.startswith("#"):
+                    lexicon[phrase] = float(weight) if weight.strip() else 1.0
+        return cls(lexicon)
+
+    def _link(self) -> None:
+        """Compute failure links and merged outputs breadth first."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and word not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(word, 0)
+                if outputs[fail[child]]:
+                    outputs[child] += outputs[fail[child]]
+
+    def scanner(self) -> Scanner:
+        """Return a scanner for text that arrives in pieces."""
+        return Scanner(self)
+
+    def scan(self, text: str) -> Scan:
+        """Return every phrase occurrence in ``text`` with its score."""
+        scanner = Scanner(self)
+        matches = scanner.feed(text) + scanner.close()
+        return Scan(matches, scanner.words, scanner.weight)
+
+
+class Scanner:
+    """Incremental scan of a text fed in chunks, keeping offsets across them.
+
+    A chunk ending inside a word holds that word back until the next chunk,
+    so matches never depend on where the text was cut. Only running totals
+    are kept, so memory does not grow with the text.
+    """
+
+    __slots__ = ("matcher", "words", "weight", "_state", "_offset", "_carry", "_starts")
+
+    def __init__(self, matcher: PhraseMatcher) -> None:
+        self.matcher = matcher
+        self.words = 0
+        self.weight = 0.0
+        self._state = 0
+        self._offset = 0
+        self._carry: list[str] = []
+        self._starts: deque[int] = deque(maxlen=max(matcher._longest, 1))
+
+    def feed(self, text: str) -> list[Match]:
+        """Scan the next piece of text and return the matches it completed."""
+        # What is held back is a single unfinished word, so only the new
+        # text can end it: walk back over its trailing word characters.
+        cut = len(text)
+        while cut and _WORD_CHAR.match(text, cut - 1):
+            cut -= 1
+        if not cut:
+            self._carry.append(text)
+            return []
+        head = "".join(self._carry) + text[:cut]
+        self._carry = [text[cut:]]
+        found = self._run(head)
+        self._offset += len(head)
+        return found
+
+    def close(self) -> list[Match]:
+        """Scan whatever text was held back and return its matches."""
+        text, self._carry = "".join(self._carry), []
+        found = self._run(text)
+        self._offset += len(text)
+        return found
+
+    def iter_matches(self, chunks: Iterable[str]) -> Iterator[Match]:
+        """Feed every chunk and yield matches as soon as they are found."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    def _run(self, text: str) -> list[Match]:
+        matcher = self.matcher
+        goto, fail, outputs = matcher._goto, matcher._fail, matcher._outputs
+        phrases, weights, lengths = matcher.phrases, matcher.weights, matcher._lengths
+        vocabulary = matcher._vocabulary
+        starts = self._starts
+        offset = self._offset
+        state = self._state
+        lowered = text.lower()
+        # Lowercasing can change the length of a few characters; fall back to
+        # lowering word by word so offsets stay exact.
+        exact = len(lowered) == len(text)
+        found: list[Match] = []
+        words = 0
+        for match in _WORD.finditer(lowered if exact else text):
+            word = match.group() if exact else match.group().lower()
+            words += 1
+            starts.append(offset + match.start())
+            if word not in vocabulary:
+                # No phrase uses the word: every partial match ends here.
+                state = 0
+                continue
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for ident in outputs[state]:
+                found.append(
+                    Match(starts[-lengths[ident]], offset + match.end(), phrases[ident], weights[ident])
+                )
+        self._state = state
+        self.words += words
+        self.weight += sum(match.weight for match in found)
+        return found
+
+    @property
+    def score(self) -> float:
+        """Matched weight per word so far, as :attr:`Scan.score`."""
+        return self.weight / self.words if self.words else 0.0
@@ -0,0 +1,89 @@
+"""Streaming fact loaders for JSONL, CSV and TSV dumps."""
+from __future__ import annotations
+
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+Fact = tuple[str, str]
+
+FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".tsv": "tsv"}
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def parse_json_fact(line: str | bytes) -> Fact | None:
+    """Parse one JSONL record into a fact, or None for blank lines.
+
+    Records are either ``{"subject": ..., "object": ...}`` objects or
+    two-element ``[subject, object]`` arrays of strings; anything else
+    raises ValueError.
+    """
+    if not line.strip():
+        return None
+    record = json.loads(line)
+    if isinstance(record, dict):
+        if "subject" not in record or "object" not in record:
+            raise ValueError("Fact objects need 'subject' and 'object' keys")
+        subject, obj = record["subject"], record["object"]
+    elif isinstance(record, list) and len(record) == 2:
+        subject, obj = record
+    else:
+        raise ValueError("Facts must be objects or [subject, object] arrays")
+    if not isinstance(subject, str) or not isinstance(obj, str):
+        raise ValueError("Fact subjects and objects must be strings")
+    return subject, obj
+
+
+def iter_fact_file(path: str | Path, fmt: str | None = None) -> Iterator[Fact]:
+    """Yield facts from ``path`` one at a time without reading it whole."""
+    path = Path(path)
+    fmt = fmt or FORMATS.get(path.suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Cannot infer fact format for {path}")
+    with path.open(encoding="utf-8", newline="") as handle:
+        if fmt == "jsonl":
+            for line in handle:
+                fact = parse_json_fact(line)
+                if fact is not None:
+                    yield fact
+            return
+        if fmt not in {"csv", "tsv"}:
+            raise ValueError(f"Unsupported fact format: {fmt}")
+        reader = csv.reader(handle, delimiter="," if fmt == "csv" else "\t")
+        for row_number, row in enumerate(reader):
+            if len(row) < 2:
+                continue
+            if row_number == 0 and [c.strip().lower() for c in row[:2]] == ["subject", "object"]:
+                continue
+            yield row[0], row[1]
+
+
+def batched(facts: Iterable[Fact], size: int = DEFAULT_BATCH_SIZE) -> Iterator[list[Fact]]:
+    """Group ``facts`` into lists of at most ``size`` items."""
+    iterator = iter(facts)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def load_facts(
+    engine,
+    path: str | Path,
+    fmt: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """Stream the facts in ``path`` into ``engine`` and return how many were new.
+
+    ``progress`` is called with the running number of records read after every
+    batch, so memory stays bounded by ``batch_size`` regardless of file size.
+    """
+    added = 0
+    seen = 0
+    for batch in batched(iter_fact_file(path, fmt), batch_size):
+        added += engine.add_facts(batch)
+        seen += len(batch)
+        if progress is not None:
+            progress(seen)
+    return added
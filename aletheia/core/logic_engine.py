@@ -1,33 +1,613 @@
 """Very small symbolic logic engine."""
 from __future__ import annotations
 
-from .symbol_table import SymbolTable
+import math
+import time
+from dataclasses import replace
+from typing import Callable, Iterable, Iterator
+
+from .aliases import AliasIndex
+from .closure import ClosureIndex
+from .conflicts import Conflict, ConflictIndex
+from .expiry import FactExpiry
+from .fuzzy import FuzzyIndex
+from .parser import (
+    DEFAULT_CACHE_SIZE,
+    Clause,
+    Conjunction,
+    Disjunction,
+    Expression,
+    StatementParser,
+    leaves,
+    normalize_term,
+    substitute,
+)
+from .planner import plan
+from .ranges import RangeIndex, attribute_of
+from .rules import Fact, Pattern, Rule, RuleEngine, is_variable, parse_rule
+from .symbol_table import InternTable, Symbol, SymbolTable
+from .verdict_cache import VerdictCache
 
 class LogicEngine:
-    """Evaluate the truthiness of statements using a symbol table."""
+    """Evaluate the truthiness of statements using a symbol table.
 
-    def __init__(self) -> None:
-        self.symbols = SymbolTable()
+    ``symbols`` may be any store with the :class:`SymbolTable` interface, such
+    as a :class:`~aletheia.core.persistent_store.PersistentSymbolTable`.
+    With ``transitive=True`` the ``is`` relation is treated as transitive, so
+    "socrates is man" and "man is mortal" also make "socrates is mortal" true.
+    Compound statements built with ``and``, ``or`` and parentheses are run in
+    the order chosen by :func:`~aletheia.core.planner.plan` and stop at the
+    first deciding term. A positive ``verdict_cache_size`` memoizes verdicts of compiled clauses
+    until a write touches their subject.
 
-    def add_fact(self, subject: str, obj: str) -> None:
-        """Record a true statement of the form `subject is obj`."""
-        self.symbols.add(subject.lower(), obj.lower())
+    Facts may carry a TTL, given per fact or per object with :meth:`set_ttl`.
+    A lapsed fact stops matching at once and is discarded from the store on
+    the next read after its timer-wheel tick; this needs a store with
+    ``discard_many`` and is not available together with ``transitive``.
 
-    def evaluate(self, statement: str) -> bool:
-        """Return True if the statement matches a known fact."""
-        if not statement:
+    Names declared equal with :meth:`add_alias` share one canonical name,
+    which both ingest and queries resolve to; stores that persist aliases
+    (``add_alias``/``aliases``) have them restored on construction.
+
+    A positive ``fuzzy_distance`` indexes every term for :meth:`match`, which
+    tolerates that many typos per term.
+
+    Rules added with :meth:`add_rule` run forward over a Rete network: each
+    write pushes only its new facts through it and stores what they derive.
+
+    Facts with a numeric object, such as "tower height is 330", are also kept
+    in a :class:`~aletheia.core.ranges.RangeIndex`, which answers comparison
+    clauses like "tower height is greater than 300" and :meth:`iter_range`.
+
+    Values declared mutually exclusive with :meth:`add_exclusion` are
+    checked on every write; contradicting facts are still stored but logged
+    in :attr:`conflicts`, which :meth:`iter_conflicts` reads.
+    """
+
+    def __init__(
+        self,
+        parse_cache_size: int = DEFAULT_CACHE_SIZE,
+        transitive: bool = False,
+        symbols: SymbolTable | None = None,
+        verdict_cache_size: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        fuzzy_distance: int = 0,
+    ) -> None:
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.expiry = FactExpiry(clock)
+        self.ttls: dict[str, float] = {}
+        self.aliases = AliasIndex()
+        self.rules = RuleEngine()
+        self.ranges = RangeIndex(lambda: ((fact.name, fact.value) for fact in self.symbols.facts()))
+        self.conflicts = ConflictIndex()
+        for alias, name in getattr(self.symbols, "aliases", tuple)():
+            self.aliases.union(alias, name)
+        self.parser = StatementParser(parse_cache_size)
+        self.verdicts = VerdictCache(verdict_cache_size) if verdict_cache_size > 0 else None
+        self.closure = ClosureIndex() if transitive else None
+        if self.closure is not None:
+            intern = self.symbols.intern
+            for fact in self.symbols.facts():
+                self.closure.add_edge(intern(fact.name), intern(fact.value))
+        self.fuzzy = FuzzyIndex(fuzzy_distance) if fuzzy_distance > 0 else None
+        if self.fuzzy is not None:
+            for fact in self.symbols.facts():
+                self.fuzzy.update((fact.name, fact.value))
+            for pair in self.aliases.pairs():
+                self.fuzzy.update(pair)
+
+    def set_ttl(self, obj: str, ttl: float | None) -> None:
+        """Make facts added later with object ``obj`` lapse after ``ttl`` seconds.
+
+        This gives a namespace such as a status value one lifetime; ``None``
+        makes new facts of it permanent again.
+        """
+        self._require_expiry()
+        if ttl is None:
+            self.ttls.pop(normalize_term(obj), None)
+        else:
+            self.ttls[normalize_term(obj)] = ttl
+
+    def _require_expiry(self) -> None:
+        if self.closure is not None:
+            raise ValueError("Expiring facts are not supported with transitive closure")
+        if not hasattr(self.symbols, "discard_many"):
+            raise ValueError("Expiring facts need a store that can discard facts")
+
+    def add_alias(self, alias: str, name: str) -> bool:
+        """Declare ``alias`` another name for ``name``; False if it already was.
+
+        Facts already stored under the absorbed name are moved to the
+        canonical one.
+        """
+        alias = normalize_term(alias)
+        name = normalize_term(name)
+        merged = self.aliases.union(alias, name)
+        if merged is None:
             return False
+        if hasattr(self.symbols, "add_alias"):
+            self.symbols.add_alias(alias, name)
+        if self.fuzzy is not None:
+            self.fuzzy.update((alias, name))
+        self.conflicts.alias(*merged)
+        self._fold(*merged)
+        if self.verdicts is not None:
+            self.verdicts.invalidate_all()
+        return True
+
+    def _fold(self, absorbed: str, canonical: str) -> None:
+        """Move the facts that mention ``absorbed`` over to ``canonical``."""
+        symbols = self.symbols
+        timed = self.ttls or self.expiry
+        if self.expiry:
+            # Lapsed facts are reclaimed, not moved.
+            self._reap()
+        old = [(absorbed, obj) for obj in symbols.objects(absorbed)]
+        old += [(subject, absorbed) for subject in symbols.subjects(absorbed) if subject != absorbed]
+        if not old:
+            return
+        deadlines = self._moved_deadlines(old) if timed else {}
+        # Untrack first, so the moved facts do not contradict their old names.
+        self.conflicts.discard(old)
+        self.add_normalized(old)
+        discard = getattr(symbols, "discard_many", None)
+        if discard is not None:
+            discard(old)
+            self.ranges.discard(old)
+            self.rules.retract(old)
+        if timed:
+            # Moving a fact does not renew it: it keeps the deadline it had.
+            ids = symbols.id_of
+            self.expiry.clear((ids(subject), ids(obj)) for subject, obj in old)
+            self.expiry.clear(
+                (ids(subject), ids(obj)) for (subject, obj), deadline in deadlines.items() if deadline is None
+            )
+            for (subject, obj), deadline in deadlines.items():
+                if deadline is not None:
+                    self.expiry.set_until(((ids(subject), ids(obj)),), deadline)
+
+    def _moved_deadlines(self, old: list[tuple[str, str]]) -> dict[tuple[str, str], float | None]:
+        """Return the deadline each fact moved by :meth:`_fold` keeps, None if permanent.
+
+        A fact that lands on one already stored, or on another moved one,
+        lives as long as the longer-lived of them.
+        """
+        symbols = self.symbols
+        ids = symbols.id_of
+        deadline_of = self.expiry.deadline
+        canonical = self.aliases.canonical
+        deadlines: dict[tuple[str, str], float | None] = {}
+        for subject, obj in old:
+            deadline = deadline_of(ids(subject), ids(obj))
+            moved = (canonical(subject), canonical(obj))
+            if moved in deadlines:
+                other = deadlines[moved]
+            elif symbols.has(*moved):
+                other = deadline_of(ids(moved[0]), ids(moved[1]))
+            else:
+                other = deadline
+            deadlines[moved] = None if deadline is None or other is None else max(deadline, other)
+        return deadlines
+
+    def add_rule(self, text: str, name: str | None = None) -> int:
+        """Compile an ``if ... then ...`` rule and return how many facts it derived.
+
+        Facts already stored are matched once when the rule is added; from
+        then on only new facts are propagated.
+        """
+        if self.expiry:
+            self._reap()
+        return self._derive(self.rules.add(self._parse_rule(text, name), self._matching))
+
+    def _parse_rule(self, text: str, name: str | None = None) -> Rule:
+        """Parse a rule and resolve its constants through the aliases."""
+        rule = parse_rule(text, name)
+        if not self.aliases:
+            return rule
+        canonical = self.aliases.canonical
+        return replace(
+            rule,
+            conditions=tuple(
+                Pattern(canonical(pattern.subject), canonical(pattern.object))
+                for pattern in rule.conditions
+            ),
+            conclusion=Pattern(canonical(rule.conclusion.subject), canonical(rule.conclusion.object)),
+        )
+
+    def add_exclusion(self, values: Iterable[str], name: str | None = None) -> int:
+        """Declare ``values`` mutually exclusive and return how many conflicts stored facts hold.
+
+        From then on every write is checked against the values its subject
+        already holds, and each contradiction is logged; ``name`` labels the
+        constraint in the log.
+        """
+        canonical = self.aliases.canonical
+        values = [canonical(normalize_term(value)) for value in values]
+        self.conflicts.declare(values, name)
+        existing = [
+            (subject, value) for value in dict.fromkeys(values) for subject in self.symbols.subjects(value)
+        ]
+        return len(self._contradictions(existing))
+
+    def _contradictions(self, facts: Iterable[tuple[str, str]]) -> list[Conflict]:
+        """Check facts just written against the exclusivity constraints and log conflicts."""
+        if self.expiry:
+            # Untrack lapsed values so that renewing one is checked again.
+            self._reap()
+        conflicts = self.conflicts.check(facts)
+        if conflicts and self.expiry:
+            conflicts = [conflict for conflict in conflicts if self.holds(conflict.subject, conflict.existing)]
+        self.conflicts.record(conflicts)
+        return conflicts
+
+    def iter_conflicts(self, cursor: str | None = None) -> Iterator[tuple[Conflict, str]]:
+        """Yield ``(conflict, cursor)`` for the conflicts logged after ``cursor``."""
+        return self.conflicts.since(cursor)
+
+    def wait_for_conflicts(self, cursor: str | None, timeout: float) -> bool:
+        """Block until a conflict after ``cursor`` is logged; False after ``timeout`` seconds."""
+        return self.conflicts.wait(cursor, timeout)
+
+    def materialize(self, rules: Iterable[str]) -> int:
+        """Derive every consequence of ``rules`` over the stored facts in one batch.
+
+        Meant for bulk loads: instead of registering the rules with
+        :meth:`add_rule` and pushing facts one by one through the Rete
+        network, the whole store is evaluated with semi-naive Datalog over
+        NumPy arrays. The rules are not kept afterwards. Return how many new
+        facts were stored.
+        """
+        import numpy as np
+
+        from .datalog import materialize
+
+        parsed = [self._parse_rule(text) for text in rules]
+        interner = InternTable()
+        intern = interner.intern
+        keys = np.fromiter(
+            (intern(fact.name) << 32 | intern(fact.value) for fact in self.facts()), dtype=np.int64
+        )
+        derived, _ = materialize(keys, parsed, interner.id_of, intern)
+        names = interner.names
+        return self._derive(
+            [(names[key >> 32], names[key & 0xFFFFFFFF]) for key in derived.tolist()]
+        )
+
+    def _matching(self, pattern: Pattern) -> Iterator[Fact]:
+        """Yield the stored facts that could match ``pattern``."""
+        if not is_variable(pattern.subject):
+            facts = ((pattern.subject, obj) for obj in self.symbols.objects(pattern.subject))
+        elif not is_variable(pattern.object):
+            facts = ((subject, pattern.object) for subject in self.symbols.subjects(pattern.object))
+        else:
+            facts = ((fact.name, fact.value) for fact in self.symbols.facts())
+        if not self.expiry:
+            return facts
+        return (fact for fact in facts if not self._lapsed(*fact))
+
+    def _lapsed(self, subject: str, obj: str) -> bool:
+        """Return True if a stored fact's deadline passed, even if it is not reaped yet."""
+        id_of = self.symbols.id_of
+        return self.expiry.expired(id_of(subject), id_of(obj))
 
-        normalized = statement.strip().lower()
-        if not normalized.endswith("."):
+    def _derive(self, derived: list[Fact]) -> int:
+        """Store facts derived by rules and return how many were new."""
+        if not derived:
+            return 0
+        added = self.add_normalized(derived)
+        self.rules.derived += added
+        return added
+
+    def add_fact(self, subject: str, obj: str, ttl: float | None = None) -> None:
+        """Record a true statement of the form `subject is obj`.
+
+        ``ttl`` makes the fact lapse after that many seconds, overriding any
+        TTL set for its object.
+        """
+        self._add(normalize_term(subject), normalize_term(obj), ttl)
+
+    def add_facts(self, facts: Iterable[tuple[str, str]], ttl: float | None = None) -> int:
+        """Record a batch of facts and return how many were new."""
+        return self.add_normalized(
+            ((normalize_term(subject), normalize_term(obj)) for subject, obj in facts), ttl
+        )
+
+    def add_normalized(self, facts: Iterable[tuple[str, str]], ttl: float | None = None) -> int:
+        """Record facts whose terms are already normalized, e.g. from a snapshot."""
+        if self.aliases:
+            canonical = self.aliases.canonical
+            facts = ((canonical(subject), canonical(obj)) for subject, obj in facts)
+        if self.closure is None:
+            timed = ttl is not None or self.ttls or self.expiry
+            if (
+                self.verdicts is None and self.fuzzy is None
+                and not self.rules and not self.conflicts and not timed
+            ):
+                return self.symbols.add_many(self.ranges.track(facts))
+            if ttl is not None:
+                self._require_expiry()
+            facts = list(self.ranges.track(facts))
+            added = self.symbols.add_many(facts)
+            if self.fuzzy is not None:
+                for fact in facts:
+                    self.fuzzy.update(fact)
+            if timed:
+                self._stamp(facts, ttl)
+            if self.conflicts:
+                self._contradictions(facts)
+            if self.verdicts is not None:
+                # Invalidate after the batch is visible: a reader that read the
+                # previous version then sees its stamp move and drops its verdict.
+                for subject, _ in facts:
+                    self.verdicts.invalidate(subject)
+            if self.rules:
+                if self.expiry:
+                    # Lapsed premises must not join with the new facts.
+                    self._reap()
+                self._derive(self.rules.propagate(facts))
+            return added
+        return sum(self._add(subject, obj, ttl) for subject, obj in facts)
+
+    def _stamp(self, facts: Iterable[tuple[str, str]], ttl: float | None) -> None:
+        """Set, renew or clear the deadlines of facts that were just written."""
+        ids = self.symbols.id_of
+        timed: dict[float, list[tuple[int, int]]] = {}
+        permanent: list[tuple[int, int]] = []
+        for subject, obj in facts:
+            lifetime = self.ttls.get(obj) if ttl is None else ttl
+            pair = (ids(subject), ids(obj))
+            if lifetime is None:
+                permanent.append(pair)
+            else:
+                timed.setdefault(lifetime, []).append(pair)
+        for lifetime, pairs in timed.items():
+            self.expiry.set(pairs, lifetime)
+        if permanent and self.expiry:
+            self.expiry.clear(permanent)
+
+    def _reap(self) -> None:
+        """Discard facts whose deadline has passed from the store."""
+        lapsed = self.expiry.reap()
+        if not lapsed:
+            return
+        names = self.symbols.interner.names
+        facts = [(names[subject], names[obj]) for subject, obj in lapsed]
+        self.symbols.discard_many(facts)
+        self.ranges.discard(facts)
+        self.conflicts.discard(facts)
+        self.rules.retract(facts)
+        if self.verdicts is not None:
+            for subject, _ in facts:
+                self.verdicts.invalidate(subject)
+
+    def _add(self, subject: str, obj: str, ttl: float | None = None) -> bool:
+        if self.aliases:
+            subject = self.aliases.canonical(subject)
+            obj = self.aliases.canonical(obj)
+        if ttl is not None:
+            self._require_expiry()
+        added = self.symbols.add(subject, obj)
+        self.ranges.add(subject, obj)
+        if added and self.fuzzy is not None:
+            self.fuzzy.update((subject, obj))
+        if ttl is not None or self.ttls or self.expiry:
+            self._stamp(((subject, obj),), ttl)
+            if not added and self.verdicts is not None:
+                # Renewing a lapsed fact revives it.
+                self.verdicts.invalidate(subject)
+        if self.conflicts:
+            self._contradictions(((subject, obj),))
+        if not added:
             return False
-        normalized = normalized[:-1].strip()
+        if self.closure is not None:
+            self.closure.add_edge(self.symbols.id_of(subject), self.symbols.id_of(obj))
+        if self.verdicts is not None:
+            # A new edge can change verdicts for everything below its subject.
+            if self.closure is not None:
+                self.verdicts.invalidate_all()
+            else:
+                self.verdicts.invalidate(subject)
+        if self.rules:
+            if self.expiry:
+                self._reap()
+            self._derive(self.rules.propagate([(subject, obj)]))
+        return True
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every stored fact."""
+        if not self.expiry:
+            return self.symbols.facts()
+        self._reap()
+        return (fact for fact in self.symbols.facts() if not self._lapsed(fact.name, fact.value))
+
+    def iter_objects(self, subject: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(object, cursor)`` pairs recorded for ``subject``."""
+        subject = self.aliases.canonical(normalize_term(subject))
+        if not self.expiry:
+            return self.symbols.snapshot().iter_objects(subject, cursor)
+        self._reap()
+        pairs = self.symbols.snapshot().iter_objects(subject, cursor)
+        return (pair for pair in pairs if not self._lapsed(subject, pair[0]))
+
+    def iter_subjects(self, obj: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` pairs that have ``obj`` recorded."""
+        obj = self.aliases.canonical(normalize_term(obj))
+        if not self.expiry:
+            return self.symbols.snapshot().iter_subjects(obj, cursor)
+        self._reap()
+        pairs = self.symbols.snapshot().iter_subjects(obj, cursor)
+        return (pair for pair in pairs if not self._lapsed(pair[0], obj))
+
+    def iter_range(
+        self,
+        attribute: str,
+        low: float | None = None,
+        high: float | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[tuple[str, float, str]]:
+        """Lazily yield ``(entity, value, cursor)`` for each ``entity attribute`` fact in range.
+
+        Bounds are inclusive and either may be omitted; entities come in
+        value order, read from one snapshot of the store.
+        """
+        if self.expiry:
+            self._reap()
+        entries = self.ranges.scan(
+            normalize_term(attribute),
+            -math.inf if low is None else low,
+            math.inf if high is None else high,
+            cursor,
+        )
+        return self._confirmed(entries, self.symbols.snapshot())
+
+    def _confirmed(
+        self, entries: Iterator[tuple[float, str, str, str]], symbols: SymbolTable
+    ) -> Iterator[tuple[str, float, str]]:
+        for value, subject, obj, position in entries:
+            if self.holds(subject, obj, symbols):
+                yield attribute_of(subject)[0], value, position
+
+    def compare(
+        self, subject: str, relation: str, operand: str, symbols: SymbolTable | None = None
+    ) -> bool:
+        """Return True if a numeric value of ``subject`` satisfies a comparison.
+
+        ``relation`` and ``operand`` are as parsed, e.g. ``"is between"`` and
+        ``"100 and 200"``.
+        """
+        subject = self.aliases.canonical(subject)
+        return any(
+            self.holds(subject, obj, symbols)
+            for obj in self.ranges.candidates(subject, relation, operand)
+        )
+
+    def _verify(self, clause: Clause, symbols: SymbolTable) -> bool:
+        """Return True if ``clause`` holds, ignoring its negation."""
+        if clause.relation == "is":
+            return self.holds(clause.subject, clause.object, symbols)
+        return self.compare(clause.subject, clause.relation, clause.object, symbols)
+
+    def holds(self, subject: str, obj: str, symbols: SymbolTable | None = None) -> bool:
+        """Return True if ``subject is obj`` is asserted or, if enabled, implied.
+
+        ``symbols`` pins the lookup to a snapshot of the store.
+        """
+        if symbols is None:
+            symbols = self.symbols
+        if self.aliases:
+            subject = self.aliases.canonical(subject)
+            obj = self.aliases.canonical(obj)
+        if symbols.has(subject, obj):
+            if not self.expiry:
+                return True
+            return not self.expiry.expired(symbols.id_of(subject), symbols.id_of(obj))
+        if self.closure is None:
+            return False
+        source = symbols.id_of(subject)
+        target = symbols.id_of(obj)
+        return source is not None and target is not None and self.closure.reaches(source, target)
+
+    def parse(self, statement: str) -> Expression | None:
+        """Compile a statement into an expression, using the parse cache."""
+        return self.parser.parse(statement)
+
+    def check(self, clause: Expression | None, symbols: SymbolTable | None = None) -> bool:
+        """Return the verdict for an already compiled expression."""
+        if clause is None:
+            return False
+        if symbols is None:
+            symbols = self.symbols.snapshot()
+        if clause.__class__ is not Clause:
+            return self._check_compound(clause, symbols)
+        if self.verdicts is None or symbols is not self.symbols.snapshot():
+            # Cached verdicts describe the latest version only.
+            return self._verify(clause, symbols) is not clause.negated
+        # Writes invalidate canonical subjects, so verdicts are filed under them.
+        subject = self.aliases.canonical(clause.subject)
+        if self.expiry and self.expiry.covers(symbols.id_of(subject)):
+            # A cached verdict cannot notice a deadline passing.
+            return self._verify(clause, symbols) is not clause.negated
+        verdict, stamp = self.verdicts.lookup(clause, subject)
+        if verdict is None:
+            verdict = self._verify(clause, symbols) is not clause.negated
+            # Writers publish before they invalidate: if no newer version was
+            # published before the stamp was taken, any write the verdict
+            # missed has moved the stamp and put drops it.
+            if symbols is self.symbols.snapshot():
+                self.verdicts.put(clause, subject, verdict, stamp)
+        return verdict
+
+    def _check_compound(self, expression: Conjunction | Disjunction, symbols: SymbolTable) -> bool:
+        deciding = expression.__class__ is Disjunction
+        for term, _, _ in plan(expression, symbols):
+            if self.check(term, symbols) is deciding:
+                return deciding
+        return not deciding
+
+    def match(self, statement: str) -> tuple[bool, Expression | None]:
+        """Evaluate ``statement`` tolerating typos in its terms.
+
+        Each clause that does not hold as written is replaced by the closest
+        stored fact whose subject and object are within the fuzzy distance.
+        Return the verdict and the statement as matched, in canonical terms,
+        or ``(False, None)`` if it does not parse.
+        """
+        if self.fuzzy is None:
+            raise ValueError("Fuzzy matching is disabled; pass a positive fuzzy_distance")
+        expression = self.parser.parse(statement)
+        if expression is None:
+            return False, None
+        if self.expiry:
+            self._reap()
+        symbols = self.symbols.snapshot()
+        matched = substitute(
+            expression, {clause: self._nearest(clause, symbols) for clause in leaves(expression)}
+        )
+        return self.check(matched, symbols), matched
+
+    def _nearest(self, clause: Clause, symbols: SymbolTable) -> Clause:
+        """Return the closest clause to ``clause`` that names a stored fact."""
+        if clause.relation != "is":
+            # Only the subject of a comparison can be misspelt.
+            for subject, _ in self.fuzzy.lookup(clause.subject):
+                if self.compare(subject, clause.relation, clause.object, symbols):
+                    return replace(clause, subject=self.aliases.canonical(subject))
+            return clause
+        if self.holds(clause.subject, clause.object, symbols):
+            best = (0, clause.subject, clause.object)
+        else:
+            best = None
+            objects = self.fuzzy.lookup(clause.object)
+            for subject, near in self.fuzzy.lookup(clause.subject):
+                for obj, far in objects:
+                    if best is not None and near + far >= best[0]:
+                        break
+                    if self.holds(subject, obj, symbols):
+                        best = (near + far, subject, obj)
+            if best is None:
+                return clause
+        canonical = self.aliases.canonical
+        return Clause(canonical(best[1]), clause.relation, canonical(best[2]), clause.negated)
+
+    def evaluate(self, statement: str) -> bool:
+        """Return True if the statement matches a known fact."""
+        if self.expiry:
+            self._reap()
+        return self.check(self.parser.parse(statement))
 
-        if " is not " in normalized:
-            subj, obj = normalized.split(" is not ", 1)
-            return not self.symbols.has(subj.strip(), obj.strip())
-        if " is " in normalized:
-            subj, obj = normalized.split(" is ", 1)
-            return self.symbols.has(subj.strip(), obj.strip())
+    def evaluate_many(self, statements: Iterable[str]) -> list[bool]:
+        """Evaluate a batch of statements, returning verdicts in order.
 
-        return False
\ No newline at end of file
+        Repeated statements are parsed and looked up only once, and the whole
+        batch reads from a single snapshot of the store.
+        """
+        statements = list(statements)
+        if self.expiry:
+            self._reap()
+        parse = self.parser.parse
+        check = self.check
+        symbols = self.symbols.snapshot()
+        verdicts = {
+            statement: check(parse(statement), symbols) for statement in dict.fromkeys(statements)
+        }
+        return [verdicts[statement] for statement in statements]
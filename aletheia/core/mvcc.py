@@ -0,0 +1,357 @@
+"""Multi-version fact store giving readers consistent, lock-free snapshots."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from heapq import merge
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Iterator, Union
+from weakref import WeakSet
+
+from .symbol_table import (
+    INTERN_TABLE,
+    POSTING_TYPECODE,
+    InternTable,
+    Postings,
+    Symbol,
+    _contains,
+    _cursor_id,
+    _discard,
+    _insert,
+    _items,
+    _removals,
+    _size,
+)
+
+DEFAULT_MAX_LAYERS = 16
+
+
+class _Patched:
+    """Read-only index sharing a base dict, with some postings replaced.
+
+    Discarding facts from a published layer records the rebuilt postings
+    here (``None`` for removed keys) instead of copying the whole dict; the
+    patch is folded away when the layer is merged or it grows too large.
+    """
+
+    __slots__ = ("base", "patch")
+
+    def __init__(self, base: dict[int, Postings], patch: dict[int, Postings | None]) -> None:
+        self.base = base
+        self.patch = patch
+
+    def get(self, key: int | None, default: Postings | None = None) -> Postings | None:
+        patch = self.patch
+        if key in patch:
+            postings = patch[key]
+            return default if postings is None else postings
+        return self.base.get(key, default)
+
+    def items(self) -> Iterator[tuple[int, Postings]]:
+        patch = self.patch
+        for key, postings in self.base.items():
+            if key in patch:
+                postings = patch[key]
+                if postings is None:
+                    continue
+            yield key, postings
+
+
+Index = Union[dict[int, Postings], _Patched]
+
+
+def _plain(index: Index) -> dict[int, Postings]:
+    return index if index.__class__ is dict else dict(index.items())
+
+
+def _patched(index: Index, removals: dict[int, set[int]]) -> Index:
+    """Return ``index`` without ``removals``, sharing every untouched postings."""
+    touched = {key: index.get(key) for key in removals}
+    _discard(touched, removals, in_place=False)
+    if index.__class__ is dict:
+        base, patch = index, {}
+    else:
+        base, patch = index.base, dict(index.patch)
+    for key in removals:
+        patch[key] = touched.get(key)
+    if len(patch) * 4 > len(base):
+        return _plain(_Patched(base, patch))
+    return _Patched(base, patch)
+
+
+class Layer:
+    """Immutable batch of facts indexed in both directions."""
+
+    __slots__ = ("objects", "subjects", "size")
+
+    def __init__(self, objects: Index, subjects: Index, size: int) -> None:
+        self.objects = objects
+        self.subjects = subjects
+        self.size = size
+
+
+def _union(first: Postings, second: Postings) -> Postings:
+    merged = sorted(set(_items(first)).union(_items(second)))
+    return merged[0] if len(merged) == 1 else array(POSTING_TYPECODE, merged)
+
+
+def _merge_index(first: Index, second: Index) -> dict[int, Postings]:
+    first, second = _plain(first), _plain(second)
+    if len(first) > len(second):
+        first, second = second, first
+    merged = dict(second)
+    for key, postings in first.items():
+        existing = merged.get(key)
+        merged[key] = postings if existing is None else _union(existing, postings)
+    return merged
+
+
+def _merge(newer: Layer, older: Layer) -> Layer:
+    return Layer(
+        _merge_index(newer.objects, older.objects),
+        _merge_index(newer.subjects, older.subjects),
+        newer.size + older.size,
+    )
+
+
+class Snapshot:
+    """One published version of a :class:`VersionedSymbolTable`.
+
+    A snapshot is a tuple of immutable layers, newest first, so it never
+    changes once published and can be read from any thread without locks.
+    """
+
+    __slots__ = ("version", "layers", "interner", "_count", "__weakref__")
+
+    def __init__(self, version: int, layers: tuple[Layer, ...], interner: InternTable) -> None:
+        self.version = version
+        self.layers = layers
+        self.interner = interner
+        self._count = sum(layer.size for layer in layers)
+
+    def __len__(self) -> int:
+        """Return the number of facts visible in this version."""
+        return self._count
+
+    def snapshot(self) -> Snapshot:
+        """Return this snapshot; it is already immutable."""
+        return self
+
+    def intern(self, name: str) -> int:
+        """Return the integer id for ``name``, assigning one if needed."""
+        return self.interner.intern(name)
+
+    def id_of(self, name: str) -> int | None:
+        """Return the integer id for ``name`` without interning it."""
+        return self.interner.id_of(name)
+
+    def _has_ids(self, subject: int, obj: int) -> bool:
+        for layer in self.layers:
+            postings = layer.objects.get(subject)
+            if postings is not None and _contains(postings, obj):
+                return True
+        return False
+
+    def has(self, name: str, value: str) -> bool:
+        """Return True if this version holds the given mapping."""
+        subject = self.interner.id_of(name)
+        obj = self.interner.id_of(value)
+        return subject is not None and obj is not None and self._has_ids(subject, obj)
+
+    def _lookup(self, attribute: str, ident: int | None) -> list[str]:
+        if ident is None:
+            return []
+        names = self.interner.names
+        found: list[str] = []
+        for layer in self.layers:
+            found.extend(names[item] for item in _items(getattr(layer, attribute).get(ident)))
+        return found
+
+    def get(self, name: str) -> str | None:
+        """Retrieve one value recorded for ``name``."""
+        found = self.objects(name)
+        return found[0] if found else None
+
+    def objects(self, name: str) -> list[str]:
+        """Return every value recorded for the subject ``name``."""
+        return self._lookup("objects", self.interner.id_of(name))
+
+    def subjects(self, value: str) -> list[str]:
+        """Return every subject that has ``value`` recorded."""
+        return self._lookup("subjects", self.interner.id_of(value))
+
+    def iter_objects(self, name: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(value, cursor)`` for the subject ``name`` in id order."""
+        return self._scan("objects", self.interner.id_of(name), cursor)
+
+    def iter_subjects(self, value: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` for the object ``value`` in id order."""
+        return self._scan("subjects", self.interner.id_of(value), cursor)
+
+    def _scan(self, attribute: str, ident: int | None, cursor: str | None) -> Iterator[tuple[str, str]]:
+        after = _cursor_id(cursor)
+        streams = []
+        for layer in self.layers:
+            items = _items(getattr(layer, attribute).get(ident))
+            streams.append(islice(items, bisect_right(items, after), None))
+        names = self.interner.names
+        return ((names[item], str(item)) for item in merge(*streams))
+
+    def count_objects(self, name: str) -> int:
+        """Return how many values are recorded for the subject ``name``."""
+        subject = self.interner.id_of(name)
+        return sum(_size(layer.objects.get(subject)) for layer in self.layers)
+
+    def count_subjects(self, value: str) -> int:
+        """Return how many subjects have ``value`` recorded."""
+        obj = self.interner.id_of(value)
+        return sum(_size(layer.subjects.get(obj)) for layer in self.layers)
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every fact visible in this version."""
+        names = self.interner.names
+        for layer in self.layers:
+            for subject, postings in layer.objects.items():
+                for obj in _items(postings):
+                    yield Symbol(names[subject], names[obj])
+
+
+class VersionedSymbolTable:
+    """Symbol table with multi-version concurrency control.
+
+    Every write call builds a new immutable layer and publishes a new
+    :class:`Snapshot` by swapping one reference, so a batch passed to
+    :meth:`add_many` becomes visible all at once or not at all. Readers call
+    :meth:`snapshot` (or any read method, which uses the latest snapshot) and
+    never block. Layers are merged pairwise as they grow, keeping the number of
+    layers logarithmic, and a superseded snapshot is freed as soon as the last
+    reader holding it lets go.
+    """
+
+    def __init__(self, interner: InternTable | None = None, max_layers: int = DEFAULT_MAX_LAYERS) -> None:
+        self.interner = interner if interner is not None else INTERN_TABLE
+        self.max_layers = max_layers
+        self._write_lock = Lock()
+        self._head = Snapshot(0, (), self.interner)
+        self._published: WeakSet[Snapshot] = WeakSet([self._head])
+
+    def __len__(self) -> int:
+        """Return the number of facts in the latest version."""
+        return len(self._head)
+
+    def snapshot(self) -> Snapshot:
+        """Return the latest published version."""
+        return self._head
+
+    def intern(self, name: str) -> int:
+        """Return the integer id for ``name``, assigning one if needed."""
+        return self.interner.intern(name)
+
+    def id_of(self, name: str) -> int | None:
+        """Return the integer id for ``name`` without interning it."""
+        return self.interner.id_of(name)
+
+    def add(self, name: str, value: str) -> bool:
+        """Publish a version containing one more fact; False if already known."""
+        return self.add_many([(name, value)]) == 1
+
+    def add_many(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Publish every new fact of the batch as one atomic version."""
+        intern = self.interner.intern
+        with self._write_lock:
+            head = self._head
+            objects: dict[int, Postings] = {}
+            subjects: dict[int, Postings] = {}
+            added = 0
+            for name, value in facts:
+                subject = intern(name)
+                obj = intern(value)
+                if head._has_ids(subject, obj) or not _insert(objects, subject, obj):
+                    continue
+                _insert(subjects, obj, subject)
+                added += 1
+            if added:
+                self._publish(Layer(objects, subjects, added))
+            return added
+
+    def discard_many(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Publish a version without the given facts; return how many were present.
+
+        Layers holding a removed fact are replaced by views that share their
+        dicts and override only the touched postings, so older snapshots keep
+        their data and a discard costs what it removes, not the layer size.
+        """
+        facts = list(facts)
+        with self._write_lock:
+            layers = []
+            removed = 0
+            for layer in self._head.layers:
+                by_subject, by_object = _removals(layer.objects, self.interner, facts)
+                if by_subject:
+                    count = sum(len(items) for items in by_subject.values())
+                    layer = Layer(
+                        _patched(layer.objects, by_subject),
+                        _patched(layer.subjects, by_object),
+                        layer.size - count,
+                    )
+                    removed += count
+                if layer.size:
+                    layers.append(layer)
+            if removed:
+                self._head = Snapshot(self._head.version + 1, tuple(layers), self.interner)
+                self._published.add(self._head)
+            return removed
+
+    def _publish(self, layer: Layer) -> None:
+        layers = [layer, *self._head.layers]
+        while len(layers) > 1 and (
+            layers[0].size * 2 >= layers[1].size or len(layers) > self.max_layers
+        ):
+            layers[0:2] = [_merge(layers[0], layers[1])]
+        self._head = Snapshot(self._head.version + 1, tuple(layers), self.interner)
+        self._published.add(self._head)
+
+    def has(self, name: str, value: str) -> bool:
+        """Return True if the latest version holds the given mapping."""
+        return self._head.has(name, value)
+
+    def get(self, name: str) -> str | None:
+        """Retrieve one value recorded for ``name``."""
+        return self._head.get(name)
+
+    def objects(self, name: str) -> list[str]:
+        """Return every value recorded for the subject ``name``."""
+        return self._head.objects(name)
+
+    def subjects(self, value: str) -> list[str]:
+        """Return every subject that has ``value`` recorded."""
+        return self._head.subjects(value)
+
+    def iter_objects(self, name: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(value, cursor)`` from the latest version."""
+        return self._head.iter_objects(name, cursor)
+
+    def iter_subjects(self, value: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` from the latest version."""
+        return self._head.iter_subjects(value, cursor)
+
+    def count_objects(self, name: str) -> int:
+        """Return how many values are recorded for the subject ``name``."""
+        return self._head.count_objects(name)
+
+    def count_subjects(self, value: str) -> int:
+        """Return how many subjects have ``value`` recorded."""
+        return self._head.count_subjects(value)
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every fact of the latest version."""
+        return self._head.facts()
+
+    def stats(self) -> dict[str, int]:
+        """Return the current version, its layer count and live versions."""
+        return {
+            "version": self._head.version,
+            "layers": len(self._head.layers),
+            "live_versions": len(self._published),
+        }
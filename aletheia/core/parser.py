@@ -0,0 +1,252 @@
+"""Tokenizer and parser compiling statements into clause ASTs.
+
+Grammar, lowest precedence first::
+
+    expression  := conjunction ("or" conjunction)*
+    conjunction := atom ("and" atom)*
+    atom        := "(" expression ")" | clause
+    clause      := words "is" ["not"] (comparison | words)
+    comparison  := ("greater than" | "less than" | "at least" | "at most") number
+                 | "between" number "and" number
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Union
+
+DEFAULT_CACHE_SIZE = 4096
+CONNECTIVES = frozenset({"and", "or", "(", ")"})
+COMPARISONS = frozenset({"greater than", "less than", "at least", "at most"})
+_TOKEN = re.compile(r"[()]|[^\s()]+")
+NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+
+@dataclass(frozen=True)
+class Clause:
+    """A compiled ``subject relation object`` statement."""
+
+    subject: str
+    relation: str
+    object: str
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class Conjunction:
+    """Statement true when every term is true."""
+
+    terms: tuple[Expression, ...]
+
+
+@dataclass(frozen=True)
+class Disjunction:
+    """Statement true when any term is true."""
+
+    terms: tuple[Expression, ...]
+
+
+Expression = Union[Clause, Conjunction, Disjunction]
+
+
+class ParseError(ValueError):
+    """Raised when tokens do not form a compound statement."""
+
+
+def normalize_term(text: str) -> str:
+    """Lowercase ``text`` and collapse its whitespace into single spaces."""
+    return " ".join(text.lower().split())
+
+
+def is_number(token: str) -> bool:
+    """Return True if ``token`` is a plain decimal number such as ``-3.5``."""
+    return NUMBER.fullmatch(token) is not None
+
+
+def _body(statement: str) -> str | None:
+    """Return the lowercase statement without its final period, or None if unterminated."""
+    if not statement:
+        return None
+    normalized = statement.strip().lower()
+    if not normalized.endswith("."):
+        return None
+    return normalized[:-1]
+
+
+def tokenize(statement: str) -> list[str] | None:
+    """Split a statement into lowercase tokens, or None if unterminated."""
+    body = _body(statement)
+    if body is None:
+        return None
+    if "(" in body or ")" in body:
+        return _TOKEN.findall(body)
+    return body.split()
+
+
+def _comparison(tokens: list[str]) -> tuple[str, str]:
+    """Return the relation and object for the tokens after ``is [not]``."""
+    if len(tokens) == 3 and is_number(tokens[2]) and f"{tokens[0]} {tokens[1]}" in COMPARISONS:
+        return f"is {tokens[0]} {tokens[1]}", tokens[2]
+    if (
+        len(tokens) == 4
+        and tokens[0] == "between"
+        and tokens[2] == "and"
+        and is_number(tokens[1])
+        and is_number(tokens[3])
+    ):
+        return "is between", f"{tokens[1]} and {tokens[3]}"
+    return "is", " ".join(tokens)
+
+
+def parse_tokens(tokens: list[str]) -> Clause | None:
+    """Build a clause from tokens, preferring the first ``is not`` relation."""
+    pivot = None
+    for index in range(1, len(tokens) - 2):
+        if tokens[index] == "is" and tokens[index + 1] == "not":
+            pivot = index
+            break
+    if pivot is not None:
+        return Clause(" ".join(tokens[:pivot]), *_comparison(tokens[pivot + 2:]), True)
+    for index in range(1, len(tokens) - 1):
+        if tokens[index] == "is":
+            return Clause(" ".join(tokens[:index]), *_comparison(tokens[index + 1:]))
+    return None
+
+
+def _bounds_and(tokens: list[str], pos: int) -> bool:
+    """Return True if the ``and`` at ``pos`` joins the bounds of ``between``."""
+    return (
+        tokens[pos] == "and"
+        and 2 <= pos < len(tokens) - 1
+        and tokens[pos - 2] == "between"
+        and is_number(tokens[pos - 1])
+        and is_number(tokens[pos + 1])
+    )
+
+
+def _parse_expression(tokens: list[str], pos: int) -> tuple[Expression, int]:
+    terms = []
+    while True:
+        term, pos = _parse_conjunction(tokens, pos)
+        terms.append(term)
+        if pos < len(tokens) and tokens[pos] == "or":
+            pos += 1
+            continue
+        return (terms[0] if len(terms) == 1 else Disjunction(tuple(terms))), pos
+
+
+def _parse_conjunction(tokens: list[str], pos: int) -> tuple[Expression, int]:
+    terms = []
+    while True:
+        term, pos = _parse_atom(tokens, pos)
+        terms.append(term)
+        if pos < len(tokens) and tokens[pos] == "and":
+            pos += 1
+            continue
+        return (terms[0] if len(terms) == 1 else Conjunction(tuple(terms))), pos
+
+
+def _parse_atom(tokens: list[str], pos: int) -> tuple[Expression, int]:
+    if pos < len(tokens) and tokens[pos] == "(":
+        term, pos = _parse_expression(tokens, pos + 1)
+        if pos >= len(tokens) or tokens[pos] != ")":
+            raise ParseError("Unbalanced parentheses")
+        return term, pos + 1
+    start = pos
+    while pos < len(tokens) and (tokens[pos] not in CONNECTIVES or _bounds_and(tokens, pos)):
+        pos += 1
+    clause = parse_tokens(tokens[start:pos])
+    if clause is None:
+        raise ParseError(f"Not a clause: {' '.join(tokens[start:pos])!r}")
+    return clause, pos
+
+
+def parse_expression(tokens: list[str], words: list[str] | None = None) -> Expression | None:
+    """Build an expression tree from tokens.
+
+    Statements that do not split into valid clauses around ``and``/``or``
+    fall back to a single clause, so "salt and pepper is tasty." keeps
+    "salt and pepper" as its subject. The fallback reads ``words``, the
+    statement split on whitespace only, so that terms such as "f(x)" keep
+    their parentheses; it defaults to ``tokens``.
+    """
+    if words is None:
+        words = tokens
+    if CONNECTIVES.isdisjoint(tokens):
+        return parse_tokens(words)
+    try:
+        expression, pos = _parse_expression(tokens, 0)
+        if pos == len(tokens):
+            return expression
+    except ParseError:
+        pass
+    return parse_tokens(words)
+
+
+def compile_statement(statement: str) -> Expression | None:
+    """Compile a raw statement into an expression, or None if it is not one."""
+    body = _body(statement)
+    if not body:
+        return None
+    words = body.split()
+    if "(" in body or ")" in body:
+        return parse_expression(_TOKEN.findall(body), words)
+    return parse_expression(words)
+
+
+def leaves(expression: Expression) -> list[Clause]:
+    """Return the clauses of ``expression`` in statement order."""
+    if expression.__class__ is Clause:
+        return [expression]
+    return [clause for term in expression.terms for clause in leaves(term)]
+
+
+def combine(expression: Expression, verdicts: dict[Clause, bool]) -> bool:
+    """Evaluate ``expression`` given the verdict of each of its clauses."""
+    if expression.__class__ is Clause:
+        return verdicts[expression]
+    if expression.__class__ is Conjunction:
+        return all(combine(term, verdicts) for term in expression.terms)
+    return any(combine(term, verdicts) for term in expression.terms)
+
+
+def substitute(expression: Expression, clauses: dict[Clause, Clause]) -> Expression:
+    """Return ``expression`` with each clause replaced by its entry in ``clauses``."""
+    if expression.__class__ is Clause:
+        return clauses.get(expression, expression)
+    return expression.__class__(tuple(substitute(term, clauses) for term in expression.terms))
+
+
+def render(expression: Expression, nested: bool = False) -> str:
+    """Write ``expression`` back out as a statement, ending with a period."""
+    if expression.__class__ is Clause:
+        relation = expression.relation.replace("is", "is not", 1) if expression.negated else expression.relation
+        text = f"{expression.subject} {relation} {expression.object}"
+    else:
+        connective = " and " if expression.__class__ is Conjunction else " or "
+        text = connective.join(render(term, True) for term in expression.terms)
+        if nested:
+            text = f"({text})"
+    return text if nested else f"{text}."
+
+
+class StatementParser:
+    """Compile statements through a bounded LRU cache of parsed expressions."""
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.parse = lru_cache(maxsize=cache_size)(compile_statement)
+
+    def stats(self) -> dict[str, int]:
+        """Return cache hit/miss counters and occupancy."""
+        info = self.parse.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached clause and reset the counters."""
+        self.parse.cache_clear()
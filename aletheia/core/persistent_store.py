@@ -0,0 +1,744 @@
+"""Disk-backed fact store: an append-only log plus a memory-mapped index."""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from dataclasses import dataclass
+from threading import Lock, RLock, Thread
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from .bloom import DEFAULT_ERROR_RATE, BloomFilter, pair_key, subject_key
+from .symbol_table import Symbol, SymbolTable, _cursor_id
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INDEX_MAGIC = b"ALTI"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sIQQ")
+RECORD_HEADER = struct.Struct("<cII")
+ADD_RECORD = b"A"
+ALIAS_RECORD = b"L"
+LOW_BITS = 0xFFFFFFFF
+DEFAULT_COMPACT_THRESHOLD = 1_000_000
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class MappedIndex:
+    """Read-only view over a compacted index file.
+
+    The file holds a sorted string table followed by two sorted arrays of
+    64-bit ``(subject << 32) | object`` keys, one per direction. Everything is
+    read straight from the mapping, so opening costs the same for any size and
+    pages are only faulted in by the lookups that touch them. The mapping
+    outlives the file handle, and it is released when the index is closed
+    or, failing that, garbage collected.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, strings, pairs = INDEX_HEADER.unpack_from(self._map, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path} is not an Aletheia index file")
+        self._view = view = memoryview(self._map)
+        start = INDEX_HEADER.size
+        self._offsets = view[start:start + 8 * (strings + 1)].cast("Q")
+        start += 8 * (strings + 1)
+        self._data = start
+        start = _padded(start + self._offsets[strings])
+        self._forward = view[start:start + 8 * pairs].cast("Q")
+        start += 8 * pairs
+        self._reverse = view[start:start + 8 * pairs].cast("Q")
+        self.strings = strings
+        self.pairs = pairs
+
+    def close(self) -> None:
+        """Release the mapping."""
+        for view in (self._offsets, self._forward, self._reverse, self._view):
+            view.release()
+        self._map.close()
+
+    def name(self, ident: int) -> str:
+        """Return the string stored under ``ident``."""
+        start = self._data + self._offsets[ident]
+        end = self._data + self._offsets[ident + 1]
+        return self._map[start:end].decode("utf-8")
+
+    def id_of(self, name: str) -> int | None:
+        """Binary search the string table for ``name``."""
+        encoded = name.encode("utf-8")
+        offsets = self._offsets
+        data = self._data
+        low, high = 0, self.strings
+        while low < high:
+            middle = (low + high) // 2
+            probe = self._map[data + offsets[middle]:data + offsets[middle + 1]]
+            if probe < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.strings and self._map[data + offsets[low]:data + offsets[low + 1]] == encoded:
+            return low
+        return None
+
+    @staticmethod
+    def _bounds(keys: memoryview, prefix: int) -> tuple[int, int]:
+        position = bisect_left(keys, prefix << 32)
+        return position, bisect_left(keys, (prefix + 1) << 32, position)
+
+    @classmethod
+    def _range(cls, keys: memoryview, prefix: int, after: int = -1) -> Iterator[tuple[int, int]]:
+        start, end = cls._bounds(keys, prefix)
+        for index in range(max(start, after + 1), end):
+            yield keys[index] & LOW_BITS, index
+
+    def has(self, subject: int, obj: int) -> bool:
+        """Return True if the pair of ids is stored."""
+        key = subject << 32 | obj
+        position = bisect_left(self._forward, key)
+        return position < self.pairs and self._forward[position] == key
+
+    def objects(self, subject: int, after: int = -1) -> Iterator[tuple[int, int]]:
+        """Yield ``(object id, position)`` for ``subject`` past position ``after``."""
+        return self._range(self._forward, subject, after)
+
+    def subjects(self, obj: int, after: int = -1) -> Iterator[tuple[int, int]]:
+        """Yield ``(subject id, position)`` for ``obj`` past position ``after``."""
+        return self._range(self._reverse, obj, after)
+
+    def count_objects(self, subject: int) -> int:
+        """Return how many objects ``subject`` has."""
+        start, end = self._bounds(self._forward, subject)
+        return end - start
+
+    def count_subjects(self, obj: int) -> int:
+        """Return how many subjects ``obj`` has."""
+        start, end = self._bounds(self._reverse, obj)
+        return end - start
+
+    def facts(self) -> Iterator[tuple[str, str]]:
+        """Yield every stored fact as strings."""
+        for key in self._forward:
+            yield self.name(key >> 32), self.name(key & LOW_BITS)
+
+
+def _string_table(names: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """Return the offsets and concatenated bytes of ``names``."""
+    import numpy as np
+
+    offsets = np.zeros(len(names) + 1, dtype=np.uint64)
+    np.cumsum([len(name) for name in names], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(names), dtype=np.uint8)
+
+
+def _words(data: np.ndarray, starts: np.ndarray, lengths: np.ndarray, word: int) -> np.ndarray:
+    """Return bytes ``8 * word`` onwards of each string as big-endian integers, zero padded."""
+    import numpy as np
+
+    if not len(data):
+        return np.zeros(len(starts), dtype=np.uint64)
+    positions = starts[:, None] + np.arange(8 * word, 8 * word + 8, dtype=np.int64)
+    inside = positions < (starts + lengths)[:, None]
+    chunk = np.where(inside, data[np.minimum(positions, len(data) - 1)], 0).astype(np.uint8)
+    return chunk.view(">u8").ravel()
+
+
+def _compare(
+    data: np.ndarray, starts: np.ndarray, lengths: np.ndarray,
+    other: np.ndarray, other_starts: np.ndarray, other_lengths: np.ndarray,
+) -> np.ndarray:
+    """Compare strings pairwise as bytes: -1, 0 or 1 for each pair."""
+    import numpy as np
+
+    result = np.zeros(len(starts), dtype=np.int8)
+    open_ = np.arange(len(starts))
+    word = 0
+    while open_.size:
+        left = _words(data, starts[open_], lengths[open_], word)
+        right = _words(other, other_starts[open_], other_lengths[open_], word)
+        result[open_] = (left > right).astype(np.int8) - (left < right)
+        word += 1
+        # Equal so far: continue while either string has bytes left.
+        undecided = (result[open_] == 0) & (
+            (lengths[open_] > 8 * word) | (other_lengths[open_] > 8 * word)
+        )
+        open_ = open_[undecided]
+    ties = result == 0
+    result[ties] = np.sign(lengths[ties].astype(np.int64) - other_lengths[ties].astype(np.int64))
+    return result
+
+
+def _search(
+    offsets: np.ndarray, data: np.ndarray, names: np.ndarray, names_data: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Binary search every string of one table in another, all at once.
+
+    Return, per string of ``names``, how many strings of ``offsets``/``data``
+    sort before it and whether it is one of them.
+    """
+    import numpy as np
+
+    count = len(offsets) - 1
+    starts = offsets[:-1].astype(np.int64)
+    lengths = np.diff(offsets).astype(np.int64)
+    name_starts = names[:-1].astype(np.int64)
+    name_lengths = np.diff(names).astype(np.int64)
+    low = np.zeros(len(name_starts), dtype=np.int64)
+    high = np.full(len(name_starts), count, dtype=np.int64)
+    active = np.flatnonzero(low < high)
+    while active.size:
+        middle = (low[active] + high[active]) // 2
+        order = _compare(
+            data, starts[middle], lengths[middle],
+            names_data, name_starts[active], name_lengths[active],
+        )
+        below = order < 0
+        low[active[below]] = middle[below] + 1
+        high[active[~below]] = middle[~below]
+        active = active[low[active] < high[active]]
+    found = np.zeros(len(name_starts), dtype=bool)
+    hit = np.flatnonzero(low < count)
+    if hit.size:
+        found[hit] = _compare(
+            data, starts[low[hit]], lengths[low[hit]],
+            names_data, name_starts[hit], name_lengths[hit],
+        ) == 0
+    return low, found
+
+
+def write_index(path: Path, facts: Iterable[tuple[str, str]], base: MappedIndex | None = None) -> None:
+    """Write ``facts``, plus every fact of ``base``, to ``path`` in the index format.
+
+    ``base`` is merged without decoding it: the new strings are binary
+    searched into its string table all at once, its ids are shifted past
+    them, which keeps its key arrays sorted, and the new keys are merged in.
+    The cost follows the number of new facts, plus copying the arrays.
+    """
+    import numpy as np
+
+    pairs = list(dict.fromkeys((name.encode("utf-8"), value.encode("utf-8")) for name, value in facts))
+    names = sorted({name for pair in pairs for name in pair})
+    name_offsets, name_data = _string_table(names)
+    if base is None:
+        offsets, data = np.zeros(1, dtype=np.uint64), np.zeros(0, dtype=np.uint8)
+        forward = reverse = np.zeros(0, dtype=np.uint64)
+    else:
+        offsets = np.frombuffer(base._offsets, dtype=np.uint64)
+        data = np.frombuffer(base._view[base._data:base._data + int(offsets[-1])], dtype=np.uint8)
+        forward = np.frombuffer(base._forward, dtype=np.uint64)
+        reverse = np.frombuffer(base._reverse, dtype=np.uint64)
+
+    positions, found = _search(offsets, data, name_offsets, name_data)
+    positions = positions.astype(np.uint64)
+    inserted = positions[~found]
+
+    def shift(ids: np.ndarray) -> np.ndarray:
+        # An old string moves up by the number of new strings sorting before it.
+        return ids + np.searchsorted(inserted, ids, side="right").astype(np.uint64)
+
+    ids = np.empty(len(names), dtype=np.uint64)
+    ids[found] = shift(positions[found])
+    ids[~found] = inserted + np.arange(len(inserted), dtype=np.uint64)
+    lookup = {name: ident for ident, name in enumerate(names)}
+    subjects = ids[np.fromiter((lookup[name] for name, _ in pairs), dtype=np.int64, count=len(pairs))]
+    objects = ids[np.fromiter((lookup[value] for _, value in pairs), dtype=np.int64, count=len(pairs))]
+    low = np.uint64(LOW_BITS)
+    bits = np.uint64(32)
+
+    def merged(keys: np.ndarray, high_ids: np.ndarray, low_ids: np.ndarray) -> np.ndarray:
+        keys = shift(keys >> bits) << bits | shift(keys & low)
+        # A stable sort merges the two sorted runs in linear time.
+        return np.sort(np.concatenate((keys, np.sort(high_ids << bits | low_ids))), kind="stable")
+
+    forward = merged(forward, subjects, objects)
+    reverse = merged(reverse, objects, subjects)
+    lengths = np.diff(name_offsets)[~found].astype(np.int64)
+    at = inserted.astype(np.int64)
+    new_offsets = np.zeros(len(offsets) + len(inserted), dtype=np.uint64)
+    np.cumsum(np.insert(np.diff(offsets), at, lengths), out=new_offsets[1:])
+    new_data = np.insert(
+        data,
+        np.repeat(offsets[at].astype(np.int64), lengths),
+        np.frombuffer(b"".join(name for name, new in zip(names, ~found) if new), dtype=np.uint8),
+    )
+    del offsets, data
+
+    with path.open("wb") as handle:
+        handle.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(new_offsets) - 1, len(forward)))
+        new_offsets.tofile(handle)
+        new_data.tofile(handle)
+        start = INDEX_HEADER.size + 8 * len(new_offsets) + len(new_data)
+        handle.write(b"\0" * (_padded(start) - start))
+        forward.tofile(handle)
+        reverse.tofile(handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+@dataclass(frozen=True)
+class _Layers:
+    """What readers see, swapped as a whole so they never mix two states."""
+
+    index: MappedIndex | None
+    bloom: BloomFilter | None
+    # The overlay being folded into the index, if a compaction is under way.
+    frozen: SymbolTable | None
+    overlay: SymbolTable
+
+
+class PersistentSymbolTable:
+    """Symbol table that survives restarts.
+
+    New facts go to ``facts.log`` and to an in-memory :class:`SymbolTable`
+    overlay. Once the overlay holds ``compact_threshold`` facts, it is frozen
+    along with its log, renamed ``facts.log.old``, and a background thread
+    merges it into a fresh ``facts.idx`` that is swapped in atomically; writes
+    go on into a new overlay and log meanwhile. Opening a store maps the index
+    and replays only the short log tail.
+
+    Unless ``bloom_error_rate`` is None, each compaction also writes
+    ``facts.bloom``, a Bloom filter over the index's facts and subjects that
+    lets misses skip the binary searches over the mapped index. Compaction
+    adds the new facts to the filter it has, and only rebuilds one with
+    twice the room once it is full.
+
+    Alias declarations are logged alongside facts and carried over to the
+    fresh log by every compaction.
+
+    Writes are serialized by a lock. Compaction swaps in a new index, filter
+    and overlays instead of changing the old ones, so readers and open scans
+    keep a consistent view; old mappings are released once nothing refers to
+    them.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        bloom_error_rate: float | None = DEFAULT_ERROR_RATE,
+    ) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold = compact_threshold
+        self.bloom_error_rate = bloom_error_rate
+        self._index_path = self.path / "facts.idx"
+        self._bloom_path = self.path / "facts.bloom"
+        self._log_path = self.path / "facts.log"
+        self._frozen_path = self.path / "facts.log.old"
+        index = MappedIndex(self._index_path) if self._index_path.exists() else None
+        bloom = None
+        if index is not None and bloom_error_rate is not None and self._bloom_path.exists():
+            bloom = BloomFilter.open(self._bloom_path)
+        overlay = SymbolTable()
+        self._layers = _Layers(index, bloom, None, overlay)
+        self._aliases: list[tuple[str, str]] = []
+        if self._frozen_path.exists():
+            # A compaction was cut short: its facts are merged again.
+            frozen = SymbolTable(overlay.interner)
+            self._replay(self._frozen_path, frozen)
+            self._layers = _Layers(index, bloom, frozen, overlay)
+        self._replay(self._log_path, overlay)
+        self._aliases = list(dict.fromkeys(self._aliases))
+        self._log = self._log_path.open("ab")
+        self._lock = RLock()
+        # Held while merging, so only one compaction runs at a time.
+        self._merging = Lock()
+        self._compactor: Thread | None = None
+        self._failure: BaseException | None = None
+        self._closing = False
+        with self._lock:
+            self._maybe_compact()
+
+    def __enter__(self) -> PersistentSymbolTable:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of distinct facts stored."""
+        layers = self._layers
+        return (
+            (layers.index.pairs if layers.index else 0)
+            + (len(layers.frozen) if layers.frozen is not None else 0)
+            + len(layers.overlay)
+        )
+
+    @property
+    def bloom(self) -> BloomFilter | None:
+        """The Bloom filter over the index, if there is one."""
+        return self._layers.bloom
+
+    def _replay(self, path: Path, table: SymbolTable) -> None:
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        layers = self._layers
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            kind, name_size, value_size = RECORD_HEADER.unpack_from(data, position)
+            start = position + RECORD_HEADER.size
+            end = start + name_size + value_size
+            if end > len(data):
+                break
+            name = data[start:start + name_size].decode("utf-8")
+            value = data[start + name_size:end].decode("utf-8")
+            if kind == ADD_RECORD and not self._index_has(layers, name, value):
+                table.add(name, value)
+            elif kind == ALIAS_RECORD:
+                self._aliases.append((name, value))
+            position = end
+        if position != len(data):
+            # Drop a record torn by a crash mid-write.
+            with path.open("r+b") as handle:
+                handle.truncate(position)
+
+    @staticmethod
+    def _index_has(layers: _Layers, name: str, value: str) -> bool:
+        index, bloom = layers.index, layers.bloom
+        if index is None:
+            return False
+        if bloom is not None and pair_key(name, value) not in bloom:
+            return False
+        subject = index.id_of(name)
+        obj = index.id_of(value) if subject is not None else None
+        if obj is not None and index.has(subject, obj):
+            return True
+        if bloom is not None:
+            bloom.record_false_positive()
+        return False
+
+    @staticmethod
+    def _index_subject(layers: _Layers, name: str) -> int | None:
+        index, bloom = layers.index, layers.bloom
+        if index is None:
+            return None
+        if bloom is not None and subject_key(name) not in bloom:
+            return None
+        return index.id_of(name)
+
+    @staticmethod
+    def _record(name: str, value: str, kind: bytes = ADD_RECORD) -> bytes:
+        name_bytes = name.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        return RECORD_HEADER.pack(kind, len(name_bytes), len(value_bytes)) + name_bytes + value_bytes
+
+    def _append(self, name: str, value: str, kind: bytes = ADD_RECORD) -> None:
+        # One write per record, so a record is never split around another.
+        self._log.write(self._record(name, value, kind))
+
+    def snapshot(self) -> PersistentSymbolTable:
+        """Return a readable view; the persistent store is its own view."""
+        return self
+
+    def intern(self, name: str) -> int:
+        """Return a process-local integer id for ``name``."""
+        return self._layers.overlay.intern(name)
+
+    def id_of(self, name: str) -> int | None:
+        """Return the process-local id for ``name`` if it has one."""
+        return self._layers.overlay.id_of(name)
+
+    def add(self, name: str, value: str) -> bool:
+        """Add and log a fact; return False if it was already known."""
+        with self._lock:
+            added = self._add(self._layers, name, value)
+            self._log.flush()
+            self._maybe_compact()
+        return added
+
+    def _add(self, layers: _Layers, name: str, value: str) -> bool:
+        if (
+            self._index_has(layers, name, value)
+            or (layers.frozen is not None and layers.frozen.has(name, value))
+            or not layers.overlay.add(name, value)
+        ):
+            return False
+        self._append(name, value)
+        return True
+
+    def add_many(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Add and log a batch of facts and return how many were new."""
+        with self._lock:
+            layers = self._layers
+            added = sum(self._add(layers, name, value) for name, value in facts)
+            self._log.flush()
+            self._maybe_compact()
+        return added
+
+    def add_alias(self, alias: str, name: str) -> None:
+        """Log that ``alias`` names the same thing as ``name``."""
+        with self._lock:
+            self._aliases.append((alias, name))
+            self._append(alias, name, ALIAS_RECORD)
+            self._log.flush()
+
+    def aliases(self) -> list[tuple[str, str]]:
+        """Return every logged ``(alias, name)`` declaration in order."""
+        return list(self._aliases)
+
+    def has(self, name: str, value: str) -> bool:
+        """Return True if the store holds the given mapping."""
+        layers = self._layers
+        return (
+            layers.overlay.has(name, value)
+            or (layers.frozen is not None and layers.frozen.has(name, value))
+            or self._index_has(layers, name, value)
+        )
+
+    def get(self, name: str) -> str | None:
+        """Retrieve one value recorded for ``name``."""
+        return next(iter(self.objects(name)), None)
+
+    def objects(self, name: str) -> list[str]:
+        """Return every value recorded for the subject ``name``."""
+        layers = self._layers
+        index = layers.index
+        found = layers.overlay.objects(name)
+        if layers.frozen is not None:
+            found.extend(layers.frozen.objects(name))
+        subject = self._index_subject(layers, name)
+        if subject is not None:
+            found.extend(index.name(obj) for obj, _ in index.objects(subject))
+        return found
+
+    def subjects(self, value: str) -> list[str]:
+        """Return every subject that has ``value`` recorded."""
+        layers = self._layers
+        index = layers.index
+        found = layers.overlay.subjects(value)
+        if layers.frozen is not None:
+            found.extend(layers.frozen.subjects(value))
+        obj = index.id_of(value) if index else None
+        if obj is not None:
+            found.extend(index.name(subject) for subject, _ in index.subjects(obj))
+        return found
+
+    def iter_objects(self, name: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(value, cursor)``: log overlay first, then the index.
+
+        Cursors are ``o:<id>`` inside the overlay, ``f:<id>`` inside an
+        overlay being compacted and ``i:<position>`` inside the mapped index.
+        """
+        layers = self._layers
+        return self._scan(layers, "iter_objects", self._index_subject(layers, name), "objects", name, cursor)
+
+    def iter_subjects(self, value: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)``: log overlay first, then the index."""
+        layers = self._layers
+        obj = layers.index.id_of(value) if layers.index else None
+        return self._scan(layers, "iter_subjects", obj, "subjects", value, cursor)
+
+    def _scan(
+        self,
+        layers: _Layers,
+        overlay_scan: str,
+        ident: int | None,
+        attribute: str,
+        name: str,
+        cursor: str | None,
+    ) -> Iterator[tuple[str, str]]:
+        # The cursor is checked here, not on the first next().
+        phase, _, position = (cursor or "o:").partition(":")
+        if phase not in ("o", "f", "i"):
+            raise ValueError(f"Invalid cursor {cursor!r}")
+        tables = []
+        if phase == "o":
+            tables.append(("o", getattr(layers.overlay, overlay_scan)(name, position or None)))
+        if phase in ("o", "f") and layers.frozen is not None:
+            inner = position or None if phase == "f" else None
+            tables.append(("f", getattr(layers.frozen, overlay_scan)(name, inner)))
+        after = _cursor_id(position or None) if phase == "i" else -1
+        return self._walk(tables, layers.index, ident, attribute, after)
+
+    @staticmethod
+    def _walk(
+        tables: list[tuple[str, Iterator[tuple[str, str]]]],
+        index: MappedIndex | None,
+        ident: int | None,
+        attribute: str,
+        after: int,
+    ) -> Iterator[tuple[str, str]]:
+        for phase, items in tables:
+            for item, inner in items:
+                yield item, f"{phase}:{inner}"
+        if ident is not None:
+            scan = getattr(index, attribute)
+            for item, index_position in scan(ident, after):
+                yield index.name(item), f"i:{index_position}"
+
+    def count_objects(self, name: str) -> int:
+        """Return how many values are recorded for the subject ``name``."""
+        layers = self._layers
+        count = layers.overlay.count_objects(name)
+        if layers.frozen is not None:
+            count += layers.frozen.count_objects(name)
+        subject = self._index_subject(layers, name)
+        return count + (layers.index.count_objects(subject) if subject is not None else 0)
+
+    def count_subjects(self, value: str) -> int:
+        """Return how many subjects have ``value`` recorded."""
+        layers = self._layers
+        count = layers.overlay.count_subjects(value)
+        if layers.frozen is not None:
+            count += layers.frozen.count_subjects(value)
+        obj = layers.index.id_of(value) if layers.index else None
+        return count + (layers.index.count_subjects(obj) if obj is not None else 0)
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every stored fact."""
+        layers = self._layers
+        if layers.index is not None:
+            for name, value in layers.index.facts():
+                yield Symbol(name, value)
+        if layers.frozen is not None:
+            yield from layers.frozen.facts()
+        yield from layers.overlay.facts()
+
+    def _maybe_compact(self) -> None:
+        """Start a background compaction if one is due; call with the lock held."""
+        if self._compactor is not None or self._failure is not None or self._closing:
+            return
+        layers = self._layers
+        if layers.frozen is None:
+            if len(layers.overlay) < self.compact_threshold:
+                return
+            self._freeze()
+        self._compactor = Thread(target=self._compact_in_background, name="aletheia-compaction", daemon=True)
+        self._compactor.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self._merge()
+        except BaseException as exc:
+            # Writes carry on into the overlay; compact() retries and raises.
+            self._failure = exc
+            raise
+        finally:
+            with self._lock:
+                self._compactor = None
+                self._maybe_compact()
+
+    def compact(self) -> None:
+        """Fold every logged fact into a new index file now and start an empty log."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        self._failure = None
+        # A compaction that failed or was cut short left an overlay frozen.
+        self._merge()
+        with self._lock:
+            self._freeze()
+        self._merge()
+
+    def _freeze(self) -> None:
+        """Set the overlay and its log aside for merging; call with the lock held."""
+        layers = self._layers
+        if layers.frozen is not None or not len(layers.overlay):
+            return
+        # The new log starts with the aliases; swap it in whole so a crash
+        # cannot leave a log that has lost them.
+        log_staging = self._log_path.with_suffix(".log.tmp")
+        with log_staging.open("wb") as handle:
+            handle.write(b"".join(self._record(alias, name, ALIAS_RECORD) for alias, name in self._aliases))
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.flush()
+        self._log.close()
+        os.replace(self._log_path, self._frozen_path)
+        os.replace(log_staging, self._log_path)
+        self._log = self._log_path.open("ab")
+        self._layers = _Layers(layers.index, layers.bloom, layers.overlay, SymbolTable(layers.overlay.interner))
+
+    def _merge(self) -> None:
+        """Merge the frozen overlay into a new index and swap it in."""
+        with self._merging:
+            layers = self._layers
+            frozen = layers.frozen
+            if frozen is None:
+                return
+            facts = [(fact.name, fact.value) for fact in frozen.facts()]
+            staging = self._index_path.with_suffix(".idx.tmp")
+            write_index(staging, facts, layers.index)
+            bloom_staging = None
+            if self.bloom_error_rate is not None:
+                bloom_staging = self._bloom_path.with_suffix(".bloom.tmp")
+                self._grown_bloom(layers, staging, facts).write(bloom_staging)
+            with self._lock:
+                if bloom_staging is not None:
+                    # Swap the filter in first: a crash before the index follows
+                    # leaves a filter that knows too much, never one that misses.
+                    os.replace(bloom_staging, self._bloom_path)
+                os.replace(staging, self._index_path)
+                # Readers may still hold the old filter and index, so they are
+                # left to be released once unreferenced rather than closed.
+                self._layers = _Layers(
+                    MappedIndex(self._index_path),
+                    BloomFilter.open(self._bloom_path) if bloom_staging is not None else None,
+                    None,
+                    self._layers.overlay,
+                )
+                self._frozen_path.unlink(missing_ok=True)
+
+    def _grown_bloom(self, layers: _Layers, index_path: Path, facts: list[tuple[str, str]]) -> BloomFilter:
+        """Return the filter for the merged index at ``index_path``."""
+        subjects = {name for name, _ in facts}
+        bloom = layers.bloom
+        if bloom is not None and bloom.count + len(facts) + len(subjects) <= bloom.capacity:
+            bloom = bloom.copy()
+            keys = [pair_key(name, value) for name, value in facts]
+            keys += [subject_key(name) for name in subjects]
+        else:
+            # Rebuild with twice the room, so rebuilds get rarer as the store grows.
+            merged = MappedIndex(index_path)
+            try:
+                bloom = BloomFilter(2 * (merged.pairs + len(subjects)), self.bloom_error_rate)
+                last = None
+                for name, value in merged.facts():
+                    bloom.add(pair_key(name, value))
+                    # Facts come sorted by subject.
+                    if name != last:
+                        bloom.add(subject_key(name))
+                        last = name
+            finally:
+                merged.close()
+            return bloom
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def flush(self) -> None:
+        """Force logged facts to disk."""
+        with self._lock:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+
+    def close(self) -> None:
+        """Wait for a running compaction, flush the log and release the index mapping.
+
+        An overlay still frozen keeps its log and is merged after reopening.
+        """
+        with self._lock:
+            self._closing = True
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._merging, self._lock:
+            if self._log.closed:
+                return
+            self.flush()
+            self._log.close()
+            layers = self._layers
+            if layers.index is not None:
+                layers.index.close()
+            if layers.bloom is not None:
+                layers.bloom.close()
+            self._layers = _Layers(None, None, None, layers.overlay)
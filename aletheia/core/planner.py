@@ -0,0 +1,59 @@
+"""Cost-based ordering of compound statement terms."""
+from __future__ import annotations
+
+from .parser import Clause, Conjunction, Disjunction, Expression
+from .symbol_table import SymbolTable
+
+LEAF_COST = 1.0
+_EPSILON = 1e-9
+
+
+def estimate(expression: Expression, symbols: SymbolTable) -> tuple[float, float]:
+    """Return ``(probability true, expected cost)`` for ``expression``.
+
+    A clause costs one lookup and holds with probability
+    ``objects(subject) * subjects(object) / facts``, read from the fact index
+    counts; a comparison is given even odds if its subject has any fact.
+    Compound costs assume the terms run in planned order and stop at
+    the first deciding term.
+    """
+    if expression.__class__ is Clause:
+        total = len(symbols)
+        fanout = symbols.count_objects(expression.subject)
+        if expression.relation != "is":
+            probability = 0.5 if fanout else 0.0
+        else:
+            fanin = symbols.count_subjects(expression.object) if fanout else 0
+            probability = min(1.0, fanout * fanin / total) if fanout and fanin else 0.0
+        return (1.0 - probability if expression.negated else probability), LEAF_COST
+    return _estimate_terms(plan(expression, symbols), expression.__class__ is Conjunction)
+
+
+def _estimate_terms(
+    estimates: list[tuple[Expression, float, float]], conjunctive: bool
+) -> tuple[float, float]:
+    reach = 1.0
+    cost = 0.0
+    for _, probability, term_cost in estimates:
+        cost += reach * term_cost
+        reach *= probability if conjunctive else 1.0 - probability
+    return (reach if conjunctive else 1.0 - reach), cost
+
+
+def plan(expression: Conjunction | Disjunction, symbols: SymbolTable) -> list[tuple[Expression, float, float]]:
+    """Order the terms of a compound expression for short-circuit evaluation.
+
+    Conjunctions run the cheapest, most likely false term first and
+    disjunctions the cheapest, most likely true one. Returns
+    ``(term, probability true, cost)`` triples in execution order.
+    """
+    conjunctive = expression.__class__ is Conjunction
+    estimates = [(term, *estimate(term, symbols)) for term in expression.terms]
+
+    def rank(item: tuple[Expression, float, float]) -> float:
+        _, probability, cost = item
+        deciding = 1.0 - probability if conjunctive else probability
+        return cost / max(deciding, _EPSILON)
+
+    estimates.sort(key=rank)
+    return estimates
@@ -0,0 +1,246 @@
+"""Sorted indexes over numeric facts for comparisons and range queries.
+
+A fact whose object is a number, such as "tower height is 330", is read as
+entity ``tower`` having attribute ``height``: the attribute is the last word
+of the subject and the entity is the rest.
+"""
+from __future__ import annotations
+
+import json
+import math
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from threading import Lock
+from typing import Callable, Iterable, Iterator
+
+from .parser import NUMBER
+
+Entry = tuple[float, str, str]
+_NUMERIC_START = frozenset("-.0123456789")
+_value = itemgetter(0)
+
+
+def number(term: str) -> float | None:
+    """Return the value of ``term`` if it is a plain decimal number."""
+    if term[:1] not in _NUMERIC_START or NUMBER.fullmatch(term) is None:
+        return None
+    return float(term)
+
+
+def interval(relation: str, operand: str) -> tuple[float, float, bool, bool]:
+    """Return ``(low, high, low inclusive, high inclusive)`` for a comparison clause."""
+    if relation == "is between":
+        low, _, high = operand.partition(" and ")
+        return float(low), float(high), True, True
+    bound = float(operand)
+    if relation == "is greater than":
+        return bound, math.inf, False, True
+    if relation == "is at least":
+        return bound, math.inf, True, True
+    if relation == "is less than":
+        return -math.inf, bound, True, False
+    if relation == "is at most":
+        return -math.inf, bound, True, True
+    raise ValueError(f"Unknown comparison {relation!r}")
+
+
+def attribute_of(subject: str) -> tuple[str, str] | None:
+    """Split ``subject`` into ``(entity, attribute)``, or None for a single word."""
+    entity, _, attribute = subject.rpartition(" ")
+    return (entity, attribute) if entity else None
+
+
+class RangeIndex:
+    """Numeric facts kept sorted per subject and per attribute.
+
+    Per subject, values are kept in a short sorted list, so a comparison
+    clause is a binary search. Per attribute, ``(value, subject, object)``
+    entries form one sorted column that range queries bisect into and then
+    read in order. Writes to a column are buffered and merged on the next
+    read, which keeps bulk loads linear; the merged column is a new list, so
+    scans already running are not disturbed. Entries are candidates only:
+    callers confirm them against the store, which handles snapshots and
+    lapsed facts.
+
+    With a ``source`` of existing facts the index starts out unbuilt and
+    ignores writes: the first comparison or range query reads the source,
+    so opening a large store does not pay for an index it may never use.
+    """
+
+    __slots__ = ("_subjects", "_columns", "_pending", "_lock", "_source", "_live", "_loaded", "_loading")
+
+    def __init__(self, source: Callable[[], Iterable[tuple[str, str]]] | None = None) -> None:
+        self._subjects: dict[str, tuple[float, str] | list[tuple[float, str]]] = {}
+        self._columns: dict[str, list[Entry]] = {}
+        self._pending: dict[str, list[Entry]] = {}
+        self._lock = Lock()
+        self._source = source
+        # Writes are indexed once the build starts; the index answers once it ends.
+        self._live = self._loaded = source is None
+        self._loading = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of subjects with a numeric value."""
+        self._load()
+        return len(self._subjects)
+
+    def _load(self) -> None:
+        """Build the index from its source on first use."""
+        if self._loaded:
+            return
+        with self._loading:
+            if self._loaded:
+                return
+            # Writes racing the build are indexed too; updates skip duplicates.
+            self._live = True
+            self.update(self._source())
+            self._source = None
+            self._loaded = True
+
+    def add(self, subject: str, obj: str) -> bool:
+        """Index the fact if its object is a number; return True if it was new."""
+        return self.update(((subject, obj),)) == 1
+
+    def update(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Index every numeric fact of ``facts`` and return how many were new."""
+        if not self._live:
+            return 0
+        subjects = self._subjects
+        match = NUMBER.fullmatch
+        fresh: dict[str, list[Entry]] = {}
+        added = 0
+        for subject, obj in facts:
+            if obj[:1] not in _NUMERIC_START or match(obj) is None:
+                continue
+            value = float(obj)
+            item = (value, obj)
+            # Like postings, a lone value is stored bare rather than in a list.
+            values = subjects.get(subject)
+            if values is None:
+                subjects[subject] = item
+            elif values.__class__ is tuple:
+                if values == item:
+                    continue
+                subjects[subject] = sorted((values, item))
+            elif item in values:
+                continue
+            else:
+                insort(values, item)
+            added += 1
+            entity, _, attribute = subject.rpartition(" ")
+            if entity:
+                column = fresh.get(attribute)
+                if column is None:
+                    column = fresh[attribute] = []
+                column.append((value, subject, obj))
+        if fresh:
+            with self._lock:
+                for attribute, entries in fresh.items():
+                    self._pending.setdefault(attribute, []).extend(entries)
+        return added
+
+    def track(self, facts: Iterable[tuple[str, str]]) -> Iterator[tuple[str, str]]:
+        """Yield ``facts`` unchanged and index the numeric ones once they run out."""
+        if not self._live:
+            yield from facts
+            return
+        numeric = []
+        for fact in facts:
+            if fact[1][:1] in _NUMERIC_START:
+                numeric.append(fact)
+            yield fact
+        self.update(numeric)
+
+    def discard(self, facts: Iterable[tuple[str, str]]) -> None:
+        """Drop removed facts from the index."""
+        if not self._live:
+            return
+        subjects = self._subjects
+        dropped: dict[str, set[Entry]] = {}
+        for subject, obj in facts:
+            value = number(obj)
+            values = subjects.get(subject)
+            if value is None or values is None:
+                continue
+            item = (value, obj)
+            if values == item:
+                del subjects[subject]
+            elif values.__class__ is list and item in values:
+                values.remove(item)
+                if len(values) == 1:
+                    subjects[subject] = values[0]
+            else:
+                continue
+            entity, _, attribute = subject.rpartition(" ")
+            if entity:
+                dropped.setdefault(attribute, set()).add((value, subject, obj))
+        for attribute, entries in dropped.items():
+            with self._lock:
+                column = self._column(attribute)
+                self._columns[attribute] = [entry for entry in column if entry not in entries]
+
+    def candidates(self, subject: str, relation: str, operand: str) -> list[str]:
+        """Return the numeric objects of ``subject`` satisfying the comparison."""
+        self._load()
+        values = self._subjects.get(subject)
+        if values is None:
+            return []
+        if values.__class__ is tuple:
+            values = [values]
+        low, high, low_inclusive, high_inclusive = interval(relation, operand)
+        start = (bisect_left if low_inclusive else bisect_right)(values, low, key=_value)
+        stop = (bisect_right if high_inclusive else bisect_left)(values, high, key=_value)
+        return [obj for _, obj in values[start:stop]]
+
+    def _column(self, attribute: str) -> list[Entry]:
+        """Return the sorted column of ``attribute``, merging buffered writes.
+
+        Call with the lock held.
+        """
+        pending = self._pending.pop(attribute, None)
+        column = self._columns.get(attribute, [])
+        if pending:
+            column = self._columns[attribute] = sorted(column + pending)
+        return column
+
+    def scan(
+        self,
+        attribute: str,
+        low: float = -math.inf,
+        high: float = math.inf,
+        cursor: str | None = None,
+    ) -> Iterator[tuple[float, str, str, str]]:
+        """Lazily yield ``(value, subject, object, cursor)`` with ``low <= value <= high``.
+
+        Entries come in value order; passing a yielded cursor back resumes
+        right after that entry. A malformed cursor raises ValueError here,
+        not on the first ``next()``.
+        """
+        after = None if cursor is None else _entry(cursor)
+        self._load()
+        with self._lock:
+            column = self._column(attribute)
+        position = bisect_left(column, (low,)) if after is None else bisect_right(column, after)
+        return self._walk(column, position, low, high)
+
+    @staticmethod
+    def _walk(
+        column: list[Entry], position: int, low: float, high: float
+    ) -> Iterator[tuple[float, str, str, str]]:
+        for index in range(position, len(column)):
+            entry = column[index]
+            if entry[0] > high:
+                return
+            if entry[0] >= low:
+                yield (*entry, json.dumps(entry))
+
+
+def _entry(cursor: str) -> Entry:
+    """Decode a range cursor back into the entry it points at."""
+    try:
+        value, subject, obj = json.loads(cursor)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor {cursor!r}") from None
+    if value.__class__ not in (int, float) or subject.__class__ is not str or obj.__class__ is not str:
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    return float(value), subject, obj
@@ -0,0 +1,328 @@
+"""Forward-chaining rules compiled into a Rete network.
+
+A rule reads ``if <condition> and <condition> ... then <conclusion>``, where
+each part is ``term is term`` and a single uppercase letter is a variable::
+
+    if X is citizen and X is adult then X is voter
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from .parser import ParseError, normalize_term
+
+Fact = tuple[str, str]
+Token = tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A ``subject is object`` template whose terms may be variables."""
+
+    subject: str
+    object: str
+
+
+@dataclass(frozen=True)
+class Rule:
+    """Named Horn rule: every condition holding implies the conclusion."""
+
+    name: str
+    conditions: tuple[Pattern, ...]
+    conclusion: Pattern
+
+
+def is_variable(term: str) -> bool:
+    """Return True if ``term`` is a variable, a single uppercase letter."""
+    return len(term) == 1 and term.isupper()
+
+
+def _term(tokens: list[str]) -> str:
+    if len(tokens) == 1 and is_variable(tokens[0]):
+        return tokens[0]
+    return normalize_term(" ".join(tokens))
+
+
+def _pattern(tokens: list[str], text: str) -> Pattern:
+    lowered = [token.lower() for token in tokens]
+    if "is" not in lowered[1:-1]:
+        raise ParseError(f"Expected 'term is term' in rule {text!r}")
+    pivot = lowered.index("is", 1)
+    if lowered[pivot + 1] == "not":
+        raise ParseError(f"Rules cannot use negation: {text!r}")
+    return Pattern(_term(tokens[:pivot]), _term(tokens[pivot + 1:]))
+
+
+def parse_rule(text: str, name: str | None = None) -> Rule:
+    """Compile ``if ... then ...`` text into a :class:`Rule`."""
+    tokens = text.strip().rstrip(".").split()
+    lowered = [token.lower() for token in tokens]
+    if not tokens or lowered[0] != "if" or "then" not in lowered:
+        raise ParseError(f"Rules read 'if ... then ...': {text!r}")
+    then = lowered.index("then")
+    conditions: list[Pattern] = []
+    start = 1
+    for index in range(1, then + 1):
+        if index == then or lowered[index] == "and":
+            conditions.append(_pattern(tokens[start:index], text))
+            start = index + 1
+    conclusion = _pattern(tokens[then + 1:], text)
+    bound = {term for pattern in conditions for term in (pattern.subject, pattern.object)}
+    for term in (conclusion.subject, conclusion.object):
+        if is_variable(term) and term not in bound:
+            raise ParseError(f"Variable {term} of the conclusion is unbound in {text!r}")
+    return Rule(name or " ".join(tokens), tuple(conditions), conclusion)
+
+
+class AlphaMemory:
+    """Facts matching one condition shape, shared by every rule using it."""
+
+    __slots__ = ("subject", "object", "reflexive", "facts", "successors")
+
+    def __init__(self, subject: str | None, obj: str | None, reflexive: bool) -> None:
+        self.subject = subject
+        self.object = obj
+        self.reflexive = reflexive
+        self.facts: set[Fact] = set()
+        self.successors: list[JoinNode] = []
+
+    def matches(self, fact: Fact) -> bool:
+        """Return True if ``fact`` has this memory's shape; constants are matched on dispatch."""
+        return not self.reflexive or fact[0] == fact[1]
+
+
+class JoinNode:
+    """Beta node joining the tokens of earlier conditions with one condition.
+
+    Both sides are hashed on the variables they share, so an activation only
+    meets the partners it can actually join with.
+    """
+
+    __slots__ = ("rule", "token_keys", "fact_keys", "new_slots", "left", "right", "child")
+
+    def __init__(
+        self,
+        rule: CompiledRule,
+        token_keys: tuple[int, ...],
+        fact_keys: tuple[int, ...],
+        new_slots: tuple[int, ...],
+    ) -> None:
+        self.rule = rule
+        self.token_keys = token_keys
+        self.fact_keys = fact_keys
+        self.new_slots = new_slots
+        self.left: dict[Token, list[Token]] = {}
+        self.right: dict[Token, list[Fact]] = {}
+        self.child: JoinNode | None = None
+
+    def activate_right(self, fact: Fact, emit: Callable[[Fact], None]) -> None:
+        """Join a new fact with every stored token sharing its bindings."""
+        key = tuple(fact[slot] for slot in self.fact_keys)
+        self.right.setdefault(key, []).append(fact)
+        for token in self.left.get(key, ()):
+            self._pass(token + tuple(fact[slot] for slot in self.new_slots), emit)
+
+    def activate_left(self, token: Token, emit: Callable[[Fact], None]) -> None:
+        """Join a new token with every stored fact sharing its bindings."""
+        key = tuple(token[slot] for slot in self.token_keys)
+        self.left.setdefault(key, []).append(token)
+        for fact in self.right.get(key, ()):
+            self._pass(token + tuple(fact[slot] for slot in self.new_slots), emit)
+
+    def retract_right(self, fact: Fact) -> None:
+        """Forget a fact and every token it took part in further down."""
+        key = tuple(fact[slot] for slot in self.fact_keys)
+        if not _remove(self.right, key, fact) or self.child is None:
+            return
+        for token in self.left.get(key, ()):
+            self.child.retract_left(token + tuple(fact[slot] for slot in self.new_slots))
+
+    def retract_left(self, token: Token) -> None:
+        """Forget a token and every longer token built from it."""
+        key = tuple(token[slot] for slot in self.token_keys)
+        if not _remove(self.left, key, token) or self.child is None:
+            return
+        for fact in self.right.get(key, ()):
+            self.child.retract_left(token + tuple(fact[slot] for slot in self.new_slots))
+
+    def _pass(self, token: Token, emit: Callable[[Fact], None]) -> None:
+        if self.child is not None:
+            self.child.activate_left(token, emit)
+        else:
+            self.rule.fire(token, emit)
+
+
+def _remove(memory: dict, key: Token, item: tuple) -> bool:
+    """Remove one ``item`` filed under ``key``; return False if it was not there."""
+    items = memory.get(key)
+    if items is None or item not in items:
+        return False
+    items.remove(item)
+    if not items:
+        del memory[key]
+    return True
+
+
+class CompiledRule:
+    """A rule's chain of join nodes and its firing counters."""
+
+    __slots__ = ("rule", "first", "conclusion", "fired", "seconds")
+
+    def __init__(self, rule: Rule) -> None:
+        self.rule = rule
+        self.first: JoinNode | None = None
+        self.conclusion: tuple[tuple[bool, str | int], tuple[bool, str | int]] | None = None
+        self.fired = 0
+        self.seconds = 0.0
+
+    def fire(self, token: Token, emit: Callable[[Fact], None]) -> None:
+        """Instantiate the conclusion for a complete token."""
+        self.fired += 1
+        (subject_bound, subject), (object_bound, obj) = self.conclusion
+        emit((token[subject] if subject_bound else subject, token[obj] if object_bound else obj))
+
+
+class RuleEngine:
+    """Rete network deriving facts from rules as facts arrive.
+
+    Alpha memories test each fact against the constants of a condition and
+    are shared between rules; each rule then owns a chain of
+    :class:`JoinNode` beta memories. :meth:`propagate` pushes only the new
+    facts through the network and keeps going with what they derive until
+    nothing new follows, so no rule is ever re-run over the whole store.
+    Facts removed from the store are :meth:`retract`-ed from the memories so
+    they no longer join with new facts, but what they derived is kept.
+    """
+
+    def __init__(self) -> None:
+        self.rules: list[CompiledRule] = []
+        self.derived = 0
+        self._alpha: dict[tuple[str | None, str | None, bool], AlphaMemory] = {}
+        self._by_subject: dict[str, list[AlphaMemory]] = {}
+        self._by_object: dict[str, list[AlphaMemory]] = {}
+        self._by_pair: dict[Fact, list[AlphaMemory]] = {}
+        self._open: list[AlphaMemory] = []
+
+    def __len__(self) -> int:
+        """Return the number of rules."""
+        return len(self.rules)
+
+    def _memory(self, pattern: Pattern) -> tuple[AlphaMemory, bool]:
+        """Return the alpha memory for ``pattern`` and whether it is new."""
+        subject = None if is_variable(pattern.subject) else pattern.subject
+        obj = None if is_variable(pattern.object) else pattern.object
+        reflexive = subject is None and pattern.subject == pattern.object
+        key = (subject, obj, reflexive)
+        memory = self._alpha.get(key)
+        created = memory is None
+        if created:
+            memory = self._alpha[key] = AlphaMemory(subject, obj, reflexive)
+            if subject is not None and obj is not None:
+                self._by_pair.setdefault((subject, obj), []).append(memory)
+            elif subject is not None:
+                self._by_subject.setdefault(subject, []).append(memory)
+            elif obj is not None:
+                self._by_object.setdefault(obj, []).append(memory)
+            else:
+                self._open.append(memory)
+        return memory, created
+
+    def add(self, rule: Rule, existing: Callable[[Pattern], Iterable[Fact]]) -> list[Fact]:
+        """Compile ``rule`` and return what it derives from facts already known.
+
+        ``existing(pattern)`` must yield the stored facts that could match a
+        condition; it is only consulted for condition shapes not seen before.
+        """
+        compiled = CompiledRule(rule)
+        variables: list[str] = []
+        memories: list[AlphaMemory] = []
+        previous: JoinNode | None = None
+        for pattern in rule.conditions:
+            token_keys: list[int] = []
+            fact_keys: list[int] = []
+            new_slots: list[int] = []
+            for slot, term in enumerate((pattern.subject, pattern.object)):
+                if not is_variable(term) or (slot == 1 and term == pattern.subject):
+                    continue
+                if term in variables:
+                    token_keys.append(variables.index(term))
+                    fact_keys.append(slot)
+                else:
+                    variables.append(term)
+                    new_slots.append(slot)
+            node = JoinNode(compiled, tuple(token_keys), tuple(fact_keys), tuple(new_slots))
+            if previous is None:
+                compiled.first = node
+                node.left[()] = [()]
+            else:
+                previous.child = node
+            previous = node
+            memory, created = self._memory(pattern)
+            if created:
+                memory.facts.update(fact for fact in existing(pattern) if memory.matches(fact))
+            memories.append(memory)
+        compiled.conclusion = tuple(
+            (True, variables.index(term)) if is_variable(term) else (False, term)
+            for term in (rule.conclusion.subject, rule.conclusion.object)
+        )
+        self.rules.append(compiled)
+        derived: list[Fact] = []
+        node = compiled.first
+        started = time.perf_counter()
+        for memory in memories:
+            for fact in list(memory.facts):
+                node.activate_right(fact, derived.append)
+            memory.successors.append(node)
+            node = node.child
+        compiled.seconds += time.perf_counter() - started
+        return self.propagate(derived) + derived
+
+    def _memories(self, fact: Fact) -> Iterator[AlphaMemory]:
+        yield from self._by_pair.get(fact, ())
+        yield from self._by_subject.get(fact[0], ())
+        yield from self._by_object.get(fact[1], ())
+        yield from self._open
+
+    def propagate(self, facts: Iterable[Fact]) -> list[Fact]:
+        """Push new facts through the network and return every derived fact."""
+        if not self.rules:
+            return []
+        derived: list[Fact] = []
+        agenda = list(facts)
+        clock = time.perf_counter
+        while agenda:
+            fact = agenda.pop()
+            for memory in self._memories(fact):
+                if fact in memory.facts or not memory.matches(fact):
+                    continue
+                memory.facts.add(fact)
+                for node in memory.successors:
+                    before = len(derived)
+                    started = clock()
+                    node.activate_right(fact, derived.append)
+                    node.rule.seconds += clock() - started
+                    agenda.extend(derived[before:])
+        return derived
+
+    def retract(self, facts: Iterable[Fact]) -> None:
+        """Drop removed facts, and the partial matches built on them, from the network."""
+        for fact in facts:
+            for memory in self._memories(fact):
+                if fact in memory.facts:
+                    memory.facts.discard(fact)
+                    for node in memory.successors:
+                        node.retract_right(fact)
+
+    def stats(self) -> dict[str, object]:
+        """Return the rule count, derived fact count and per-rule firings."""
+        return {
+            "rules": len(self.rules),
+            "derived": self.derived,
+            "alpha_memories": len(self._alpha),
+            "firings": {
+                compiled.rule.name: {"fired": compiled.fired, "seconds": compiled.seconds}
+                for compiled in self.rules
+            },
+        }
@@ -0,0 +1,150 @@
+"""Batch lexical features and a linear truth model over NumPy arrays.
+
+A batch of texts becomes one feature row per text. Every text is tokenized
+into the same lowercase ``\\w+`` words as :mod:`.lexicon`, and the words of
+the whole batch are mapped to ids in one flat array. Lexicon phrases of each
+length are then found with a single vectorized lookup of word n-gram keys, so
+the per-text work left in Python is only splitting into words.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from itertools import chain
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from .lexicon import _WORD, PhraseMatcher
+
+FEATURES = (
+    "markers",
+    "marker_weight",
+    "hedge_ratio",
+    "negation_ratio",
+    "log_words",
+    "characters_per_word",
+)
+DEFAULT_WEIGHTS = Path(__file__).resolve().parent.parent / "config" / "truth_weights.json"
+
+HEDGES = frozenset({
+    "maybe", "perhaps", "possibly", "probably", "likely", "apparently", "seemingly",
+    "seems", "seem", "might", "may", "could", "somewhat", "arguably", "reportedly",
+    "presumably", "roughly", "about", "around", "suggests", "suggest", "guess",
+})
+# ``\w+`` splits "isn't" into "isn" and "t", so contractions count by their stem.
+NEGATIONS = frozenset({
+    "not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "nowhere",
+    "cannot", "isn", "aren", "wasn", "weren", "don", "doesn", "didn", "won", "wouldn",
+    "couldn", "shouldn", "hasn", "haven", "hadn",
+})
+
+
+class BatchFeatures:
+    """Compute :data:`FEATURES` for many texts at once.
+
+    Phrase n-grams are keyed as base-``len(vocabulary) + 1`` numbers over
+    word ids in ``uint64``. The keys are exact while they fit in 64 bits and
+    a wrapping polynomial hash beyond that, which is fine for counting.
+    Marker counts and weights agree with :meth:`PhraseMatcher.scan`, which
+    also reports every overlapping occurrence.
+    """
+
+    __slots__ = ("_ids", "_base", "_tables", "_hedges", "_negations")
+
+    def __init__(self, matcher: PhraseMatcher) -> None:
+        phrases = [phrase.split(" ") for phrase in matcher.phrases]
+        words = sorted(set(chain.from_iterable(phrases)) | HEDGES | NEGATIONS)
+        # Id 0 stands for any word outside the vocabulary.
+        self._ids = {word: ident for ident, word in enumerate(words, 1)}
+        self._base = np.uint64(len(words) + 1)
+        by_length: dict[int, tuple[list[int], list[float]]] = {}
+        for phrase, weight in zip(phrases, matcher.weights):
+            keys, weights = by_length.setdefault(len(phrase), ([], []))
+            keys.append(self._key([self._ids[word] for word in phrase]))
+            weights.append(weight)
+        self._tables: list[tuple[int, np.ndarray, np.ndarray]] = []
+        for length, (keys, weights) in sorted(by_length.items()):
+            column = np.array(keys, dtype=np.uint64)
+            order = np.argsort(column, kind="stable")
+            self._tables.append((length, column[order], np.array(weights)[order]))
+        self._hedges = np.array(sorted(self._ids[word] for word in HEDGES), dtype=np.uint64)
+        self._negations = np.array(sorted(self._ids[word] for word in NEGATIONS), dtype=np.uint64)
+
+    def _key(self, ids: list[int]) -> int:
+        key = 0
+        for ident in ids:
+            key = (key * int(self._base) + ident) & 0xFFFFFFFFFFFFFFFF
+        return key
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(texts), len(FEATURES))`` float matrix."""
+        count = len(texts)
+        findall = _WORD.findall
+        tokens = [findall(text.lower()) for text in texts]
+        sizes = np.fromiter(map(len, tokens), dtype=np.int64, count=count)
+        get = self._ids.get
+        ids = np.array([get(word, 0) for word in chain.from_iterable(tokens)], dtype=np.uint64)
+        owner = np.repeat(np.arange(count), sizes)
+        # Index one past the last word of the text each word belongs to.
+        ends = np.cumsum(sizes)[owner]
+
+        markers = np.zeros(count)
+        marker_weight = np.zeros(count)
+        total = len(ids)
+        with np.errstate(over="ignore"):
+            for length, keys, weights in self._tables:
+                if total < length or not len(keys):
+                    continue
+                starts = total - length + 1
+                grams = ids[:starts].copy()
+                for offset in range(1, length):
+                    grams *= self._base
+                    grams += ids[offset:offset + starts]
+                position = np.searchsorted(keys, grams)
+                np.minimum(position, len(keys) - 1, out=position)
+                hit = (keys[position] == grams) & (np.arange(starts) + length <= ends[:starts])
+                texts_hit = owner[:starts][hit]
+                markers += np.bincount(texts_hit, minlength=count)
+                marker_weight += np.bincount(texts_hit, weights=weights[position[hit]], minlength=count)
+
+        words = np.maximum(sizes, 1)
+        hedges = np.bincount(owner, weights=np.isin(ids, self._hedges), minlength=count)
+        negations = np.bincount(owner, weights=np.isin(ids, self._negations), minlength=count)
+        characters = np.fromiter(map(len, texts), dtype=np.float64, count=count)
+        return np.column_stack((
+            markers,
+            marker_weight,
+            hedges / words,
+            negations / words,
+            np.log1p(sizes),
+            characters / words,
+        ))
+
+
+@dataclass
+class LinearModel:
+    """Logistic model giving the probability that a text is truthful."""
+
+    weights: np.ndarray
+    bias: float = 0.0
+
+    @classmethod
+    def from_file(cls, path: str | Path = DEFAULT_WEIGHTS) -> LinearModel:
+        """Load ``{"bias": b, "weights": {feature: w}}``; missing features weigh 0."""
+        with Path(path).open(encoding="utf-8") as handle:
+            data = json.load(handle)
+        weights = data.get("weights", {})
+        unknown = set(weights) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown features in {path}: {', '.join(sorted(unknown))}")
+        return cls(
+            np.array([float(weights.get(name, 0.0)) for name in FEATURES]),
+            float(data.get("bias", 0.0)),
+        )
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """Return one probability per row of ``features``."""
+        logits = features @ self.weights + self.bias
+        return 1.0 / (1.0 + np.exp(-logits))
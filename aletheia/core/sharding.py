@@ -0,0 +1,330 @@
+"""Sharded logic engine spreading facts over worker processes."""
+from __future__ import annotations
+
+import multiprocessing
+import zlib
+from contextlib import ExitStack
+from multiprocessing.connection import Connection
+from itertools import islice
+from threading import RLock
+from typing import Any, Iterable, Iterator
+
+from .conflicts import Conflict
+from .loader import DEFAULT_BATCH_SIZE, batched
+from .logic_engine import LogicEngine
+from .parser import (
+    DEFAULT_CACHE_SIZE, Clause, Expression, StatementParser, combine, leaves, normalize_term
+)
+from .symbol_table import Symbol, _cursor_id
+
+PAGE_SIZE = 1000
+NO_EXPIRY = "Sharded engines do not support expiring facts"
+NO_CONFLICTS = "Sharded engines do not support exclusivity constraints"
+
+
+def shard_of(subject: str, shards: int) -> int:
+    """Return the shard owning ``subject``; stable across processes."""
+    return zlib.crc32(subject.encode("utf-8")) % shards
+
+
+def _serve(conn: Connection, shards: int, parse_cache_size: int) -> None:
+    """Worker loop: hold one shard of facts and answer requests for it.
+
+    Workers also parse a slice of each statement batch: ``parse`` returns the
+    slice's distinct clauses grouped by the shard that owns them, and
+    ``combine`` takes those shards' answers and returns the slice's verdicts.
+    """
+    logic = LogicEngine(parse_cache_size)
+    holds = logic.holds
+    compare = logic.compare
+    parse = logic.parser.parse
+
+    def answer(clauses: list[tuple[str, str, str]]) -> list[bool]:
+        return [
+            holds(subject, obj) if relation == "is" else compare(subject, relation, obj)
+            for subject, relation, obj in clauses
+        ]
+
+    expressions: list[Expression | None] = []
+    routes: dict[tuple[str, str, str], tuple[int, int]] = {}
+    while True:
+        op, payload = conn.recv()
+        if op == "add":
+            conn.send(logic.add_normalized(payload))
+        elif op == "holds":
+            conn.send(answer(payload))
+        elif op == "lookup":
+            conn.send([answer(clauses) for clauses in payload])
+        elif op == "parse":
+            expressions = [parse(statement) for statement in payload]
+            routes = {}
+            outboxes: list[list[tuple[str, str, str]]] = [[] for _ in range(shards)]
+            for expression in expressions:
+                if expression is None:
+                    continue
+                for clause in leaves(expression):
+                    key = (clause.subject, clause.relation, clause.object)
+                    if key not in routes:
+                        shard = shard_of(clause.subject, shards)
+                        routes[key] = (shard, len(outboxes[shard]))
+                        outboxes[shard].append(key)
+            conn.send(outboxes)
+        elif op == "combine":
+            def verdict(clause: Clause) -> bool:
+                shard, position = routes[(clause.subject, clause.relation, clause.object)]
+                return payload[shard][position] is not clause.negated
+
+            conn.send([
+                False if expression is None
+                else combine(expression, {clause: verdict(clause) for clause in leaves(expression)})
+                for expression in expressions
+            ])
+            expressions, routes = [], {}
+        elif op == "objects":
+            subject, cursor = payload
+            conn.send(list(islice(logic.iter_objects(subject, cursor), PAGE_SIZE)))
+        elif op == "subjects":
+            obj, cursor = payload
+            conn.send(list(islice(logic.iter_subjects(obj, cursor), PAGE_SIZE)))
+        elif op == "facts":
+            conn.send([(fact.name, fact.value) for fact in logic.symbols.facts()])
+        elif op == "len":
+            conn.send(len(logic.symbols))
+        elif op == "stop":
+            conn.close()
+            return
+
+
+class ShardedLogicEngine:
+    """Drop-in :class:`LogicEngine` that hash-partitions facts by subject.
+
+    Each shard lives in its own worker process, so batch evaluation is not
+    limited by one interpreter's GIL. A batch of statements is split between
+    the workers, which parse their slice and group its clauses by owning
+    shard; the parent only forwards the clauses to their shards and their
+    answers back, and each worker combines its slice's verdicts. Every
+    message goes to all shards before any reply is awaited.
+
+    Each worker connection has a lock, so the engine can be shared between
+    threads; exchanges that span every shard take all the locks, in order.
+    """
+
+    def __init__(self, workers: int, parse_cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        if workers < 1:
+            raise ValueError("A sharded engine needs at least one worker")
+        self.parser = StatementParser(parse_cache_size)
+        self.closure = None
+        self.verdicts = None
+        self._connections: list[Connection] = []
+        self._locks: list[RLock] = []
+        self._processes: list[multiprocessing.Process] = []
+        for _ in range(workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_serve, args=(child, workers, parse_cache_size), daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._locks.append(RLock())
+            self._processes.append(process)
+
+    @property
+    def workers(self) -> int:
+        """Return the number of shards."""
+        return len(self._connections)
+
+    def __len__(self) -> int:
+        """Return the number of facts over all shards."""
+        return sum(self._broadcast("len", None))
+
+    def _exclusive(self) -> ExitStack:
+        """Take every connection lock, always in shard order."""
+        stack = ExitStack()
+        for lock in self._locks:
+            stack.enter_context(lock)
+        return stack
+
+    def _broadcast(self, op: str, payloads: Any) -> list[Any]:
+        """Send ``op`` to every shard (one payload each, or a shared one)."""
+        if not isinstance(payloads, list):
+            payloads = [payloads] * self.workers
+        with self._exclusive():
+            for conn, payload in zip(self._connections, payloads):
+                conn.send((op, payload))
+            return [conn.recv() for conn in self._connections]
+
+    def add_rule(self, text: str, name: str | None = None) -> int:
+        """Rules are not supported across shards."""
+        raise ValueError("Sharded engines do not support rules")
+
+    def materialize(self, rules: Iterable[str]) -> int:
+        """Rules are not supported across shards."""
+        raise ValueError("Sharded engines do not support rules")
+
+    def add_alias(self, alias: str, name: str) -> bool:
+        """Aliases are not supported across shards."""
+        raise ValueError("Sharded engines do not support aliases")
+
+    def add_exclusion(self, values: Iterable[str], name: str | None = None) -> int:
+        """Exclusivity constraints are not supported across shards."""
+        raise ValueError(NO_CONFLICTS)
+
+    def iter_conflicts(self, cursor: str | None = None) -> Iterator[tuple[Conflict, str]]:
+        """Exclusivity constraints are not supported across shards."""
+        raise ValueError(NO_CONFLICTS)
+
+    def wait_for_conflicts(self, cursor: str | None, timeout: float) -> bool:
+        """Exclusivity constraints are not supported across shards."""
+        raise ValueError(NO_CONFLICTS)
+
+    def set_ttl(self, obj: str, ttl: float | None) -> None:
+        """Fact expiry is not supported across shards."""
+        raise ValueError(NO_EXPIRY)
+
+    def add_fact(self, subject: str, obj: str, ttl: float | None = None) -> None:
+        """Record a true statement of the form `subject is obj`."""
+        if ttl is not None:
+            raise ValueError(NO_EXPIRY)
+        self.add_normalized([(normalize_term(subject), normalize_term(obj))])
+
+    def add_facts(self, facts: Iterable[tuple[str, str]], ttl: float | None = None) -> int:
+        """Record a batch of facts and return how many were new."""
+        if ttl is not None:
+            raise ValueError(NO_EXPIRY)
+        return self.add_normalized(
+            (normalize_term(subject), normalize_term(obj)) for subject, obj in facts
+        )
+
+    def add_normalized(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Route already normalized facts to their shards."""
+        added = 0
+        for batch in batched(facts, DEFAULT_BATCH_SIZE):
+            parts: list[list[tuple[str, str]]] = [[] for _ in range(self.workers)]
+            for fact in batch:
+                parts[shard_of(fact[0], self.workers)].append(fact)
+            added += sum(self._broadcast("add", parts))
+        return added
+
+    def parse(self, statement: str) -> Expression | None:
+        """Compile a statement into an expression, using the parse cache."""
+        return self.parser.parse(statement)
+
+    def check_many(self, expressions: list[Expression | None]) -> list[bool]:
+        """Evaluate compiled expressions on their shards in parallel.
+
+        Every clause is sent in one round trip, so compound statements are
+        combined in the parent instead of short-circuiting.
+        """
+        clauses = list(dict.fromkeys(
+            clause for expression in expressions if expression is not None for clause in leaves(expression)
+        ))
+        parts: list[list[tuple[str, str, str]]] = [[] for _ in range(self.workers)]
+        routes: list[tuple[int, int]] = []
+        for clause in clauses:
+            shard = shard_of(clause.subject, self.workers)
+            routes.append((shard, len(parts[shard])))
+            parts[shard].append((clause.subject, clause.relation, clause.object))
+        answers = self._broadcast("holds", parts)
+        verdicts = {
+            clause: answers[shard][position] is not clause.negated
+            for clause, (shard, position) in zip(clauses, routes)
+        }
+        return [
+            False if expression is None else combine(expression, verdicts)
+            for expression in expressions
+        ]
+
+    def check(self, clause: Expression | None, symbols: object = None) -> bool:
+        """Return the verdict for an already compiled expression."""
+        return self.check_many([clause])[0]
+
+    def evaluate(self, statement: str) -> bool:
+        """Return True if the statement matches a known fact."""
+        return self.check(self.parser.parse(statement))
+
+    def evaluate_many(self, statements: Iterable[str]) -> list[bool]:
+        """Evaluate a batch of statements, returning verdicts in order.
+
+        The statements are parsed by the workers, a slice each.
+        """
+        statements = list(statements)
+        distinct = list(dict.fromkeys(statements))
+        size = -(-len(distinct) // self.workers)
+        slices = [distinct[worker * size:(worker + 1) * size] for worker in range(self.workers)]
+        with self._exclusive():
+            outboxes = self._broadcast("parse", slices)
+            # Shard s answers every worker's outbox for s, and each worker
+            # gets its answers back in the same per-shard layout.
+            answers = self._broadcast("lookup", [list(inbox) for inbox in zip(*outboxes)])
+            results = self._broadcast("combine", [list(reply) for reply in zip(*answers)])
+        verdicts = dict(zip(distinct, (verdict for part in results for verdict in part)))
+        return [verdicts[statement] for statement in statements]
+
+    def _request(self, shard: int, op: str, payload: Any) -> Any:
+        with self._locks[shard]:
+            conn = self._connections[shard]
+            conn.send((op, payload))
+            return conn.recv()
+
+    def _pages(self, shard: int, op: str, term: str, cursor: str | None) -> Iterator[tuple[str, str]]:
+        while True:
+            page = self._request(shard, op, (term, cursor))
+            yield from page
+            if len(page) < PAGE_SIZE:
+                return
+            cursor = page[-1][1]
+
+    def iter_objects(self, subject: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(object, cursor)`` pairs from the subject's shard."""
+        subject = normalize_term(subject)
+        # Shards hold plain symbol tables; a bad cursor must fail here, not in a worker.
+        _cursor_id(cursor)
+        return self._pages(shard_of(subject, self.workers), "objects", subject, cursor)
+
+    def iter_subjects(self, obj: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` pairs shard by shard.
+
+        Cursors are ``<shard>:<shard cursor>``.
+        """
+        obj = normalize_term(obj)
+        first, inner = 0, None
+        if cursor is not None:
+            shard, _, inner = cursor.partition(":")
+            if not shard.isdigit():
+                raise ValueError(f"Invalid cursor {cursor!r}")
+            first = int(shard)
+            _cursor_id(inner)
+        return self._subject_pages(obj, first, inner)
+
+    def _subject_pages(self, obj: str, first: int, inner: str | None) -> Iterator[tuple[str, str]]:
+        for shard in range(first, self.workers):
+            for subject, position in self._pages(shard, "subjects", obj, inner if shard == first else None):
+                yield subject, f"{shard}:{position}"
+
+    def iter_range(
+        self,
+        attribute: str,
+        low: float | None = None,
+        high: float | None = None,
+        cursor: str | None = None,
+    ) -> Iterator[tuple[str, float, str]]:
+        """Range queries would have to merge every shard's column."""
+        raise ValueError("Sharded engines do not support range queries")
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every fact, shard by shard."""
+        for shard in self._broadcast("facts", None):
+            for name, value in shard:
+                yield Symbol(name, value)
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        with self._exclusive():
+            for conn in self._connections:
+                conn.send(("stop", None))
+                conn.close()
+        for process in self._processes:
+            process.join()
+        self._connections.clear()
+        self._processes.clear()
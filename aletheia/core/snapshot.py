@@ -0,0 +1,134 @@
+"""Compact binary snapshots of engine facts.
+
+A snapshot is a short header followed by checksummed sections. String
+sections extend a table of UTF-8 strings; fact sections hold ``uint32``
+``(subject, object)`` pairs indexing that table. Since version 2 an optional
+alias section right after the header holds ``(alias, name)`` pairs the same
+way; version 1 snapshots are still read. Both sides work one section at a
+time, so neither needs the whole snapshot in memory, and a corrupted section
+is rejected before any of its facts are used.
+"""
+from __future__ import annotations
+
+import struct
+import zlib
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+SNAPSHOT_MAGIC = b"ALTS"
+SNAPSHOT_VERSION = 2
+# Version 1 had no alias section.
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sH")
+SECTION = struct.Struct("<cII")
+STRINGS = b"S"
+FACTS = b"F"
+ALIASES = b"L"
+END = b"E"
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+def _write_section(handle: BinaryIO, tag: bytes, payload: bytes) -> None:
+    handle.write(SECTION.pack(tag, len(payload), zlib.crc32(payload)))
+    handle.write(payload)
+
+
+def _flush(handle: BinaryIO, strings: list[bytes], pairs: array, tag: bytes = FACTS) -> None:
+    if strings:
+        lengths = array("I", map(len, strings))
+        _write_section(handle, STRINGS, struct.pack("<I", len(strings)) + lengths.tobytes() + b"".join(strings))
+        strings.clear()
+    if pairs:
+        _write_section(handle, tag, pairs.tobytes())
+        del pairs[:]
+
+
+def write_snapshot(
+    path: str | Path,
+    facts: Iterable[tuple[str, str]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    aliases: Iterable[tuple[str, str]] = (),
+) -> int:
+    """Stream ``facts`` and ``aliases`` into a snapshot file; return the fact count."""
+    ids: dict[str, int] = {}
+    strings: list[bytes] = []
+    pairs = array("I")
+    count = 0
+
+    def collect(pair: tuple[str, str]) -> None:
+        for name in pair:
+            ident = ids.get(name)
+            if ident is None:
+                ident = ids[name] = len(ids)
+                strings.append(name.encode("utf-8"))
+            pairs.append(ident)
+
+    with Path(path).open("wb") as handle:
+        handle.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+        for alias in aliases:
+            collect(alias)
+        _flush(handle, strings, pairs, ALIASES)
+        for fact in facts:
+            collect(fact)
+            count += 1
+            if len(pairs) >= 2 * chunk_size:
+                _flush(handle, strings, pairs)
+        _flush(handle, strings, pairs)
+        _write_section(handle, END, struct.pack("<Q", count))
+    return count
+
+
+def _read_exact(handle: BinaryIO, size: int) -> bytes:
+    data = handle.read(size)
+    if len(data) != size:
+        raise ValueError("Snapshot is truncated")
+    return data
+
+
+def read_snapshot(
+    path: str | Path, on_alias: Callable[[str, str], object] | None = None
+) -> Iterator[list[tuple[str, str]]]:
+    """Yield the facts of a snapshot one section-sized batch at a time.
+
+    Aliases are passed to ``on_alias`` before any fact is yielded.
+    """
+    names: list[str] = []
+    count = 0
+    with Path(path).open("rb") as handle:
+        magic, version = HEADER.unpack(_read_exact(handle, HEADER.size))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not an Aletheia snapshot")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"{path} is a version {version} snapshot; this reader supports {READABLE_VERSIONS}")
+        while True:
+            tag, size, checksum = SECTION.unpack(_read_exact(handle, SECTION.size))
+            payload = _read_exact(handle, size)
+            if zlib.crc32(payload) != checksum:
+                raise ValueError("Snapshot checksum mismatch")
+            if tag == STRINGS:
+                (total,) = struct.unpack_from("<I", payload)
+                lengths = array("I")
+                lengths.frombytes(payload[4:4 + 4 * total])
+                position = 4 + 4 * total
+                for length in lengths:
+                    names.append(payload[position:position + length].decode("utf-8"))
+                    position += length
+            elif tag == FACTS:
+                pairs = array("I")
+                pairs.frombytes(payload)
+                batch = [(names[pairs[i]], names[pairs[i + 1]]) for i in range(0, len(pairs), 2)]
+                count += len(batch)
+                yield batch
+            elif tag == ALIASES and version >= 2:
+                pairs = array("I")
+                pairs.frombytes(payload)
+                if on_alias is not None:
+                    for i in range(0, len(pairs), 2):
+                        on_alias(names[pairs[i]], names[pairs[i + 1]])
+            elif tag == END:
+                if struct.unpack("<Q", payload)[0] != count:
+                    raise ValueError("Snapshot fact count mismatch")
+                return
+            else:
+                raise ValueError(f"Unknown snapshot section {tag!r}")
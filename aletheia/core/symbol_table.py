@@ -1,31 +1,356 @@
-"""Symbol table for storing named values."""
+"""Symbol table for storing subject/object facts."""
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from threading import Lock
+from typing import Iterable, Iterator, Union
 
-@dataclass
+from .bloom import BloomFilter, pair_key, subject_key
+
+# Postings hold interned ids; 32 bits is plenty for a single process.
+POSTING_TYPECODE = "I"
+
+# A subject with one value stores the bare id; only larger sets get an array.
+Postings = Union[int, array]
+
+
+@dataclass(slots=True)
 class Symbol:
     """Simple key/value symbol."""
 
     name: str
     value: str
 
-class SymbolTable:
-    """Registry of symbols used by the logic engine."""
+
+class InternTable:
+    """Process-wide mapping between strings and dense integer ids.
+
+    Ids are never reused, so every table sharing an intern table agrees on
+    them and facts can be compared or joined as plain integers.
+    """
+
+    __slots__ = ("_ids", "_names", "_lock")
 
     def __init__(self) -> None:
-        self._symbols: dict[str, Symbol] = {}
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of interned strings."""
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        """Return the integer id for ``name``, assigning one if needed."""
+        ident = self._ids.get(name)
+        if ident is None:
+            with self._lock:
+                ident = self._ids.get(name)
+                if ident is None:
+                    ident = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = ident
+        return ident
+
+    def id_of(self, name: str) -> int | None:
+        """Return the integer id for ``name`` without interning it."""
+        return self._ids.get(name)
+
+    def name(self, ident: int) -> str:
+        """Return the string interned under ``ident``."""
+        return self._names[ident]
+
+    @property
+    def names(self) -> list[str]:
+        """Id-indexed list of interned strings; treat it as read-only."""
+        return self._names
+
+
+INTERN_TABLE = InternTable()
+
+
+def _insert(index: dict[int, Postings], key: int, item: int) -> bool:
+    """Insert ``item`` into the sorted postings for ``key``; False if present."""
+    postings = index.get(key)
+    if postings is None:
+        index[key] = item
+        return True
+    if postings.__class__ is int:
+        if postings == item:
+            return False
+        pair = (postings, item) if postings < item else (item, postings)
+        index[key] = array(POSTING_TYPECODE, pair)
+        return True
+    last = postings[-1]
+    if item > last:
+        postings.append(item)
+        return True
+    if item == last:
+        return False
+    pos = bisect_left(postings, item)
+    if postings[pos] == item:
+        return False
+    postings.insert(pos, item)
+    return True
+
+
+def _remove(index: dict[int, Postings], key: int, item: int) -> bool:
+    """Remove ``item`` from the postings for ``key`` in place; False if absent."""
+    postings = index.get(key)
+    if postings is None:
+        return False
+    if postings.__class__ is int:
+        if postings != item:
+            return False
+        del index[key]
+        return True
+    pos = bisect_left(postings, item)
+    if pos == len(postings) or postings[pos] != item:
+        return False
+    if len(postings) == 2:
+        index[key] = postings[1 - pos]
+    else:
+        del postings[pos]
+    return True
+
+
+def _discard(index: dict[int, Postings], removals: dict[int, set[int]], in_place: bool = True) -> None:
+    """Remove known ids from several postings.
+
+    A handful of ids is deleted in place; otherwise, or when the postings may
+    be shared (``in_place=False``), each postings is rebuilt once.
+    """
+    for key, items in removals.items():
+        postings = index[key]
+        if postings.__class__ is int:
+            del index[key]
+            continue
+        if in_place and len(items) * 64 < len(postings):
+            for item in items:
+                _remove(index, key, item)
+            continue
+        kept = [item for item in _items(postings) if item not in items]
+        if not kept:
+            del index[key]
+        else:
+            index[key] = kept[0] if len(kept) == 1 else array(POSTING_TYPECODE, kept)
+
+
+def _contains(postings: Postings, item: int) -> bool:
+    """Return True if the sorted postings contain ``item``."""
+    if postings.__class__ is int:
+        return postings == item
+    pos = bisect_left(postings, item)
+    return pos < len(postings) and postings[pos] == item
+
+
+def _size(postings: Postings | None) -> int:
+    """Return the number of ids in ``postings``."""
+    if postings is None:
+        return 0
+    return 1 if postings.__class__ is int else len(postings)
+
+
+def _items(postings: Postings | None) -> Iterable[int]:
+    """Return postings as an iterable of ids."""
+    if postings is None:
+        return ()
+    return (postings,) if postings.__class__ is int else postings
+
 
-    def add(self, name: str, value: str) -> None:
-        """Add a symbol to the table."""
-        self._symbols[name] = Symbol(name, value)
+def _cursor_id(cursor: str | None) -> int:
+    """Return the id a scan resumes after, -1 for none; ValueError if malformed."""
+    if cursor is None:
+        return -1
+    try:
+        return int(cursor)
+    except ValueError:
+        raise ValueError(f"Invalid cursor {cursor!r}") from None
+
+
+def _removals(
+    objects: dict[int, Postings], interner: InternTable, facts: Iterable[tuple[str, str]]
+) -> tuple[dict[int, set[int]], dict[int, set[int]]]:
+    """Group the facts present in ``objects`` by subject id and by object id."""
+    by_subject: dict[int, set[int]] = {}
+    by_object: dict[int, set[int]] = {}
+    ids = interner.id_of
+    for name, value in facts:
+        subject = ids(name)
+        obj = ids(value)
+        postings = objects.get(subject) if obj is not None else None
+        if postings is not None and _contains(postings, obj):
+            by_subject.setdefault(subject, set()).add(obj)
+            by_object.setdefault(obj, set()).add(subject)
+    return by_subject, by_object
+
+
+class SymbolTable:
+    """Registry of facts used by the logic engine.
+
+    Strings are interned to integer ids in a shared :class:`InternTable` and
+    every fact is indexed twice: the objects of each subject and the subjects
+    of each object are kept as sorted postings. A subject may therefore hold
+    any number of values, and both forward and reverse lookups are a dict hit
+    plus a binary search. No per-fact Python objects are kept; single-valued
+    postings are stored as the bare id and larger ones as ``array`` buffers.
+
+    An optional :class:`BloomFilter` over facts and subjects answers definite
+    misses before any index is consulted.
+    """
+
+    __slots__ = ("interner", "bloom", "_objects", "_subjects", "_count")
+
+    def __init__(self, interner: InternTable | None = None, bloom: BloomFilter | None = None) -> None:
+        self.interner = interner if interner is not None else INTERN_TABLE
+        self.bloom = bloom
+        self._objects: dict[int, Postings] = {}
+        self._subjects: dict[int, Postings] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of distinct facts stored."""
+        return self._count
+
+    def snapshot(self) -> SymbolTable:
+        """Return a readable view; a plain table is its own, unisolated view."""
+        return self
+
+    def intern(self, name: str) -> int:
+        """Return the integer id for ``name``, assigning one if needed."""
+        return self.interner.intern(name)
+
+    def id_of(self, name: str) -> int | None:
+        """Return the integer id for ``name`` without interning it."""
+        return self.interner.id_of(name)
+
+    def clear(self) -> None:
+        """Drop every fact while keeping the interned ids stable."""
+        self._objects.clear()
+        self._subjects.clear()
+        self._count = 0
+
+    def add(self, name: str, value: str) -> bool:
+        """Add a fact to the table; return False if it was already known."""
+        intern = self.interner.intern
+        subject = intern(name)
+        obj = intern(value)
+        new_subject = subject not in self._objects
+        if not _insert(self._objects, subject, obj):
+            return False
+        _insert(self._subjects, obj, subject)
+        self._count += 1
+        if self.bloom is not None:
+            self._remember(name, value, new_subject)
+        return True
+
+    def _remember(self, name: str, value: str, new_subject: bool) -> None:
+        self.bloom.add(pair_key(name, value))
+        if new_subject:
+            self.bloom.add(subject_key(name))
+
+    def add_many(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Add a batch of facts and return how many were new."""
+        if self.bloom is not None:
+            return sum(self.add(name, value) for name, value in facts)
+        intern = self.interner.intern
+        objects = self._objects
+        subjects = self._subjects
+        added = 0
+        for name, value in facts:
+            subject = intern(name)
+            obj = intern(value)
+            if _insert(objects, subject, obj):
+                _insert(subjects, obj, subject)
+                added += 1
+        self._count += added
+        return added
+
+    def discard_many(self, facts: Iterable[tuple[str, str]]) -> int:
+        """Remove a batch of facts and return how many were present.
+
+        The Bloom filter cannot forget keys, so removed facts only cost it a
+        recorded false positive when they are looked up again.
+        """
+        by_subject, by_object = _removals(self._objects, self.interner, facts)
+        _discard(self._objects, by_subject)
+        _discard(self._subjects, by_object)
+        removed = sum(len(items) for items in by_subject.values())
+        self._count -= removed
+        return removed
 
     def has(self, name: str, value: str) -> bool:
         """Return True if the symbol table stores the given mapping."""
-        symbol = self._symbols.get(name)
-        return bool(symbol and symbol.value == value)
+        bloom = self.bloom
+        if bloom is not None and pair_key(name, value) not in bloom:
+            return False
+        ids = self.interner.id_of
+        subject = ids(name)
+        obj = ids(value)
+        postings = self._objects.get(subject) if obj is not None else None
+        if postings is not None and _contains(postings, obj):
+            return True
+        if bloom is not None:
+            bloom.record_false_positive()
+        return False
 
     def get(self, name: str) -> str | None:
-        """Retrieve a symbol value by name."""
-        symbol = self._symbols.get(name)
-        return symbol.value if symbol else None
\ No newline at end of file
+        """Retrieve one value recorded for ``name``."""
+        subject = self.interner.id_of(name)
+        for obj in _items(self._objects.get(subject)):
+            return self.interner.name(obj)
+        return None
+
+    def objects(self, name: str) -> list[str]:
+        """Return every value recorded for the subject ``name``."""
+        names = self.interner.names
+        subject = self.interner.id_of(name)
+        return [names[obj] for obj in _items(self._objects.get(subject))]
+
+    def subjects(self, value: str) -> list[str]:
+        """Return every subject that has ``value`` recorded."""
+        names = self.interner.names
+        obj = self.interner.id_of(value)
+        return [names[subject] for subject in _items(self._subjects.get(obj))]
+
+    def iter_objects(self, name: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(value, cursor)`` for the subject ``name``.
+
+        Passing a yielded cursor back resumes right after that value.
+        """
+        return self._scan(self._objects.get(self.interner.id_of(name)), cursor)
+
+    def iter_subjects(self, value: str, cursor: str | None = None) -> Iterator[tuple[str, str]]:
+        """Lazily yield ``(subject, cursor)`` for the object ``value``."""
+        return self._scan(self._subjects.get(self.interner.id_of(value)), cursor)
+
+    def _scan(self, postings: Postings | None, cursor: str | None) -> Iterator[tuple[str, str]]:
+        # The cursor is checked here, not on the first next().
+        items = _items(postings)
+        start = bisect_right(items, _cursor_id(cursor))
+        return self._walk(items, start)
+
+    def _walk(self, items: Iterable[int], start: int) -> Iterator[tuple[str, str]]:
+        names = self.interner.names
+        for position in range(start, len(items)):
+            ident = items[position]
+            yield names[ident], str(ident)
+
+    def count_objects(self, name: str) -> int:
+        """Return how many values are recorded for the subject ``name``."""
+        if self.bloom is not None and subject_key(name) not in self.bloom:
+            return 0
+        return _size(self._objects.get(self.interner.id_of(name)))
+
+    def count_subjects(self, value: str) -> int:
+        """Return how many subjects have ``value`` recorded."""
+        return _size(self._subjects.get(self.interner.id_of(value)))
+
+    def facts(self) -> Iterator[Symbol]:
+        """Yield every stored fact."""
+        names = self.interner.names
+        for subject, postings in self._objects.items():
+            for obj in _items(postings):
+                yield Symbol(names[subject], names[obj])
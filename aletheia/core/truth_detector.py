@@ -1,10 +1,93 @@
 """Detect the truthfulness of statements."""
 from __future__ import annotations
 
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
+
+from .lexicon import PhraseMatcher, Scan, Scanner
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Phrases that often mark a deceptive or unreliable statement, with weights.
+DECEPTION_MARKERS: dict[str, float] = {
+    "lie": 1.0,
+    "lies": 1.0,
+    "lying": 1.0,
+    "false": 1.0,
+    "fake": 1.0,
+    "hoax": 1.0,
+    "fabricated": 1.0,
+    "made up": 0.8,
+    "misleading": 0.8,
+    "debunked": 0.8,
+    "allegedly": 0.5,
+    "supposedly": 0.5,
+    "rumor has it": 0.5,
+    "everyone knows": 0.5,
+    "to be honest": 0.4,
+    "to tell the truth": 0.4,
+    "trust me": 0.6,
+    "believe me": 0.6,
+    "i swear": 0.6,
+}
+
 
 class TruthDetector:
-    """Placeholder truth detector."""
+    """Flag statements that contain deception markers or other lexicon phrases.
+
+    The lexicon, ``DECEPTION_MARKERS`` by default, is compiled once into a
+    :class:`PhraseMatcher`, so scanning costs the same with tens of thousands
+    of phrases as with a handful. Batches are scored by a linear model over
+    lexical features read from ``weights``, by default
+    ``config/truth_weights.json``.
+    """
+
+    def __init__(
+        self,
+        lexicon: PhraseMatcher | Mapping[str, float] | Iterable[str] | None = None,
+        weights: str | Path | None = None,
+    ) -> None:
+        self.matcher = lexicon if isinstance(lexicon, PhraseMatcher) else PhraseMatcher(
+            DECEPTION_MARKERS if lexicon is None else lexicon
+        )
+        self.weights = weights
+        self._features = None
+        self._model = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, weights: str | Path | None = None) -> TruthDetector:
+        """Load the lexicon from a file of ``phrase`` or ``phrase<TAB>weight`` lines."""
+        return cls(PhraseMatcher.from_file(path), weights)
+
+    def scan(self, text: str) -> Scan:
+        """Return the lexicon matches in ``text`` and their score."""
+        return self.matcher.scan(text)
+
+    def scanner(self) -> Scanner:
+        """Return a scanner for a text read in chunks."""
+        return self.matcher.scanner()
 
     def detect(self, statement: str) -> bool:
-        """Pretend to detect truth using naive heuristics."""
-        return statement.lower() not in {"lie", "false"}
+        """Return False if ``statement`` contains any lexicon phrase."""
+        return not self.matcher.scan(statement).matches
+
+    def features(self, texts: Sequence[str]) -> np.ndarray:
+        """Return the :data:`~.scoring.FEATURES` matrix of ``texts``, one row per text."""
+        if self._features is None:
+            from .scoring import BatchFeatures
+
+            self._features = BatchFeatures(self.matcher)
+        return self._features(texts)
+
+    def score_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Return the model's probability that each of ``texts`` is truthful."""
+        if self._model is None:
+            from .scoring import DEFAULT_WEIGHTS, LinearModel
+
+            self._model = LinearModel.from_file(self.weights or DEFAULT_WEIGHTS)
+        return self._model.score(self.features(texts))
+
+    def detect_many(self, texts: Sequence[str], threshold: float = 0.5) -> np.ndarray:
+        """Return a boolean array: True where a text scores at least ``threshold``."""
+        return self.score_many(texts) >= threshold
@@ -0,0 +1,113 @@
+"""Bounded verdict cache invalidated through generation counters."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable
+
+DEFAULT_VERDICT_CACHE_SIZE = 65_536
+
+
+class VerdictCache:
+    """LRU cache of statement verdicts.
+
+    Each entry is stamped with the generation of the subject it depends on and
+    with a global epoch. Writing a fact bumps only its subject's generation, so
+    unrelated writes leave cached verdicts valid; :meth:`invalidate_all` bumps
+    the epoch for writes whose effect cannot be pinned to one subject. Stale
+    entries are detected on lookup rather than searched for on write.
+
+    A verdict computed while a write lands must not be cached: a miss from
+    :meth:`lookup` returns the stamp current before the verdict was read,
+    and :meth:`put` drops the verdict if a write has moved it since.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VERDICT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[bool, int, int]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached verdicts."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, subject: str) -> bool | None:
+        """Return the cached verdict for ``key`` or None if absent or stale."""
+        return self.lookup(key, subject)[0]
+
+    def lookup(self, key: Hashable, subject: str) -> tuple[bool | None, tuple[int, int]]:
+        """Return the cached verdict for ``key``, or None, with the current stamp.
+
+        On a miss, pass the stamp to :meth:`put` together with the verdict
+        computed afterwards. The subject is tracked from here on, so a write
+        to it between the two calls moves its generation.
+        """
+        with self._lock:
+            generation = self._generations.setdefault(subject, 0)
+            stamp = (self._epoch, generation)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, stamp
+            verdict, epoch, generation = entry
+            if (epoch, generation) != stamp:
+                del self._entries[key]
+                self.stale += 1
+                self.misses += 1
+                return None, stamp
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return verdict, stamp
+
+    def put(
+        self, key: Hashable, subject: str, verdict: bool, stamp: tuple[int, int] | None = None
+    ) -> None:
+        """Cache ``verdict`` for ``key``, which depends on ``subject``.
+
+        With ``stamp`` from :meth:`lookup`, the verdict is dropped if a write
+        has invalidated it since.
+        """
+        with self._lock:
+            if len(self._generations) > 4 * self.max_size:
+                # Generations only matter for cached subjects; start afresh.
+                self._generations.clear()
+                self._entries.clear()
+                self._epoch += 1
+            generation = self._generations.setdefault(subject, 0)
+            if stamp is not None and stamp != (self._epoch, generation):
+                return
+            self._entries[key] = (verdict, self._epoch, generation)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, subject: str) -> None:
+        """Mark every verdict about ``subject`` as stale."""
+        with self._lock:
+            if subject in self._generations:
+                self._generations[subject] += 1
+
+    def invalidate_all(self) -> None:
+        """Mark every cached verdict as stale."""
+        with self._lock:
+            self._epoch += 1
+
+    def stats(self) -> dict[str, float]:
+        """Return hit, miss and eviction counters and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,26 +1,308 @@
 """Entry point for running a minimal Aletheia API."""
 
-from fastapi import FastAPI
-from aletheia.core.inference import TruthInferenceEngine
+import asyncio
+import codecs
+import json
+import os
+from typing import AsyncIterator, Iterator
+
+from fastapi import Body, FastAPI, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from aletheia.core.conflicts import Conflict
+from aletheia.core.extraction import SentenceChunker
+from aletheia.core.inference import FIRST_VERIFY_CHUNK, VERIFY_CHUNK, TruthInferenceEngine
+from aletheia.core.loader import DEFAULT_BATCH_SIZE, parse_json_fact
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.persistent_store import PersistentSymbolTable
 from aletheia.agents.aletheia_oracle import AletheiaOracle
 
 app = FastAPI(title="Aletheia")
-engine = TruthInferenceEngine()
+store_path = os.getenv("ALETHEIA_STORE")
+engine = TruthInferenceEngine(
+    store=PersistentSymbolTable(store_path) if store_path else VersionedSymbolTable(),
+    verdict_cache_size=int(os.getenv("ALETHEIA_VERDICT_CACHE", "65536")),
+    fuzzy_distance=int(os.getenv("ALETHEIA_FUZZY_DISTANCE", "0")),
+)
 oracle = AletheiaOracle()
 
 
+class DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body is produced while the request body is still read.
+
+    :class:`StreamingResponse` watches for disconnects by calling
+    ``receive()``, which would swallow request body messages; this one only
+    starts watching once ``drained`` is set.
+    """
+
+    def __init__(self, content: AsyncIterator[str], drained: asyncio.Event, **kwargs) -> None:
+        super().__init__(content, **kwargs)
+        self.drained = drained
+
+    async def listen_for_disconnect(self, receive) -> None:
+        await self.drained.wait()
+        await super().listen_for_disconnect(receive)
+
+
 @app.get("/truth")
-def get_truth(statement: str) -> dict:
-    """Evaluate a statement and return the result."""
-    result = engine.evaluate(statement)
-    return {"statement": statement, "truth": result}
+def get_truth(statement: str, fuzzy: bool = False) -> dict:
+    """Evaluate a statement and return the result.
+
+    With ``fuzzy=true`` typos are tolerated and the matched statement is returned.
+    """
+    if not fuzzy:
+        return {"statement": statement, "truth": engine.evaluate(statement)}
+    try:
+        result, matched = engine.match(statement)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"statement": statement, "truth": result, "matched": matched}
+
+
+@app.post("/truth/batch")
+def get_truth_batch(statements: list[str] = Body(...)) -> dict:
+    """Evaluate a JSON list of statements and return verdicts in order."""
+    results = engine.evaluate_many(statements)
+    return {
+        "results": [
+            {"statement": statement, "truth": result}
+            for statement, result in zip(statements, results)
+        ]
+    }
+
+
+@app.post("/truth/document")
+async def get_truth_document(request: Request) -> StreamingResponse:
+    """Stream NDJSON verdicts with character offsets for every sentence of a text body.
+
+    The body is read as it arrives and evaluated chunk by chunk, so the first
+    verdicts are sent before a long upload has finished.
+    """
+
+    drained = asyncio.Event()
+
+    async def lines() -> AsyncIterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        chunker = SentenceChunker(VERIFY_CHUNK, first_size=FIRST_VERIFY_CHUNK)
+        offset = 0
+
+        async def verified(chunks: list[str]) -> AsyncIterator[str]:
+            nonlocal offset
+            for chunk in chunks:
+                verdicts = await run_in_threadpool(engine.verify_sentences, chunk, offset)
+                offset += len(chunk)
+                for start, end, sentence, truth in verdicts:
+                    record = {"start": start, "end": end, "sentence": sentence, "truth": truth}
+                    yield json.dumps(record) + "\n"
+
+        try:
+            async for body in request.stream():
+                async for line in verified(chunker.feed(decoder.decode(body))):
+                    yield line
+        finally:
+            drained.set()
+        async for line in verified(chunker.feed(decoder.decode(b"", final=True)) + chunker.close()):
+            yield line
+
+    return DuplexStreamingResponse(lines(), drained, media_type="application/x-ndjson")
+
+
+@app.get("/stats")
+def get_stats() -> dict:
+    """Return engine cache counters."""
+    return engine.stats()
 
 
 @app.post("/fact")
-def add_fact(subject: str, obj: str) -> dict:
-    """Record a fact for later truth evaluations."""
-    engine.add_fact(subject, obj)
-    return {"subject": subject, "object": obj}
+def add_fact(subject: str, obj: str, ttl: float | None = Query(None, gt=0)) -> dict:
+    """Record a fact for later truth evaluations, optionally expiring after ``ttl`` seconds."""
+    try:
+        engine.add_fact(subject, obj, ttl)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"subject": subject, "object": obj, "ttl": ttl}
+
+
+@app.post("/rule")
+def add_rule(text: str, name: str | None = None) -> dict:
+    """Add a forward-chaining rule such as ``if X is citizen then X is person``."""
+    try:
+        derived = engine.add_rule(text, name)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"rule": name or text, "derived": derived}
+
+
+@app.post("/alias")
+def add_alias(alias: str, name: str) -> dict:
+    """Make ``alias`` refer to the same facts as ``name``."""
+    try:
+        added = engine.add_alias(alias, name)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"alias": alias, "name": name, "added": added}
+
+
+@app.post("/exclusion")
+def add_exclusion(values: list[str] = Query(...), name: str | None = None) -> dict:
+    """Declare ``values`` mutually exclusive; report the conflicts already stored."""
+    try:
+        conflicts = engine.add_exclusion(values, name)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"values": values, "name": name, "conflicts": conflicts}
+
+
+def conflict_record(conflict: Conflict) -> dict:
+    return {
+        "subject": conflict.subject,
+        "object": conflict.obj,
+        "existing": conflict.existing,
+        "constraint": conflict.constraint,
+    }
+
+
+@app.get("/conflicts")
+def get_conflicts(
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=10_000),
+    stream: bool = False,
+    wait: float = Query(0, ge=0, le=30),
+):
+    """Page through contradictions logged after ``cursor``, oldest first.
+
+    With ``stream=true`` they are streamed as NDJSON; a positive ``wait``
+    keeps the stream open for new conflicts, e.g. during a bulk import,
+    until none arrives for that many seconds. Each open stream holds a
+    worker thread while it waits, hence the short limit.
+    """
+    try:
+        items = engine.iter_conflicts(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if stream:
+        def lines() -> Iterator[str]:
+            position = cursor
+            found = items
+            while True:
+                for conflict, position in found:
+                    yield json.dumps({**conflict_record(conflict), "cursor": position}) + "\n"
+                if not wait or not engine.wait_for_conflicts(position, wait):
+                    return
+                found = engine.iter_conflicts(position)
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    found, next_cursor = engine.conflicts_page(cursor, limit)
+    return {
+        "items": [conflict_record(conflict) for conflict in found],
+        "next_cursor": next_cursor,
+    }
+
+
+@app.post("/facts/bulk")
+async def add_facts_bulk(request: Request) -> dict:
+    """Stream an NDJSON body of facts into the engine in batches.
+
+    Batches are committed as they fill up. A bad record stops the import with
+    a 400 once every record before it is stored, and the detail says how many.
+    """
+    received = 0
+    added = 0
+    batch: list[tuple[str, str]] = []
+    buffer = b""
+
+    async def commit() -> None:
+        nonlocal added
+        added += await run_in_threadpool(engine.add_facts, batch)
+        batch.clear()
+
+    async def collect(line: bytes) -> None:
+        nonlocal received
+        try:
+            fact = parse_json_fact(line)
+        except ValueError as exc:
+            await commit()
+            raise HTTPException(
+                status_code=400,
+                detail=f"Bad record {received + 1}: {exc}; "
+                f"the {received} records before it were stored ({added} new)",
+            )
+        if fact is not None:
+            batch.append(fact)
+            received += 1
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            await collect(line)
+        if len(batch) >= DEFAULT_BATCH_SIZE:
+            await commit()
+    await collect(buffer)
+    await commit()
+    return {"received": received, "added": added}
+
+
+@app.get("/facts")
+def get_facts(
+    subject: str | None = None,
+    obj: str | None = Query(None, alias="object"),
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=10_000),
+    stream: bool = False,
+):
+    """Page through the objects of a subject or the subjects of an object.
+
+    With ``stream=true`` every remaining match is streamed as NDJSON instead.
+    """
+    if (subject is None) == (obj is None):
+        raise HTTPException(status_code=400, detail="Pass exactly one of subject or object")
+    try:
+        if subject is not None:
+            term, items, page = subject, engine.iter_objects(subject, cursor), engine.objects_page
+        else:
+            term, items, page = obj, engine.iter_subjects(obj, cursor), engine.subjects_page
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if stream:
+        def lines() -> Iterator[str]:
+            for item, position in items:
+                pair = (term, item) if subject is not None else (item, term)
+                yield json.dumps({"subject": pair[0], "object": pair[1], "cursor": position}) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    found, next_cursor = page(term, cursor, limit)
+    return {"items": found, "next_cursor": next_cursor}
+
+
+@app.get("/range")
+def get_range(
+    attribute: str,
+    low: float | None = None,
+    high: float | None = None,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=10_000),
+    stream: bool = False,
+):
+    """List subjects whose numeric ``attribute`` lies between ``low`` and ``high``, in value order.
+
+    With ``stream=true`` every remaining match is streamed as NDJSON instead.
+    """
+    try:
+        items = engine.iter_range(attribute, low, high, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if stream:
+        def lines() -> Iterator[str]:
+            for subject, value, position in items:
+                yield json.dumps({"subject": subject, "value": value, "cursor": position}) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+    found, next_cursor = engine.range_page(attribute, low, high, cursor, limit)
+    return {
+        "items": [{"subject": subject, "value": value} for subject, value in found],
+        "next_cursor": next_cursor,
+    }
 
 
 @app.get("/ask")
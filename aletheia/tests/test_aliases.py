@@ -0,0 +1,56 @@
+"""Tests for alias canonicalization."""
+
+from pathlib import Path
+
+from aletheia.core.aliases import AliasIndex
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.persistent_store import PersistentSymbolTable
+
+
+def test_union_find_picks_one_canonical_name() -> None:
+    aliases = AliasIndex()
+    assert aliases.union("nyc", "new york city") == ("nyc", "new york city")
+    assert aliases.union("big apple", "nyc") == ("big apple", "new york city")
+    assert aliases.union("big apple", "new york city") is None
+    assert aliases.canonical("big apple") == "new york city"
+    assert aliases.canonical("boston") == "boston"
+    assert sorted(aliases.pairs()) == [("big apple", "new york city"), ("nyc", "new york city")]
+
+
+def test_aliases_resolve_at_ingest_and_query_time() -> None:
+    engine = TruthInferenceEngine(verdict_cache_size=8)
+    engine.add_fact("NYC", "big")
+    engine.add_fact("new york city", "crowded")
+    assert engine.evaluate("new york city is big.") is False
+
+    assert engine.add_alias("nyc", "new york city") is True
+    assert engine.evaluate("new york city is big.") is True
+    assert engine.evaluate("NYC is crowded.") is True
+    engine.add_fact("Big Apple", "loud")
+    engine.add_alias("big apple", "nyc")
+    assert engine.evaluate("nyc is loud.") is True
+    assert sorted(fact.name for fact in engine.logic.facts()) == ["new york city"] * 3
+
+
+def test_aliases_persist_with_the_store(tmp_path: Path) -> None:
+    store = PersistentSymbolTable(tmp_path)
+    engine = TruthInferenceEngine(store=store)
+    engine.add_alias("nyc", "new york city")
+    engine.add_fact("nyc", "big")
+    store.compact()
+    store.close()
+
+    with PersistentSymbolTable(tmp_path) as reopened:
+        engine = TruthInferenceEngine(store=reopened)
+        assert engine.evaluate("NYC is big.") is True
+
+
+def test_aliases_round_trip_through_snapshots(tmp_path: Path) -> None:
+    engine = TruthInferenceEngine()
+    engine.add_alias("nyc", "new york city")
+    engine.add_fact("nyc", "big")
+    engine.save_snapshot(tmp_path / "facts.snap")
+
+    restored = TruthInferenceEngine()
+    restored.load_snapshot(tmp_path / "facts.snap")
+    assert restored.evaluate("nyc is big.") is True
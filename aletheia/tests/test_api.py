@@ -3,5 +3,15 @@ from aletheia.run import app
 def test_endpoints_present() -> None:
     routes = {route.path for route in app.routes}
     assert "/fact" in routes
+    assert "/facts/bulk" in routes
+    assert "/facts" in routes
+    assert "/alias" in routes
+    assert "/rule" in routes
+    assert "/range" in routes
+    assert "/exclusion" in routes
+    assert "/conflicts" in routes
+    assert "/truth/document" in routes
     assert "/truth" in routes
+    assert "/truth/batch" in routes
     assert "/ask" in routes
+    assert "/stats" in routes
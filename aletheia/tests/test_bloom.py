@@ -0,0 +1,49 @@
+"""Tests for Bloom-filtered lookups."""
+
+from pathlib import Path
+
+from aletheia.core.bloom import BloomFilter
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.persistent_store import PersistentSymbolTable
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+def test_bloom_filter_has_no_false_negatives(tmp_path: Path) -> None:
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"key{i}")
+    assert all(f"key{i}" in bloom for i in range(1000))
+    misses = sum(f"other{i}" in bloom for i in range(10_000))
+    assert misses < 300
+
+    bloom.write(tmp_path / "filter.bloom")
+    mapped = BloomFilter.open(tmp_path / "filter.bloom")
+    assert all(f"key{i}" in mapped for i in range(1000))
+    assert mapped.stats()["items"] == 1000
+    mapped.close()
+
+
+def test_symbol_table_rejects_misses_through_the_filter() -> None:
+    table = SymbolTable(InternTable(), bloom=BloomFilter(100))
+    table.add_many([("sky", "blue"), ("sky", "vast")])
+
+    assert table.has("sky", "blue")
+    assert not table.has("unicorn", "real")
+    assert table.count_objects("unicorn") == 0
+    assert table.count_objects("sky") == 2
+    assert table.bloom.stats()["rejected"] >= 1
+
+
+def test_persistent_store_writes_and_uses_a_filter(tmp_path: Path) -> None:
+    with PersistentSymbolTable(tmp_path) as store:
+        store.add_many([("sky", "blue"), ("grass", "green")])
+        store.compact()
+    assert (tmp_path / "facts.bloom").exists()
+
+    with PersistentSymbolTable(tmp_path) as store:
+        engine = TruthInferenceEngine(store=store)
+        assert engine.evaluate("sky is blue.") is True
+        assert engine.evaluate("unicorn is real.") is False
+        stats = engine.stats()["bloom"]
+        assert stats["items"] == 4
+        assert stats["rejected"] >= 1
@@ -0,0 +1,32 @@
+"""Tests for transitive ``is`` reasoning."""
+
+from aletheia.core.closure import ClosureIndex
+from aletheia.core.inference import TruthInferenceEngine
+
+
+def test_transitive_engine_chains_facts() -> None:
+    engine = TruthInferenceEngine(transitive=True)
+    engine.add_fact("socrates", "man")
+    engine.add_fact("man", "mortal")
+
+    assert engine.evaluate("socrates is mortal.") is True
+    assert engine.evaluate("socrates is not mortal.") is False
+    assert engine.evaluate("mortal is socrates.") is False
+    assert TruthInferenceEngine().evaluate("socrates is mortal.") is False
+
+
+def test_closure_updates_for_edges_added_out_of_order() -> None:
+    closure = ClosureIndex()
+    closure.add_edge(2, 3)
+    closure.add_edge(0, 1)
+    closure.add_edge(1, 2)
+    closure.add_edge(3, 40)
+
+    assert closure.reaches(0, 40)
+    assert closure.reaches(1, 3)
+    assert not closure.reaches(40, 0)
+    assert not closure.reaches(0, 0)
+
+    closure.add_edge(40, 0)
+    assert closure.reaches(0, 0)
+    assert closure.reaches(3, 1)
@@ -0,0 +1,90 @@
+"""Tests for exclusivity constraints and incremental conflict detection."""
+
+import pytest
+
+from aletheia.core.conflicts import Conflict, ConflictIndex
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.logic_engine import LogicEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.symbol_table import InternTable
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def logged(engine, cursor=None) -> list[tuple[str, str, str]]:
+    return [(c.subject, c.obj, c.existing) for c, _ in engine.iter_conflicts(cursor)]
+
+
+def test_declaring_a_constraint_reports_stored_conflicts() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([("cat", "Alive"), ("bob", "alive"), ("bob", "dead"), ("bob", "tall")])
+    assert engine.add_exclusion(["alive", "Dead"], name="life") == 1
+    assert engine.conflicts_page() == ([Conflict("bob", "dead", "alive", "life")], "1")
+
+
+def test_writes_are_checked_as_they_arrive() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_exclusion(["alive", "dead", "undead"])
+    engine.add_fact("cat", "alive")
+    assert logged(engine) == []
+    engine.add_fact("cat", "dead")
+    engine.add_fact("cat", "dead")
+    engine.add_facts([("cat", "undead"), ("dog", "dead"), ("dog", "tired")])
+    assert logged(engine) == [("cat", "dead", "alive"), ("cat", "undead", "alive"), ("cat", "undead", "dead")]
+    assert logged(engine, "2") == [("cat", "undead", "dead")]
+    # Contradicting facts are still stored.
+    assert engine.evaluate("cat is dead.") is True
+    assert engine.stats()["conflicts"] == {"constraints": 1, "conflicts": 3}
+
+
+def test_facts_derived_by_rules_are_checked() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_exclusion(["citizen", "foreigner"])
+    engine.add_rule("if X is voter then X is citizen")
+    engine.add_facts([("ann", "foreigner"), ("ann", "voter")])
+    assert logged(engine) == [("ann", "citizen", "foreigner")]
+
+
+def test_lapsed_facts_do_not_conflict() -> None:
+    clock = Clock()
+    engine = LogicEngine(symbols=VersionedSymbolTable(InternTable()), clock=clock)
+    engine.add_exclusion(["online", "offline"])
+    engine.add_fact("alice", "online", ttl=5)
+    clock.now = 10
+    engine.add_fact("alice", "offline")
+    assert logged(engine) == []
+    engine.add_fact("alice", "online")
+    assert logged(engine) == [("alice", "online", "offline")]
+
+
+def test_aliases_resolve_constraint_values() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_exclusion(["alive", "dead"])
+    engine.add_facts([("cat", "deceased"), ("cat", "dead")])
+    engine.add_alias("deceased", "dead")
+    assert logged(engine) == []
+    engine.add_fact("cat", "alive")
+    assert logged(engine) == [("cat", "alive", "dead")]
+
+
+def test_log_is_bounded_and_can_be_waited_on() -> None:
+    index = ConflictIndex(log_size=2)
+    with pytest.raises(ValueError):
+        index.declare(["alive", "alive"])
+    index.declare(["a", "b", "c", "d"])
+    index.record(index.check([("x", "a"), ("x", "b"), ("x", "c")]))
+    assert [(c.obj, c.existing, cursor) for c, cursor in index.since()] == [("c", "a", "2"), ("c", "b", "3")]
+    assert index.wait("2", timeout=0) is True
+    assert index.wait("3", timeout=0.01) is False
+    with pytest.raises(ValueError):
+        index.since("x")
+    with pytest.raises(ValueError):
+        index.wait("x", timeout=0)
+    index.discard([("x", "c")])
+    assert index.check([("x", "c")]) == [Conflict("x", "c", "a", "a / b / c / d"), Conflict("x", "c", "b", "a / b / c / d")]
@@ -0,0 +1,135 @@
+"""Tests for fact expiry."""
+
+import pytest
+
+from aletheia.core.expiry import TimerWheel
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.logic_engine import LogicEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.persistent_store import PersistentSymbolTable
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_wheel_fires_items_on_their_tick_across_levels() -> None:
+    wheel = TimerWheel()
+    ticks = {item: tick for item, tick in enumerate([1, 63, 64, 65, 4095, 4096, 300_000, 20_000_000])}
+    for item, tick in ticks.items():
+        wheel.schedule(tick, [item])
+    fired = {}
+    for tick in [1, 63, 64, 65, 4095, 4096, 300_000, 20_000_000]:
+        for item in wheel.advance(tick):
+            fired[item] = tick
+    assert fired == ticks
+    assert len(wheel) == 0
+
+
+@pytest.mark.parametrize("store", [SymbolTable, VersionedSymbolTable])
+def test_lapsed_facts_stop_matching_then_get_reclaimed(store) -> None:
+    clock = Clock()
+    engine = LogicEngine(symbols=store(InternTable()), verdict_cache_size=8, clock=clock)
+    engine.add_fact("alice", "online", ttl=5)
+    engine.add_fact("alice", "human")
+    assert engine.evaluate("alice is online.") is True
+
+    clock.now = 5.5
+    # Still stored until the next tick, but no longer true.
+    assert engine.holds("alice", "online") is False
+    clock.now = 6
+    assert engine.evaluate("alice is online.") is False
+    assert engine.evaluate("alice is human.") is True
+    assert len(engine.symbols) == 1
+    assert len(engine.expiry) == 0
+
+
+def test_namespace_ttl_and_renewal() -> None:
+    clock = Clock()
+    engine = LogicEngine(clock=clock)
+    engine.set_ttl("Online", 10)
+    engine.add_facts([("bob", "online"), ("bob", "admin")])
+    clock.now = 8
+    engine.add_fact("bob", "online")
+    clock.now = 12
+    assert engine.evaluate("bob is online.") is True
+    engine.add_fact("bob", "online", ttl=1)
+    clock.now = 14
+    assert engine.evaluate("bob is online.") is False
+    assert engine.evaluate("bob is admin.") is True
+
+
+def test_expiry_needs_a_supporting_engine(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        LogicEngine(transitive=True).add_fact("sky", "blue", ttl=1)
+    with pytest.raises(ValueError):
+        LogicEngine(symbols=PersistentSymbolTable(tmp_path)).set_ttl("online", 1)
+    engine = TruthInferenceEngine(workers=1)
+    try:
+        with pytest.raises(ValueError):
+            engine.add_fact("sky", "blue", ttl=1)
+    finally:
+        engine.close()
+
+
+def test_aliasing_keeps_the_deadlines_of_moved_facts() -> None:
+    clock = Clock()
+    engine = LogicEngine(clock=clock)
+    engine.add_fact("bob", "online", ttl=5)
+    engine.add_fact("bob", "admin", ttl=5)
+    engine.add_fact("robert", "admin", ttl=20)
+    engine.add_fact("bob", "human")
+    engine.add_alias("bob", "robert")
+    assert engine.evaluate("robert is online.") is True
+    clock.now = 10
+    assert engine.evaluate("robert is online.") is False
+    assert engine.evaluate("robert is admin.") is True
+    assert engine.evaluate("robert is human.") is True
+    clock.now = 30
+    assert engine.evaluate("robert is admin.") is False
+    assert engine.evaluate("robert is human.") is True
+    assert len(engine.expiry) == 0
+
+
+@pytest.mark.parametrize("now", [5.5, 10.5])
+def test_rules_added_later_skip_lapsed_facts(now) -> None:
+    clock = Clock()
+    engine = LogicEngine(clock=clock)
+    engine.add_fact("bob", "citizen", ttl=5.2)
+    engine.add_fact("bob", "adult")
+    # At 5.5 the fact has lapsed but its tick has not come yet.
+    clock.now = now
+    assert engine.add_rule("if X is citizen and X is adult then X is voter") == 0
+    assert engine.evaluate("bob is voter.") is False
+
+
+@pytest.mark.parametrize("now", [5.5, 10.5])
+def test_materialize_skips_lapsed_facts(now) -> None:
+    clock = Clock()
+    engine = LogicEngine(clock=clock)
+    engine.add_fact("bob", "citizen", ttl=5.2)
+    engine.add_fact("bob", "adult")
+    engine.add_fact("ann", "citizen")
+    engine.add_fact("ann", "adult")
+    clock.now = now
+    assert engine.materialize(["if X is citizen and X is adult then X is voter"]) == 1
+    assert engine.evaluate("bob is voter.") is False
+    assert engine.evaluate("ann is voter.") is True
+
+
+def test_queries_skip_lapsed_facts_before_their_tick() -> None:
+    clock = Clock()
+    engine = LogicEngine(clock=clock)
+    engine.add_fact("bob", "online", ttl=5.2)
+    engine.add_fact("bob", "admin")
+    engine.add_fact("ann", "online")
+    clock.now = 5.5
+    assert len(engine.symbols) == 3
+    assert sorted((fact.name, fact.value) for fact in engine.facts()) == [("ann", "online"), ("bob", "admin")]
+    assert [obj for obj, _ in engine.iter_objects("bob")] == ["admin"]
+    assert [subject for subject, _ in engine.iter_subjects("online")] == ["ann"]
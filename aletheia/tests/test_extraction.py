@@ -0,0 +1,61 @@
+"""Tests for streaming fact extraction from documents."""
+
+from pathlib import Path
+
+from aletheia.core.extraction import SentenceChunker, extract_facts, iter_chunks
+from aletheia.core.inference import TruthInferenceEngine
+
+TEXT = """The sky is blue. Grass is green and snow is white.
+Is the sea wet? The sea is not dry. Pi is 3.14.
+Tower height is greater than 300. Salt or sugar is sweet.
+
+Water is
+wet.
+"""
+
+
+def test_extract_facts_keeps_positive_clauses_only() -> None:
+    sentences, facts = extract_facts(TEXT)
+    assert sentences == 8
+    assert facts == [
+        ("the sky", "blue"), ("grass", "green"), ("snow", "white"), ("pi", "3.14"),
+        ("salt or sugar", "sweet"), ("water", "wet"),
+    ]
+
+
+def test_chunks_end_on_sentence_boundaries(tmp_path: Path) -> None:
+    path = tmp_path / "doc.txt"
+    path.write_text(TEXT)
+    chunks = list(iter_chunks(path, chunk_size=16))
+    assert "".join(chunks) == TEXT
+    assert all(chunk.rstrip()[-1] in ".!?" for chunk in chunks[:-1])
+    assert sum(extract_facts(chunk)[0] for chunk in chunks) == 8
+
+
+def test_load_documents_in_workers_matches_in_process(tmp_path: Path) -> None:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"doc{index}.txt"
+        path.write_text(TEXT + f"Entity {index} is kind {index}.\n")
+        paths.append(path)
+
+    reports = []
+    single = TruthInferenceEngine()
+    stats = single.load_documents(paths, workers=0, batch_size=4, progress=lambda s: reports.append(s.facts))
+    assert (stats.sentences, stats.facts, stats.added) == (27, 21, 9)
+    assert reports[-1] == 21 and len(reports) > 1
+    assert stats.facts_per_second > 0
+
+    pooled = TruthInferenceEngine()
+    assert pooled.load_documents(paths, workers=2, chunk_size=32).added == 9
+    assert pooled.evaluate("entity 2 is kind 2.") is True
+    assert pooled.evaluate_many(["pi is 3.14.", "the sea is dry."]) == [True, False]
+
+
+def test_chunker_starts_small_and_grows() -> None:
+    chunker = SentenceChunker(chunk_size=64, first_size=8)
+    chunks = chunker.feed("A is b. " * 40) + chunker.close()
+    assert chunks[0] == "A is b."
+    sizes = [len(chunk) for chunk in chunks]
+    assert sizes[:4] == sorted(sizes[:4]) and max(sizes) <= 64
+    assert "".join(chunks) == "A is b. " * 40
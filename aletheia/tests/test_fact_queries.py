@@ -0,0 +1,70 @@
+"""Tests for subject/object pattern queries."""
+
+from pathlib import Path
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.persistent_store import PersistentSymbolTable
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+def _page_all(page, term: str, limit: int) -> list[str]:
+    found, cursor = page(term, None, limit)
+    while cursor is not None:
+        more, cursor = page(term, cursor, limit)
+        found.extend(more)
+    return found
+
+
+@pytest.mark.parametrize("kind", ["memory", "versioned", "persistent"])
+def test_pages_cover_every_match_once(kind: str, tmp_path: Path) -> None:
+    stores = {
+        "memory": lambda: SymbolTable(InternTable()),
+        "versioned": lambda: VersionedSymbolTable(InternTable()),
+        "persistent": lambda: PersistentSymbolTable(tmp_path),
+    }
+    engine = TruthInferenceEngine(store=stores[kind]())
+    engine.add_facts([("sky", f"shade{i}") for i in range(7)])
+    if kind == "persistent":
+        engine.logic.symbols.compact()
+    engine.add_facts([("sky", f"shade{i}") for i in range(7, 10)] + [("sea", "shade3")])
+
+    objects = _page_all(engine.objects_page, "Sky", 3)
+    assert sorted(objects) == sorted(f"shade{i}" for i in range(10))
+    assert sorted(_page_all(engine.subjects_page, "shade3", 1)) == ["sea", "sky"]
+    assert engine.objects_page("unicorn") == ([], None)
+
+
+@pytest.mark.parametrize("kind", ["memory", "versioned", "persistent"])
+def test_bad_cursors_are_rejected_before_iterating(kind: str, tmp_path: Path) -> None:
+    stores = {
+        "memory": lambda: SymbolTable(InternTable()),
+        "versioned": lambda: VersionedSymbolTable(InternTable()),
+        "persistent": lambda: PersistentSymbolTable(tmp_path),
+    }
+    engine = TruthInferenceEngine(store=stores[kind]())
+    engine.add_fact("sky", "blue")
+    for cursor in ["x", "o:x", "i:x", "q:1"]:
+        with pytest.raises(ValueError):
+            engine.iter_objects("sky", cursor)
+        with pytest.raises(ValueError):
+            engine.iter_subjects("blue", cursor)
+
+
+def test_sharded_engine_pages_across_shards() -> None:
+    engine = TruthInferenceEngine(workers=3)
+    try:
+        engine.add_facts([(f"thing{i}", "blue") for i in range(20)])
+        assert sorted(_page_all(engine.subjects_page, "blue", 6)) == sorted(f"thing{i}" for i in range(20))
+        assert engine.objects_page("thing4") == (["blue"], None)
+        for cursor in ["x", "1:x", "x:1"]:
+            with pytest.raises(ValueError):
+                engine.iter_subjects("blue", cursor)
+        with pytest.raises(ValueError):
+            engine.iter_objects("thing4", "x")
+        # The workers survived the bad cursors.
+        assert engine.objects_page("thing4") == (["blue"], None)
+    finally:
+        engine.close()
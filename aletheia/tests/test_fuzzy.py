@@ -0,0 +1,50 @@
+"""Tests for typo-tolerant matching."""
+
+import pytest
+
+from aletheia.core.fuzzy import FuzzyIndex, edit_distance
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.persistent_store import PersistentSymbolTable
+
+
+def test_edit_distance_counts_transpositions_and_stops_early() -> None:
+    assert edit_distance("blue", "blu", 2) == 1
+    assert edit_distance("sky", "ksy", 2) == 1
+    assert edit_distance("kitten", "sitting", 3) == 3
+    assert edit_distance("kitten", "sitting", 1) == 2
+
+
+def test_index_returns_closest_terms_first() -> None:
+    index = FuzzyIndex(max_distance=2)
+    index.update(["sky", "skye", "sea", "blue", "blues", "green"])
+    assert index.lookup("skye")[:2] == [("skye", 0), ("sky", 1)]
+    assert [term for term, _ in index.lookup("blu")] == ["blue", "blues"]
+    assert index.lookup("purple") == []
+    assert index.lookup("blu", max_distance=0) == []
+
+
+def test_match_returns_the_corrected_fact() -> None:
+    engine = TruthInferenceEngine(fuzzy_distance=2)
+    engine.add_facts([("sky", "blue"), ("grass", "green")])
+    engine.add_alias("heavens", "sky")
+
+    assert engine.evaluate("skye is blu.") is False
+    assert engine.match("skye is blu.") == (True, "sky is blue.")
+    assert engine.match("heavnes is blue.") == (True, "sky is blue.")
+    assert engine.match("sky is not blu.") == (False, "sky is not blue.")
+    assert engine.match("grss is green and sky is red.") == (False, "grass is green and sky is red.")
+    assert engine.match("gibberish") == (False, None)
+
+
+def test_fuzzy_engine_over_a_reopened_store(tmp_path) -> None:
+    store = PersistentSymbolTable(tmp_path)
+    TruthInferenceEngine(store=store).add_facts([("sky", "blue"), ("grass", "green")])
+    store.close()
+
+    engine = TruthInferenceEngine(store=PersistentSymbolTable(tmp_path), fuzzy_distance=1)
+    assert engine.match("skye is blue.") == (True, "sky is blue.")
+
+
+def test_match_needs_fuzzy_mode() -> None:
+    with pytest.raises(ValueError):
+        TruthInferenceEngine().match("sky is blue.")
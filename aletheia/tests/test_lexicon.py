@@ -0,0 +1,74 @@
+"""Tests for the Aho-Corasick phrase scanner and the truth detector."""
+
+import pytest
+
+from aletheia.core.lexicon import PhraseMatcher
+from aletheia.core.truth_detector import TruthDetector
+
+
+def spans(scan) -> list[tuple[int, int, str]]:
+    return [(match.start, match.end, match.phrase) for match in scan.matches]
+
+
+def test_scan_reports_overlapping_and_nested_phrases() -> None:
+    matcher = PhraseMatcher({"new york": 1.0, "york city": 2.0, "new york city hall": 3.0, "city": 0.5})
+    text = "Visit New York City today."
+    scan = matcher.scan(text)
+    assert spans(scan) == [(6, 14, "new york"), (10, 19, "york city"), (15, 19, "city")]
+    assert [text[start:end] for start, end, _ in spans(scan)] == ["New York", "York City", "City"]
+    assert scan.words == 5
+    assert scan.weight == 3.5
+    assert scan.score == 0.7
+
+
+def test_scan_matches_whole_words_only() -> None:
+    matcher = PhraseMatcher(["lie", "trust me"])
+    assert matcher.scan("I believe the lien was paid; trustme.").matches == []
+    assert spans(matcher.scan("Trust  me, no LIE!")) == [(0, 9, "trust me"), (14, 17, "lie")]
+
+
+def test_streaming_matches_equal_a_single_scan() -> None:
+    matcher = PhraseMatcher({f"phrase {i} end": 1.0 for i in range(200)} | {"end": 0.1})
+    text = " ".join(f"phrase {i} end." for i in range(0, 400, 3))
+    whole = matcher.scan(text)
+    for size in (1, 3, 7, 64):
+        scanner = matcher.scanner()
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert list(scanner.iter_matches(chunks)) == whole.matches
+        assert scanner.words == whole.words
+        assert scanner.score == pytest.approx(whole.score)
+
+
+def test_streaming_a_long_token_stays_linear() -> None:
+    matcher = PhraseMatcher(["hoax"])
+    token = "x" * 40_000
+    text = f"a {token}. hoax"
+    expected = [(len(text) - 4, len(text), "hoax")]
+    scanner = matcher.scanner()
+    found = scanner.feed(text[:-6]) + scanner.feed(text[-6:]) + scanner.close()
+    assert [(match.start, match.end, match.phrase) for match in found] == expected
+    scanner = matcher.scanner()
+    chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+    assert [(match.start, match.end) for match in scanner.iter_matches(chunks)] == [expected[0][:2]]
+    assert scanner.words == 3
+
+
+def test_matcher_from_file(tmp_path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    path.write_text("# markers\nhoax\t2.5\nfalse flag\n\n")
+    matcher = PhraseMatcher.from_file(path)
+    assert len(matcher) == 2
+    assert [(m.phrase, m.weight) for m in matcher.scan("a false flag hoax").matches] == [
+        ("false flag", 1.0),
+        ("hoax", 2.5),
+    ]
+
+
+def test_truth_detector_flags_markers_anywhere() -> None:
+    detector = TruthDetector()
+    assert detector.detect("lie") is False
+    assert detector.detect("False") is False
+    assert detector.detect("The moon landing was a hoax, trust me.") is False
+    assert detector.detect("I believe the report is accurate.") is True
+    assert detector.scan("Trust me.").score > 0
+    assert TruthDetector(["accurate"]).detect("I believe the report is accurate.") is False
@@ -0,0 +1,52 @@
+"""Tests for bulk fact ingestion."""
+
+from pathlib import Path
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.loader import parse_json_fact
+
+
+def test_add_facts_counts_new_facts() -> None:
+    engine = TruthInferenceEngine()
+    assert engine.add_facts([("Sky", "Blue"), ("grass", "green"), ("sky", "blue")]) == 2
+    assert engine.evaluate("sky is blue.") is True
+
+
+def test_load_facts_from_files(tmp_path: Path) -> None:
+    jsonl = tmp_path / "facts.jsonl"
+    jsonl.write_text('{"subject": "sky", "object": "blue"}\n\n["grass", "green"]\n')
+    tsv = tmp_path / "facts.tsv"
+    tsv.write_text("subject\tobject\nsea\twet\nfire\thot\n")
+    csv = tmp_path / "facts.csv"
+    csv.write_text("snow,White\n")
+
+    engine = TruthInferenceEngine()
+    seen: list[int] = []
+    assert engine.load_facts(jsonl, batch_size=1, progress=seen.append) == 2
+    assert seen == [1, 2]
+    assert engine.load_facts(tsv) == 2
+    assert engine.load_facts(csv) == 1
+
+    assert engine.evaluate("grass is green.") is True
+    assert engine.evaluate("fire is hot.") is True
+    assert engine.evaluate("snow is white.") is True
+    assert engine.evaluate("subject is object.") is False
+
+
+def test_json_facts_must_be_pairs_of_strings() -> None:
+    assert parse_json_fact('{"subject": "sky", "object": "blue"}') == ("sky", "blue")
+    assert parse_json_fact(b'["grass", "green"]') == ("grass", "green")
+    assert parse_json_fact("  \n") is None
+    for line in [
+        '{"subject": 1, "object": 2}',
+        '{"subject": "sky"}',
+        "[1, 2]",
+        '["a", "b", "c"]',
+        '"ab"',
+        "null",
+        "{bad",
+    ]:
+        with pytest.raises(ValueError):
+            parse_json_fact(line)
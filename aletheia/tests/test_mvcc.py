@@ -0,0 +1,106 @@
+"""Tests for the multi-version fact store."""
+
+import threading
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+
+
+def test_snapshots_are_isolated_from_later_writes() -> None:
+    table = VersionedSymbolTable()
+    table.add("sky", "blue")
+    before = table.snapshot()
+    assert table.add_many([("sky", "vast"), ("sea", "blue"), ("sky", "blue")]) == 2
+
+    assert len(before) == 1
+    assert not before.has("sky", "vast")
+    assert table.has("sky", "vast")
+    assert sorted(table.objects("sky")) == ["blue", "vast"]
+    assert sorted(table.subjects("blue")) == ["sea", "sky"]
+    assert table.stats()["version"] == 2
+
+
+def test_layers_stay_logarithmic() -> None:
+    table = VersionedSymbolTable()
+    for i in range(1000):
+        table.add(f"s{i}", "o")
+
+    assert len(table) == 1000
+    assert table.stats()["layers"] <= 10
+    assert len(table.subjects("o")) == 1000
+
+
+def test_engine_over_versioned_store() -> None:
+    engine = TruthInferenceEngine(store=VersionedSymbolTable(), verdict_cache_size=16)
+    engine.add_facts([("sky", "blue")])
+    assert engine.evaluate_many(["sky is blue.", "sky is red."]) == [True, False]
+
+
+def test_concurrent_readers_never_see_partial_batches() -> None:
+    table = VersionedSymbolTable()
+    stop = threading.Event()
+    errors: list[str] = []
+
+    def writer(prefix: str) -> None:
+        for batch in range(200):
+            subject = f"{prefix}{batch}"
+            table.add_many([(subject, "left"), (subject, "right")])
+
+    def reader() -> None:
+        last_version = -1
+        while not stop.is_set():
+            snapshot = table.snapshot()
+            if snapshot.version < last_version:
+                errors.append("version went backwards")
+            last_version = snapshot.version
+            if len(snapshot) % 2:
+                errors.append("odd fact count")
+            for subject in snapshot.subjects("left"):
+                if not snapshot.has(subject, "right"):
+                    errors.append(f"half-applied batch for {subject}")
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    writers = [threading.Thread(target=writer, args=(prefix,)) for prefix in "abc"]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert len(table) == 1200
+
+
+def test_discard_publishes_a_version_without_the_facts() -> None:
+    table = VersionedSymbolTable()
+    table.add_many([("sky", "blue"), ("sea", "blue")])
+    table.add_many([("sky", "vast")])
+    before = table.snapshot()
+
+    assert table.discard_many([("sky", "blue"), ("sky", "green")]) == 1
+    assert table.has("sky", "blue") is False
+    assert table.subjects("blue") == ["sea"]
+    assert len(table) == 2
+    assert before.has("sky", "blue") is True
+    assert sorted(before.subjects("blue")) == ["sea", "sky"]
+
+
+def test_discards_share_the_untouched_postings() -> None:
+    table = VersionedSymbolTable()
+    facts = [(f"entity{i}", f"kind{i % 10}") for i in range(1000)]
+    table.add_many(facts)
+    before = table.snapshot()
+    for name, value in facts[:100]:
+        assert table.discard_many([(name, value)]) == 1
+        assert table.discard_many([(name, value)]) == 0
+    assert len(table) == 900
+    assert sorted((fact.name, fact.value) for fact in table.facts()) == sorted(facts[100:])
+    assert table.count_subjects("kind3") == 90
+    assert [subject for subject, _ in table.iter_subjects("kind3")][:2] == ["entity103", "entity113"]
+    assert len(before) == 1000 and before.has("entity0", "kind0")
+
+    table.add_many([("entity0", "kind0")] * 2 + [(f"new{i}", "kind0") for i in range(2000)])
+    assert table.has("entity0", "kind0") and not table.has("entity1", "kind1")
+    assert len(table) == 2901
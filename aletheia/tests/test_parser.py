@@ -0,0 +1,27 @@
+"""Tests for the statement parser."""
+
+from aletheia.core.parser import Clause, StatementParser, compile_statement
+
+
+def test_compile_statement_builds_clauses() -> None:
+    assert compile_statement("Sky is Blue.") == Clause("sky", "is", "blue")
+    assert compile_statement(" sky  is not  green. ") == Clause("sky", "is", "green", True)
+    assert compile_statement("new york is not a city is big.") == Clause(
+        "new york", "is", "a city is big", True
+    )
+    assert compile_statement("sky is blue") is None
+    assert compile_statement("is blue.") is None
+    assert compile_statement("") is None
+
+
+def test_parser_cache_counts_hits_and_misses() -> None:
+    parser = StatementParser(cache_size=2)
+    parser.parse("sky is blue.")
+    parser.parse("sky is blue.")
+    parser.parse("grass is green.")
+    parser.parse("sea is wet.")
+
+    stats = parser.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["size"] == 2
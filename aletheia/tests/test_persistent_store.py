@@ -0,0 +1,157 @@
+"""Tests for the disk-backed fact store."""
+
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.persistent_store import PersistentSymbolTable
+
+
+def test_facts_survive_reopen_before_and_after_compaction(tmp_path: Path) -> None:
+    with PersistentSymbolTable(tmp_path, compact_threshold=3) as store:
+        store.add_many([("sky", "blue"), ("sky", "vast"), ("grass", "green")])
+        store.add("sea", "blue")
+        assert store.add("sky", "blue") is False
+
+    with PersistentSymbolTable(tmp_path) as store:
+        assert len(store) == 4
+        assert store.has("sky", "vast")
+        assert store.has("sea", "blue")
+        assert not store.has("sky", "green")
+        assert sorted(store.objects("sky")) == ["blue", "vast"]
+        assert sorted(store.subjects("blue")) == ["sea", "sky"]
+        store.compact()
+        assert store.has("sea", "blue")
+
+
+def test_engine_uses_persistent_store(tmp_path: Path) -> None:
+    with PersistentSymbolTable(tmp_path) as store:
+        TruthInferenceEngine(store=store).add_fact("Socrates", "man")
+
+    with PersistentSymbolTable(tmp_path) as store:
+        engine = TruthInferenceEngine(transitive=True, store=store)
+        engine.add_fact("man", "mortal")
+        assert engine.evaluate("socrates is mortal.") is True
+
+
+def test_torn_log_tail_is_discarded(tmp_path: Path) -> None:
+    with PersistentSymbolTable(tmp_path) as store:
+        store.add("sky", "blue")
+    with (tmp_path / "facts.log").open("ab") as log:
+        log.write(b"A\x05\x00")
+
+    with PersistentSymbolTable(tmp_path) as store:
+        assert len(store) == 1
+        store.add("grass", "green")
+    with PersistentSymbolTable(tmp_path) as store:
+        assert store.has("grass", "green")
+
+
+def test_concurrent_writes_survive_reopen(tmp_path: Path) -> None:
+    threads, per_thread = 8, 3000
+    failures: list[BaseException] = []
+
+    def scan(store: PersistentSymbolTable, done: threading.Event) -> None:
+        # Reads and open scans must survive compactions swapping the index.
+        try:
+            while not done.is_set():
+                for _ in store.iter_subjects("value"):
+                    pass
+                store.has("t0 s0", "value")
+        except BaseException as exc:
+            failures.append(exc)
+
+    def write(store: PersistentSymbolTable, thread: int) -> None:
+        for i in range(per_thread):
+            store.add(f"t{thread} s{i}", "value")
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        with PersistentSymbolTable(tmp_path, compact_threshold=5000) as store:
+            done = threading.Event()
+            reader = threading.Thread(target=scan, args=(store, done))
+            reader.start()
+            writers = [threading.Thread(target=write, args=(store, n)) for n in range(threads)]
+            for writer in writers:
+                writer.start()
+            for writer in writers:
+                writer.join()
+            done.set()
+            reader.join()
+            assert len(store) == threads * per_thread
+    finally:
+        sys.setswitchinterval(interval)
+    assert failures == []
+
+    with PersistentSymbolTable(tmp_path) as store:
+        assert len(store) == threads * per_thread
+        assert store.count_subjects("value") == threads * per_thread
+
+
+def test_compactions_merge_into_the_index(tmp_path: Path) -> None:
+    expected = set()
+    with PersistentSymbolTable(tmp_path, compact_threshold=10**9) as store:
+        for round_ in range(5):
+            facts = [(f"s{(round_ * 7 + i) % 23}", f"o{i % (round_ + 2)}") for i in range(40)]
+            store.add_many(facts)
+            expected.update(facts)
+            store.compact()
+            assert not (tmp_path / "facts.log.old").exists()
+        assert {(fact.name, fact.value) for fact in store.facts()} == expected
+        assert store.bloom.stats()["items"] <= store.bloom.capacity
+
+    with PersistentSymbolTable(tmp_path) as store:
+        assert len(store) == len(expected)
+        assert all(store.has(name, value) for name, value in expected)
+        assert sorted(store.objects("s3")) == sorted(value for name, value in expected if name == "s3")
+
+
+def test_writes_go_on_while_compaction_runs(tmp_path: Path, monkeypatch) -> None:
+    from aletheia.core import persistent_store
+
+    merging, release = threading.Event(), threading.Event()
+    write_index = persistent_store.write_index
+
+    def slow_write_index(*args, **kwargs) -> None:
+        merging.set()
+        release.wait(10)
+        write_index(*args, **kwargs)
+
+    monkeypatch.setattr(persistent_store, "write_index", slow_write_index)
+    with PersistentSymbolTable(tmp_path, compact_threshold=2) as store:
+        store.add_many([("sky", "blue"), ("grass", "green")])
+        assert merging.wait(10)
+        # The merge is held up, yet writes return and every fact is readable.
+        assert store.add("sea", "blue") is True
+        assert store.add("sky", "blue") is False
+        assert sorted(store.subjects("blue")) == ["sea", "sky"]
+        assert len(store) == 3
+        release.set()
+        store.compact()
+        assert store.has("grass", "green")
+
+    with PersistentSymbolTable(tmp_path) as store:
+        assert len(store) == 3
+
+
+def test_compaction_cut_short_is_resumed(tmp_path: Path) -> None:
+    with PersistentSymbolTable(tmp_path / "store", compact_threshold=10**9) as store:
+        store.add_many([("sky", "blue"), ("sea", "blue")])
+        store.add_alias("heavens", "sky")
+        with store._lock:
+            store._freeze()
+        # What a crash before the merge leaves on disk.
+        shutil.copytree(tmp_path / "store", tmp_path / "crashed")
+    assert (tmp_path / "crashed" / "facts.log.old").exists()
+
+    with PersistentSymbolTable(tmp_path / "crashed") as store:
+        assert len(store) == 2
+        assert store.aliases() == [("heavens", "sky")]
+        store.add("grass", "green")
+    with PersistentSymbolTable(tmp_path / "crashed") as store:
+        assert not (tmp_path / "crashed" / "facts.log.old").exists()
+        assert sorted(store.subjects("blue")) == ["sea", "sky"]
+        assert store.has("grass", "green")
@@ -0,0 +1,54 @@
+"""Tests for compound statements and the query planner."""
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.parser import Clause, compile_statement
+from aletheia.core.planner import plan
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+def test_compound_statements_evaluate() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([("sky", "blue"), ("grass", "green")])
+
+    assert engine.evaluate("sky is blue and grass is not red.") is True
+    assert engine.evaluate("sky is blue and grass is red.") is False
+    assert engine.evaluate("sky is red or grass is green.") is True
+    assert engine.evaluate("(sky is red or grass is green) and sky is not blue.") is False
+    assert engine.evaluate("sky is red or (grass is green and sky is blue).") is True
+    assert engine.evaluate("(sky is blue.") is False
+
+
+def test_connectives_inside_terms_fall_back_to_one_clause() -> None:
+    assert compile_statement("salt and pepper is tasty.") == Clause("salt and pepper", "is", "tasty")
+
+
+def test_parentheses_inside_terms_fall_back_to_one_clause() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([("f(x)", "y"), ("sky", "blue (light)")])
+    assert compile_statement("f(x) is y.") == Clause("f(x)", "is", "y")
+    assert engine.evaluate("f(x) is y.") is True
+    assert engine.evaluate("sky is blue (light).") is True
+    assert engine.evaluate("sky is not blue (light).") is False
+
+
+def test_planner_runs_deciding_terms_first() -> None:
+    symbols = SymbolTable(InternTable())
+    symbols.add_many([("sky", "blue"), ("sea", "blue"), ("grass", "green")])
+
+    conjunction = compile_statement("sky is blue and unicorn is real.")
+    assert [term for term, _, _ in plan(conjunction, symbols)][0] == Clause("unicorn", "is", "real")
+
+    disjunction = compile_statement("unicorn is real or sky is blue.")
+    assert [term for term, _, _ in plan(disjunction, symbols)][0] == Clause("sky", "is", "blue")
+
+
+def test_sharded_engine_combines_compound_statements() -> None:
+    engine = TruthInferenceEngine(workers=2)
+    try:
+        engine.add_facts([("sky", "blue"), ("grass", "green")])
+        assert engine.evaluate_many(["sky is blue and grass is green.", "sky is red or grass is red."]) == [
+            True,
+            False,
+        ]
+    finally:
+        engine.close()
@@ -0,0 +1,96 @@
+"""Tests for numeric facts, comparisons and range queries."""
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.logic_engine import LogicEngine
+from aletheia.core.parser import Clause, compile_statement, render
+from aletheia.core.persistent_store import PersistentSymbolTable
+from aletheia.core.ranges import RangeIndex
+
+
+def test_comparisons_parse_and_render() -> None:
+    clause = compile_statement("Tower height is not between 100 and 200.")
+    assert clause == Clause("tower height", "is between", "100 and 200", True)
+    assert render(clause) == "tower height is not between 100 and 200."
+    assert compile_statement("tower height is greater than 300.").relation == "is greater than"
+    # Without a number the words stay part of an ordinary object.
+    assert compile_statement("bob is less than happy.") == Clause("bob", "is", "less than happy")
+    assert len(compile_statement("a is between 1 and 2 and b is c.").terms) == 2
+
+
+def test_comparison_statements_use_numeric_facts() -> None:
+    engine = TruthInferenceEngine(verdict_cache_size=8)
+    engine.add_facts([("tower height", "330"), ("tower", "building"), ("tower height", "tall")])
+    assert engine.evaluate("tower height is greater than 300.") is True
+    assert engine.evaluate("tower height is greater than 330.") is False
+    assert engine.evaluate("tower height is at least 330 and tower is building.") is True
+    assert engine.evaluate("tower height is less than 330.") is False
+    assert engine.evaluate("tower height is not between 100 and 200.") is True
+    assert engine.evaluate("tower height is 330.") is True
+    engine.add_fact("tower height", "150")
+    assert engine.evaluate("tower height is between 100 and 200.") is True
+
+
+def test_range_queries_stream_in_value_order_and_resume() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts(
+        [("big ben height", "96"), ("shard height", "310"), ("eiffel tower height", "330"),
+         ("burj khalifa height", "828"), ("sky", "blue")]
+    )
+    assert [(subject, value) for subject, value, _ in engine.iter_range("height", 100, 400)] == [
+        ("shard", 310.0), ("eiffel tower", 330.0)
+    ]
+    page, cursor = engine.range_page("height", limit=2)
+    assert page == [("big ben", 96.0), ("shard", 310.0)]
+    engine.add_fact("tokyo tower height", "333")
+    assert engine.range_page("height", cursor=cursor, limit=5) == (
+        [("eiffel tower", 330.0), ("tokyo tower", 333.0), ("burj khalifa", 828.0)], None
+    )
+    for bad in ["x", "5", '["a", "b", "c"]', "[330, \"shard height\"]"]:
+        with pytest.raises(ValueError):
+            engine.iter_range("height", cursor=bad)
+
+
+def test_range_index_forgets_discarded_facts() -> None:
+    index = RangeIndex()
+    assert index.update([("a height", "1"), ("a height", "2"), ("b height", "3"), ("a", "x")]) == 3
+    assert index.candidates("a height", "is at least", "2") == ["2"]
+    index.discard([("a height", "2"), ("b height", "3")])
+    assert index.candidates("a height", "is at least", "0") == ["1"]
+    assert [subject for _, subject, _, _ in index.scan("height")] == ["a height"]
+
+
+def test_expired_numeric_facts_drop_out_of_ranges() -> None:
+    now = [0.0]
+    engine = LogicEngine(clock=lambda: now[0])
+    engine.add_fact("milk price", "3", ttl=5)
+    assert engine.evaluate("milk price is less than 4.") is True
+    now[0] = 10.0
+    assert engine.evaluate("milk price is less than 4.") is False
+    assert list(engine.iter_range("price")) == []
+    assert len(engine.ranges) == 0
+
+
+def test_range_index_is_built_from_the_store_on_first_use(tmp_path) -> None:
+    reads = []
+
+    def source():
+        reads.append(1)
+        return [("tower height", "330"), ("mast height", "90")]
+
+    index = RangeIndex(source)
+    assert index.add("spire height", "120") is False
+    assert reads == []
+    assert [entry[:2] for entry in index.scan("height")] == [(90.0, "mast height"), (330.0, "tower height")]
+    assert index.add("spire height", "120") is True
+    assert len(index) == 3
+    assert reads == [1]
+
+    with PersistentSymbolTable(tmp_path) as store:
+        store.add_many([("tower height", "330"), ("tower", "building")])
+    with PersistentSymbolTable(tmp_path) as store:
+        engine = LogicEngine(symbols=store)
+        engine.add_fact("mast height", "90")
+        assert engine.evaluate("tower height is greater than 300.") is True
+        assert [entity for entity, _, _ in engine.iter_range("height")] == ["mast", "tower"]
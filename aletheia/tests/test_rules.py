@@ -0,0 +1,100 @@
+"""Tests for the forward-chaining rule engine."""
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.logic_engine import LogicEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.parser import ParseError
+from aletheia.core.rules import Pattern, RuleEngine, parse_rule
+from aletheia.core.symbol_table import InternTable
+
+
+def test_parse_rule_keeps_variables_and_normalizes_constants() -> None:
+    rule = parse_rule("if X is Citizen and X is adult then X is voter.")
+    assert rule.conditions == (Pattern("X", "citizen"), Pattern("X", "adult"))
+    assert rule.conclusion == Pattern("X", "voter")
+    with pytest.raises(ParseError):
+        parse_rule("if X is citizen then Y is voter")
+    with pytest.raises(ParseError):
+        parse_rule("X is citizen")
+
+
+def test_rules_derive_from_existing_and_new_facts() -> None:
+    engine = TruthInferenceEngine(verdict_cache_size=8)
+    engine.add_facts([("ann", "citizen"), ("ann", "adult"), ("bob", "citizen")])
+    assert engine.add_rule("if X is citizen and X is adult then X is voter") == 1
+    assert engine.evaluate("ann is voter.") is True
+    assert engine.evaluate("bob is voter.") is False
+
+    engine.add_fact("bob", "adult")
+    assert engine.evaluate("bob is voter.") is True
+    engine.add_facts([("bob", "adult"), ("cid", "adult")])
+
+    stats = engine.stats()["rules"]
+    assert stats["derived"] == 2
+    firing = stats["firings"]["if X is citizen and X is adult then X is voter"]
+    assert firing["fired"] == 2
+    assert firing["seconds"] >= 0
+
+
+def test_rules_chain_and_join_on_shared_variables() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_rule("if X is voter then X is registered", name="register")
+    engine.add_rule("if X is citizen and X is adult then X is voter")
+    engine.add_rule("if X is parent and Y is child then Y is X", name="lineage")
+    engine.add_facts([("dee", "citizen"), ("dee", "adult")])
+    assert engine.evaluate("dee is registered.") is True
+
+    engine.add_facts([("eve", "parent"), ("fay", "child")])
+    assert engine.evaluate("fay is eve.") is True
+    assert engine.stats()["rules"]["firings"]["register"]["fired"] == 1
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lapsed_premises_no_longer_join() -> None:
+    clock = Clock()
+    engine = LogicEngine(symbols=VersionedSymbolTable(InternTable()), clock=clock)
+    engine.add_rule("if X is adult and X is citizen then X is voter")
+    engine.add_fact("bob", "adult", ttl=5)
+    engine.add_fact("ann", "adult")
+    clock.now = 10
+    engine.add_facts([("bob", "citizen"), ("ann", "citizen")])
+    assert engine.evaluate("bob is voter.") is False
+    assert engine.evaluate("ann is voter.") is True
+
+
+def test_folded_facts_no_longer_join() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_rule("if X is adult and X is citizen then X is voter")
+    engine.add_fact("bobby", "adult")
+    engine.add_alias("bobby", "robert")
+    remembered = {fact for memory in engine.logic.rules._alpha.values() for fact in memory.facts}
+    assert remembered == {("robert", "adult")}
+    engine.add_fact("bobby", "citizen")
+    assert engine.evaluate("robert is voter.") is True
+
+
+def test_retract_drops_partial_matches_further_down() -> None:
+    rules = RuleEngine()
+    rules.add(parse_rule("if X is a and X is b and X is c then X is d"), lambda pattern: ())
+    assert rules.propagate([("x", "a"), ("x", "b")]) == []
+    rules.retract([("x", "b")])
+    assert rules.propagate([("x", "c")]) == []
+    assert rules.propagate([("x", "b")]) == [("x", "d")]
+
+
+def test_seeding_a_rule_is_timed() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([(f"p{i}", "adult") for i in range(200)] + [(f"p{i}", "citizen") for i in range(200)])
+    assert engine.add_rule("if X is adult and X is citizen then X is voter") == 200
+    firings = engine.stats()["rules"]["firings"]["if X is adult and X is citizen then X is voter"]
+    assert firings["fired"] == 200
+    assert firings["seconds"] > 0
@@ -0,0 +1,61 @@
+"""Tests for batch lexical features and linear truth scoring."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aletheia.core.lexicon import PhraseMatcher
+from aletheia.core.scoring import FEATURES, BatchFeatures, LinearModel
+from aletheia.core.truth_detector import DECEPTION_MARKERS, TruthDetector
+
+
+def test_marker_features_agree_with_the_phrase_scanner() -> None:
+    matcher = PhraseMatcher({"new york": 1.0, "york city": 2.0, "city": 0.5, "to be honest": 0.4})
+    texts = [
+        "Visit New York City today.",
+        "new",  # with the next text this would read "new york"
+        "York, to be honest, is a city; a CITY.",
+        "",
+        "nothing here",
+    ]
+    features = BatchFeatures(matcher)(texts)
+    assert features.shape == (len(texts), len(FEATURES))
+    for row, text in zip(features, texts):
+        scan = matcher.scan(text)
+        assert row[FEATURES.index("markers")] == len(scan.matches)
+        assert row[FEATURES.index("marker_weight")] == pytest.approx(scan.weight)
+
+
+def test_hedge_and_negation_ratios() -> None:
+    features = BatchFeatures(PhraseMatcher([]))(["It is maybe not true, isn't it?", "Plain fact."])
+    hedges, negations = FEATURES.index("hedge_ratio"), FEATURES.index("negation_ratio")
+    assert features[0, hedges] == pytest.approx(1 / 8)
+    assert features[0, negations] == pytest.approx(2 / 8)
+    assert features[1, hedges] == features[1, negations] == 0
+
+
+def test_linear_model_from_file(tmp_path) -> None:
+    path = tmp_path / "weights.json"
+    path.write_text(json.dumps({"bias": 1.0, "weights": {"markers": -2.0}}))
+    model = LinearModel.from_file(path)
+    scores = model.score(np.array([[0.0] * len(FEATURES), [1.0] + [0.0] * (len(FEATURES) - 1)]))
+    assert scores == pytest.approx([1 / (1 + np.exp(-1)), 1 / (1 + np.exp(1))])
+
+    path.write_text(json.dumps({"weights": {"sarcasm": 1.0}}))
+    with pytest.raises(ValueError):
+        LinearModel.from_file(path)
+
+
+def test_detect_many_agrees_with_detect_under_default_weights() -> None:
+    detector = TruthDetector()
+    texts = [
+        "The sky is blue.", "Trust me, it is a hoax.", "lie", "", "I believe it.", "It is false.",
+        "To be honest, the sky is blue.", "Allegedly the sky is blue.", "Everyone knows the sky is blue.",
+    ]
+    assert detector.detect_many(texts).tolist() == [detector.detect(text) for text in texts]
+    # The lightest marker alone must already tip the score.
+    lightest = min(DECEPTION_MARKERS, key=DECEPTION_MARKERS.get)
+    assert detector.detect_many([f"The sky is blue, {lightest}."]).tolist() == [False]
+    assert detector.score_many([]).shape == (0,)
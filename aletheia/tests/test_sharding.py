@@ -0,0 +1,68 @@
+"""Tests for the sharded engine."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.sharding import shard_of
+
+
+def test_sharded_engine_matches_single_process(tmp_path: Path) -> None:
+    facts = [(f"entity{i}", f"kind{i % 7}") for i in range(200)]
+    statements = [f"entity{i} is kind{i % 5}." for i in range(200)] + ["entity3 is not kind3.", "junk"]
+
+    single = TruthInferenceEngine()
+    single.add_facts(facts)
+    sharded = TruthInferenceEngine(workers=3)
+    try:
+        assert sharded.add_facts(facts) == 200
+        sharded.add_fact("Sky", "Blue")
+        assert sharded.evaluate_many(statements) == single.evaluate_many(statements)
+        assert sharded.evaluate("sky is blue.") is True
+        sharded.add_fact("tower height", "330")
+        assert sharded.evaluate_many(
+            ["tower height is greater than 300.", "tower height is not between 100 and 200."]
+        ) == [True, True]
+        with pytest.raises(ValueError):
+            sharded.range_page("height")
+
+        assert sharded.save_snapshot(tmp_path / "facts.snap") == 202
+    finally:
+        sharded.close()
+
+
+def test_sharding_is_stable_and_validated() -> None:
+    assert shard_of("sky", 4) == shard_of("sky", 4)
+    with pytest.raises(ValueError):
+        TruthInferenceEngine(workers=2, transitive=True)
+
+
+def test_sharded_compound_statements_and_concurrent_callers() -> None:
+    facts = [(f"entity{i}", f"kind{i % 7}") for i in range(300)]
+    statements = [
+        f"entity{i} is kind{i % 7} and entity{i + 1} is not kind{i % 3}." for i in range(120)
+    ] + [f"entity{i} is kind{i % 4} or entity{i} is kind{i % 7}." for i in range(120)]
+
+    single = TruthInferenceEngine()
+    single.add_facts(facts)
+    sharded = TruthInferenceEngine(workers=3)
+    try:
+        sharded.add_facts(facts)
+        expected = single.evaluate_many(statements)
+        assert sharded.evaluate_many(statements) == expected
+        assert sharded.evaluate_many([]) == []
+        assert sharded.evaluate_many(["entity1 is kind1."]) == [True]
+
+        subjects = sorted(subject for subject, _ in single.iter_subjects("kind2"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            batches = [pool.submit(sharded.evaluate_many, statements) for _ in range(8)]
+            scans = [
+                pool.submit(lambda: sorted(subject for subject, _ in sharded.iter_subjects("kind2")))
+                for _ in range(8)
+            ]
+            assert all(batch.result() == expected for batch in batches)
+            assert all(scan.result() == subjects for scan in scans)
+    finally:
+        sharded.close()
@@ -0,0 +1,63 @@
+"""Tests for engine snapshots."""
+
+from pathlib import Path
+
+import pytest
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.snapshot import SNAPSHOT_VERSION, read_snapshot, write_snapshot
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([("sky", "blue"), ("sky", "vast"), ("sea", "blue"), ("Grüner", "tee")])
+    path = tmp_path / "facts.snap"
+    assert engine.save_snapshot(path) == 4
+
+    restored = TruthInferenceEngine()
+    assert restored.load_snapshot(path) == 4
+    assert restored.evaluate("sky is vast.") is True
+    assert restored.evaluate("grüner is tee.") is True
+
+
+def test_snapshot_streams_in_sections(tmp_path: Path) -> None:
+    path = tmp_path / "facts.snap"
+    facts = [(f"s{i}", f"o{i % 3}") for i in range(10)]
+    write_snapshot(path, facts, chunk_size=4)
+
+    batches = list(read_snapshot(path))
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [fact for batch in batches for fact in batch] == facts
+
+
+def test_corrupted_snapshot_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "facts.snap"
+    write_snapshot(path, [("sky", "blue")])
+    data = bytearray(path.read_bytes())
+    data[-20] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        list(read_snapshot(path))
+
+
+def test_snapshot_versions(tmp_path: Path) -> None:
+    path = tmp_path / "facts.snap"
+    aliased = tmp_path / "aliases.snap"
+    write_snapshot(path, [("sky", "blue")])
+    write_snapshot(aliased, [("nyc", "big")], aliases=[("big apple", "nyc")])
+    data = path.read_bytes()
+    assert data[4:6] == SNAPSHOT_VERSION.to_bytes(2, "little") == b"\x02\x00"
+
+    # Version 1 snapshots, written before aliases, still load.
+    path.write_bytes(data[:4] + b"\x01\x00" + data[6:])
+    assert list(read_snapshot(path)) == [[("sky", "blue")]]
+    # An alias section is not part of version 1.
+    data = aliased.read_bytes()
+    aliased.write_bytes(data[:4] + b"\x01\x00" + data[6:])
+    with pytest.raises(ValueError):
+        list(read_snapshot(aliased))
+
+    path.write_bytes(data[:4] + b"\x03\x00" + data[6:])
+    with pytest.raises(ValueError, match="version 3"):
+        list(read_snapshot(path))
@@ -0,0 +1,63 @@
+"""Tests for the symbol table fact store."""
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.symbol_table import InternTable, SymbolTable
+
+
+def test_symbol_table_keeps_every_value() -> None:
+    table = SymbolTable()
+    assert table.add("sky", "blue") is True
+    assert table.add("sky", "vast") is True
+    assert table.add("sky", "blue") is False
+
+    assert len(table) == 2
+    assert table.has("sky", "blue")
+    assert table.has("sky", "vast")
+    assert sorted(table.objects("sky")) == ["blue", "vast"]
+    assert table.objects("sea") == []
+
+
+def test_symbol_table_reverse_index() -> None:
+    table = SymbolTable()
+    table.add("sky", "blue")
+    table.add("sea", "blue")
+    table.add("grass", "green")
+
+    assert sorted(table.subjects("blue")) == ["sea", "sky"]
+    assert table.subjects("red") == []
+
+
+def test_engine_answers_for_multiple_values() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_fact("sky", "blue")
+    engine.add_fact("sky", "vast")
+
+    assert engine.evaluate("sky is blue.") is True
+    assert engine.evaluate("sky is vast.") is True
+    assert engine.evaluate("sky is not vast.") is False
+
+
+def test_tables_share_interned_ids() -> None:
+    first = SymbolTable()
+    second = SymbolTable()
+    first.add("sky", "blue")
+
+    assert second.id_of("sky") == first.id_of("sky")
+    assert second.intern("blue") == first.id_of("blue")
+    assert not second.has("sky", "blue")
+
+
+def test_postings_grow_from_a_single_value() -> None:
+    table = SymbolTable(InternTable())
+    table.add("sky", "vast")
+    assert table.get("sky") == "vast"
+    table.add("sky", "blue")
+    table.add("sky", "azure")
+
+    assert table.has("sky", "vast")
+    assert table.objects("sky") == ["vast", "blue", "azure"]
+    assert [(fact.name, fact.value) for fact in table.facts()] == [
+        ("sky", "vast"),
+        ("sky", "blue"),
+        ("sky", "azure"),
+    ]
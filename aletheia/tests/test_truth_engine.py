@@ -15,4 +15,27 @@ def test_truth_engine_returns_correct_results() -> None:
 
     # Type safety
     assert isinstance(engine.evaluate("sky is blue."), bool)
-    assert isinstance(engine.evaluate(""), bool)
\ No newline at end of file
+    assert isinstance(engine.evaluate(""), bool)
+
+
+def test_evaluate_many_matches_single_evaluation() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_fact("sky", "blue")
+    statements = ["sky is blue.", "", "sky is green.", "sky is blue.", "sky is not green.", "sky"]
+
+    assert engine.evaluate_many(statements) == [engine.evaluate(s) for s in statements]
+    assert engine.evaluate_many([]) == []
+
+
+def test_verify_document_yields_offsets_across_chunks() -> None:
+    engine = TruthInferenceEngine()
+    engine.add_facts([("sky", "blue"), ("grass", "green")])
+    text = "Sky is blue.  Grass is red?\n\ngrass is green and sky is blue. " * 300
+    pieces = [text[start:start + 1000] for start in range(0, len(text), 1000)]
+
+    verdicts = list(engine.verify_document(pieces, chunk_size=8192))
+    assert len(verdicts) == 900
+    assert [truth for _, _, _, truth in verdicts[:3]] == [True, False, True]
+    for start, end, sentence, _ in verdicts:
+        assert text[start:end] == sentence
+    assert verdicts == list(engine.verify_document(text))
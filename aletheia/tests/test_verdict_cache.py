@@ -0,0 +1,74 @@
+"""Tests for the verdict cache."""
+
+import sys
+import threading
+
+from aletheia.core.inference import TruthInferenceEngine
+from aletheia.core.mvcc import VersionedSymbolTable
+from aletheia.core.verdict_cache import VerdictCache
+
+
+def test_cached_verdicts_follow_writes() -> None:
+    engine = TruthInferenceEngine(verdict_cache_size=8)
+    engine.add_fact("sky", "blue")
+    assert engine.evaluate("sky is blue.") is True
+    assert engine.evaluate("sky is blue.") is True
+    assert engine.evaluate("sky is vast.") is False
+
+    engine.add_fact("grass", "green")
+    assert engine.evaluate("sky is blue.") is True
+    engine.add_facts([("sky", "vast")])
+    assert engine.evaluate("sky is vast.") is True
+
+    stats = engine.stats()["verdicts"]
+    assert stats["hits"] == 2
+    assert stats["stale"] == 1
+
+
+def test_transitive_writes_invalidate_everything() -> None:
+    engine = TruthInferenceEngine(transitive=True, verdict_cache_size=8)
+    engine.add_fact("socrates", "man")
+    assert engine.evaluate("socrates is mortal.") is False
+    engine.add_fact("man", "mortal")
+    assert engine.evaluate("socrates is mortal.") is True
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = VerdictCache(max_size=2)
+    cache.put("a", "x", True)
+    cache.put("b", "y", False)
+    assert cache.get("a", "x") is True
+    cache.put("c", "z", True)
+
+    assert cache.get("b", "y") is None
+    assert cache.get("a", "x") is True
+    assert cache.stats()["evictions"] == 1
+
+
+def test_verdicts_computed_during_a_write_are_not_cached() -> None:
+    engine = TruthInferenceEngine(store=VersionedSymbolTable(), verdict_cache_size=65_536)
+    writes = 2000
+    written = 0
+    done = threading.Event()
+
+    def read() -> None:
+        # Ask about the subjects just ahead of the writer, racing each write.
+        while not done.is_set():
+            for i in range(written, min(written + 8, writes)):
+                engine.evaluate(f"s{i} is blue.")
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for reader in readers:
+            reader.start()
+        for i in range(writes):
+            engine.add_fact(f"s{i}", "blue")
+            written = i + 1
+    finally:
+        done.set()
+        for reader in readers:
+            reader.join()
+        sys.setswitchinterval(interval)
+    assert [i for i in range(writes) if not engine.evaluate(f"s{i} is blue.")] == []